@@ -5,28 +5,205 @@
 2. 크롤링 실행
 3. DB 저장
 4. CSV 저장
+
+3~4단계는 ResultPipeline으로 크롤링과 동시에 마이크로 배치 단위로 진행된다.
+플랫폼 간에는 브라우저/세션/데이터를 공유하지 않으므로,
+parallel=True 이면 플랫폼별로 스레드를 하나씩 띄워 2~4단계를 동시에 실행한다.
 """
 import logging
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
+from django.db import connection
+from crawling_view.models import SongInfo
 from crawling_view.data.song_service import SongService
 from crawling_view.data.db_writer import save_genie_to_db, save_youtube_to_db, save_youtube_music_to_db, save_melon_to_db
 from crawling_view.data.csv_writer import save_genie_csv, save_youtube_csv, save_youtube_music_csv, save_melon_csv
+from crawling_view.data.result_pipeline import ResultPipeline
+from crawling_view.data.run_journal import RunJournal
+from crawling_view.data.crawl_scheduler import CrawlScheduler
+from crawling_view.data.crawl_cadence import CrawlCadence
+from crawling_view.data.dead_letter import DeadLetterService
 from crawling_view.controller.platform_crawlers import create_crawler
+from crawling_view.utils.constants import ParallelSettings
 
 logger = logging.getLogger(__name__)
 
-def run_crawling(target_date=None):
+# 크롤링 실행 순서 (순차 실행 시 이 순서대로 실행)
+PLATFORMS = ['genie', 'youtube_music', 'youtube', 'melon']
+
+PLATFORM_NAMES = {
+    'genie': 'Genie',
+    'youtube_music': 'YouTube Music',
+    'youtube': 'YouTube',
+    'melon': 'Melon',
+}
+
+DB_WRITERS = {
+    'genie': save_genie_to_db,
+    'youtube_music': save_youtube_music_to_db,
+    'youtube': save_youtube_to_db,
+    'melon': save_melon_to_db,
+}
+
+CSV_WRITERS = {
+    'genie': save_genie_csv,
+    'youtube_music': save_youtube_music_csv,
+    'youtube': save_youtube_csv,
+    'melon': save_melon_csv,
+}
+
+def _crawl_and_save_platform(platform, platform_songs, target_date=None, workers=None):
+    """
+    단일 플랫폼 크롤링 → DB 저장 → CSV 저장
+    
+    크롤링 결과는 곡 단위로 파이프라인에 흘려보내 크롤링 도중에 저장된다.
+    DB 저장 시 (곡, 플랫폼, 날짜) 완료 기록이 함께 남아 --resume 실행에 사용된다.
+    재시도 후에도 실패한 곡은 실패 사유와 함께 CrawlingFailure(dead-letter)로 기록된다.
+    
+    Args:
+        platform (str): 플랫폼명
+        platform_songs (list): 해당 플랫폼에서 크롤링 가능한 SongInfo 객체 리스트
+        target_date (date, optional): 크롤링 대상 날짜. None이면 오늘 날짜
+        workers (int, optional): 플랫폼 내부 워커 수. None이면 ParallelSettings 사용
+    
+    Returns:
+        tuple: (crawling_results, db_results, csv_results)
+    """
+    name = PLATFORM_NAMES.get(platform, platform)
+    emoji = '🍈' if platform == 'melon' else '🎵'
+    logger.info(f"{emoji} {name} 크롤링 시작: {len(platform_songs)}개 곡")
+    
+    crawler = create_crawler(platform, workers)
+    crawling_data = SongService.convert_to_crawling_format(platform_songs, platform)
+    
+    # YouTube 저장 함수는 {song_id: result} 형태를 받는다
+    keyed_by = 'song_id' if platform == 'youtube' else None
+    target_date = target_date or date.today()
+    db_writer = partial(DB_WRITERS[platform], target_date=target_date)
+    pipeline = ResultPipeline(platform, db_writer, CSV_WRITERS[platform], keyed_by=keyed_by).start()
+    failures = []
+    try:
+        crawling_results = crawler.crawl_songs(
+            crawling_data,
+            on_result=pipeline.put,
+            on_failure=lambda item, reason: failures.append((item, reason))
+        )
+    finally:
+        # 크롤링이 중간에 실패해도 이미 투입된 결과는 최종 플러시로 저장
+        db_results, csv_results = pipeline.close()
+    logger.info(f"✅ {name} 크롤링 완료: {len(crawling_results)}개 결과")
+    
+    DeadLetterService.record(platform, failures, target_date)
+    DeadLetterService.resolve_completed(platform, target_date)
+    
+    return crawling_results, db_results, csv_results
+
+def _crawl_and_save_platform_in_thread(platform, platform_songs, target_date=None, workers=None):
+    """
+    워커 스레드용 래퍼: 스레드 전용 DB 커넥션을 사용하고 종료 시 정리
+    """
+    try:
+        return _crawl_and_save_platform(platform, platform_songs, target_date, workers)
+    finally:
+        # Django DB 커넥션은 스레드별로 생성되므로 스레드 종료 전에 닫아준다
+        connection.close()
+
+def _platform_error_outcome(error):
+    """
+    크롤링 중 예외로 끝난 플랫폼의 결과 (순차/병렬 실행이 같은 형태로 보고하도록)
+    
+    Args:
+        error (Exception): 플랫폼 크롤링 중 발생한 예외
+    
+    Returns:
+        tuple: (crawling_results, db_results, csv_results). db_results에 오류 상태를 담는다
+    """
+    return [], {'status': 'error', 'message': str(error)}, []
+
+def _run_platforms_sequential(platform_songs_map, target_date=None, workers=None):
+    """
+    플랫폼별 크롤링을 순차 실행
+    
+    Args:
+        platform_songs_map (dict): {platform: [SongInfo, ...]}
+        target_date (date, optional): 크롤링 대상 날짜
+        workers (int, optional): 플랫폼 내부 워커 수
+    
+    Returns:
+        dict: {platform: (crawling_results, db_results, csv_results)}. 실패한 플랫폼은 db_results에 오류 상태
+    """
+    outcomes = {}
+    for platform, platform_songs in platform_songs_map.items():
+        try:
+            outcomes[platform] = _crawl_and_save_platform(platform, platform_songs, target_date, workers)
+        except Exception as e:
+            logger.error(f"❌ {platform} 크롤링 실패: {e}", exc_info=True)
+            outcomes[platform] = _platform_error_outcome(e)
+    return outcomes
+
+def _run_platforms_parallel(platform_songs_map, max_parallel, target_date=None, workers=None):
+    """
+    플랫폼별 크롤링을 스레드 풀로 동시 실행
+    
+    각 플랫폼은 자체 Chrome 드라이버(또는 requests.Session)와 DB 커넥션을 사용한다.
+    한 플랫폼에서 오류가 나도 다른 플랫폼 결과에는 영향을 주지 않는다.
+    
+    Args:
+        platform_songs_map (dict): {platform: [SongInfo, ...]}
+        max_parallel (int): 최대 동시 실행 플랫폼 수
+        target_date (date, optional): 크롤링 대상 날짜
+        workers (int, optional): 플랫폼 내부 워커 수
+    
+    Returns:
+        dict: {platform: (crawling_results, db_results, csv_results)}. 실패한 플랫폼은 db_results에 오류 상태
+    """
+    max_workers = max(1, min(max_parallel, len(platform_songs_map)))
+    logger.info(f"⚡ 플랫폼 병렬 크롤링: {len(platform_songs_map)}개 플랫폼, 최대 동시 실행 {max_workers}개")
+    
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='crawling') as executor:
+        futures = {
+            executor.submit(_crawl_and_save_platform_in_thread, platform, platform_songs, target_date, workers): platform
+            for platform, platform_songs in platform_songs_map.items()
+        }
+        for future in as_completed(futures):
+            platform = futures[future]
+            try:
+                outcomes[platform] = future.result()
+            except Exception as e:
+                logger.error(f"❌ {platform} 병렬 크롤링 실패: {e}", exc_info=True)
+                outcomes[platform] = _platform_error_outcome(e)
+    
+    # 요약 결과는 실행 완료 순서와 관계없이 고정된 플랫폼 순서로 정렬
+    return {platform: outcomes[platform] for platform in platform_songs_map}
+
+def run_crawling(target_date=None, parallel=None, max_parallel=None, resume=False,
+                 platforms=None, workers=None, shard=None, limit=None):
     """
     크롤링 전체 프로세스 실행
-        
+    
     Args:
         target_date (date, optional): 크롤링 대상 날짜. None이면 오늘 날짜
-            
+        parallel (bool, optional): 플랫폼 동시 실행 여부. None이면 ParallelSettings 사용
+        max_parallel (int, optional): 최대 동시 실행 플랫폼 수. None이면 ParallelSettings 사용
+        resume (bool): True이면 같은 날짜에 이미 완료된 (곡, 플랫폼)은 건너뜀
+        platforms (list, optional): 크롤링할 플랫폼 리스트. None이면 전체 플랫폼
+        workers (int, optional): 플랫폼 내부 워커 수. None이면 ParallelSettings 사용
+        shard (tuple, optional): (shard_index, shard_count). SongInfo.id 해시로 곡을 분할
+        limit (int, optional): 크롤링할 최대 곡 수
+    
     Returns:
         dict: 크롤링 결과 요약
     """
     logger.info("🚀 크롤링 프로세스 시작")
-        
+    
+    target_date = target_date or date.today()
+    if parallel is None:
+        parallel = ParallelSettings.PARALLEL_PLATFORMS
+    if max_parallel is None:
+        max_parallel = ParallelSettings.MAX_PARALLEL_PLATFORMS
+    
     try:
         # 1단계: 크롤링 대상 노래 조회
         logger.info("📋 1단계: 크롤링 대상 노래 조회")
@@ -36,109 +213,77 @@ def run_crawling(target_date=None):
             logger.warning("⚠️ 크롤링 대상 노래가 없습니다.")
             return {'status': 'no_songs', 'message': '크롤링 대상 노래가 없습니다.'}
         
-        # 2단계: 플랫폼별 크롤링 실행
-        logger.info("🕷️ 2단계: 플랫폼별 크롤링 실행")
-        crawling_results = {}
+        if shard:
+            active_songs = SongService.shard_songs(active_songs, *shard)
+        if limit:
+            active_songs = active_songs[:limit]
         
-        # Genie 크롤링
-        genie_songs = SongService.get_songs_by_platform(active_songs, 'genie')
-        if genie_songs:
-            logger.info(f"🎵 Genie 크롤링 시작: {len(genie_songs)}개 곡")
-            genie_crawler = create_crawler('genie')
-            genie_data = SongService.convert_to_crawling_format(genie_songs, 'genie')
-            genie_results = genie_crawler.crawl_songs(genie_data)
-            crawling_results['genie'] = genie_results
-            logger.info(f"✅ Genie 크롤링 완료: {len(genie_results)}개 결과")
-        
-        # YouTube Music 크롤링
-        ytmusic_songs = SongService.get_songs_by_platform(active_songs, 'youtube_music')
-        if ytmusic_songs:
-            logger.info(f"🎵 YouTube Music 크롤링 시작: {len(ytmusic_songs)}개 곡")
-            ytmusic_crawler = create_crawler('youtube_music')
-            ytmusic_data = SongService.convert_to_crawling_format(ytmusic_songs, 'youtube_music')
-            ytmusic_results = ytmusic_crawler.crawl_songs(ytmusic_data)
-            crawling_results['youtube_music'] = ytmusic_results
-            logger.info(f"✅ YouTube Music 크롤링 완료: {len(ytmusic_results)}개 결과")
-        
-        # YouTube 크롤링
-        youtube_songs = SongService.get_songs_by_platform(active_songs, 'youtube')
-        if youtube_songs:
-            logger.info(f"🎵 YouTube 크롤링 시작: {len(youtube_songs)}개 곡")
-            youtube_crawler = create_crawler('youtube')
-            youtube_data = SongService.convert_to_crawling_format(youtube_songs, 'youtube')
-            youtube_results = youtube_crawler.crawl_songs(youtube_data)
-            crawling_results['youtube'] = youtube_results
-            logger.info(f"✅ YouTube 크롤링 완료: {len(youtube_results)}개 결과")
-        
-        # Melon 크롤링
-        melon_songs = SongService.get_songs_by_platform(active_songs, 'melon')
-        if melon_songs:
-            logger.info(f"🍈 Melon 크롤링 시작: {len(melon_songs)}개 곡")
-            melon_crawler = create_crawler('melon')
-            melon_data = SongService.convert_to_crawling_format(melon_songs, 'melon')
-            melon_results = melon_crawler.crawl_songs(melon_data)
-            crawling_results['melon'] = melon_results
-            logger.info(f"✅ Melon 크롤링 완료: {len(melon_results)}개 결과")
-        
-        # 3단계: DB 저장
-        logger.info("💾 3단계: DB 저장")
-        db_results = {}
-        
-        if 'genie' in crawling_results:
-            db_results['genie'] = save_genie_to_db(crawling_results['genie'])
-        
-        if 'youtube_music' in crawling_results:
-            db_results['youtube_music'] = save_youtube_music_to_db(crawling_results['youtube_music'])
-        
-        if 'youtube' in crawling_results:
-            db_results['youtube'] = save_youtube_to_db(crawling_results['youtube'])
-        
-        if 'melon' in crawling_results:
-            db_results['melon'] = save_melon_to_db(crawling_results['melon'])
-        
-        # 4단계: CSV 저장
-        logger.info("📄 4단계: CSV 저장")
-        csv_results = {}
+        platform_songs_map = {}
+        skipped_counts = {}
+        cadence_skipped = {}
+        for platform in PLATFORMS:
+            if platforms and platform not in platforms:
+                continue
+            platform_songs = SongService.get_songs_by_platform(active_songs, platform)
+            if resume and platform_songs:
+                pending_songs = RunJournal.filter_pending(platform_songs, platform, target_date)
+                skipped_counts[platform] = len(platform_songs) - len(pending_songs)
+                platform_songs = pending_songs
+            # 변화가 적은 곡은 N일마다만 크롤링
+            platform_songs, cadence_skipped[platform] = CrawlCadence.filter_due(platform_songs, platform, target_date)
+            if platform_songs:
+                # 실행이 중간에 끊겨도 중요한 곡이 먼저 저장되도록 우선순위 순으로 정렬
+                platform_songs_map[platform] = CrawlScheduler.prioritize(platform_songs, platform, target_date)
         
-        if 'genie' in crawling_results:
-            csv_results['genie'] = save_genie_csv(crawling_results['genie'])
-                
-        if 'youtube_music' in crawling_results:
-            csv_results['youtube_music'] = save_youtube_music_csv(crawling_results['youtube_music'])
+        if resume and not platform_songs_map:
+            logger.info("✅ 재개 모드: 모든 플랫폼 크롤링이 이미 완료되었습니다.")
         
-        if 'youtube' in crawling_results:
-            csv_results['youtube'] = save_youtube_csv(crawling_results['youtube'])
+        # 2~4단계: 플랫폼별 크롤링 실행 + DB 저장 + CSV 저장 (스트리밍)
+        logger.info("🕷️ 2단계: 플랫폼별 크롤링 실행 (💾 DB 저장, 📄 CSV 저장 스트리밍)")
+        if parallel and len(platform_songs_map) > 1:
+            outcomes = _run_platforms_parallel(platform_songs_map, max_parallel, target_date, workers)
+        else:
+            outcomes = _run_platforms_sequential(platform_songs_map, target_date, workers)
         
-        if 'melon' in crawling_results:
-            csv_results['melon'] = save_melon_csv(crawling_results['melon'])
+        crawling_results = {platform: outcome[0] for platform, outcome in outcomes.items()}
+        db_results = {platform: outcome[1] for platform, outcome in outcomes.items()}
+        csv_results = {platform: outcome[2] for platform, outcome in outcomes.items()}
         
         # 결과 요약
         summary = {
             'status': 'success',
-            'target_date': target_date or date.today(),
+            'target_date': target_date,
             'total_songs': len(active_songs),
             'crawling_results': crawling_results,
             'db_results': db_results,
-            'csv_results': csv_results
+            'csv_results': csv_results,
+            'cadence_skipped': cadence_skipped
         }
+        if resume:
+            summary['resumed_skipped'] = skipped_counts
+        
+        saved_crawls = sum(cadence_skipped.values())
+        if saved_crawls:
+            logger.info(f"⏭️ 크롤링 주기 조절로 생략: {saved_crawls}건 ({cadence_skipped})")
         
         logger.info("✅ 크롤링 프로세스 완료")
         logger.info(f"📊 결과 요약: {len(active_songs)}개 곡, {len(crawling_results)}개 플랫폼")
         
         return summary
-        
+    
     except Exception as e:
         logger.error(f"❌ 크롤링 프로세스 실패: {e}", exc_info=True)
         return {'status': 'error', 'message': str(e)}
 
-def run_platform_crawling(platform, target_date=None):
+def run_platform_crawling(platform, target_date=None, resume=False):
     """
     특정 플랫폼만 크롤링 실행
     
     Args:
         platform (str): 플랫폼명 ('genie', 'youtube', 'youtube_music', 'melon')
         target_date (date, optional): 크롤링 대상 날짜
-        
+        resume (bool): True이면 같은 날짜에 이미 완료된 곡은 건너뜀
+    
     Returns:
         dict: 크롤링 결과
     """
@@ -148,45 +293,25 @@ def run_platform_crawling(platform, target_date=None):
         # 1단계: 크롤링 대상 노래 조회
         active_songs = SongService.get_active_songs(target_date)
         platform_songs = SongService.get_songs_by_platform(active_songs, platform)
+        if resume and platform_songs:
+            platform_songs = RunJournal.filter_pending(platform_songs, platform, target_date or date.today())
+        platform_songs, cadence_skipped = CrawlCadence.filter_due(platform_songs, platform, target_date)
         
         if not platform_songs:
             logger.warning(f"⚠️ {platform} 크롤링 대상 노래가 없습니다.")
             return {'status': 'no_songs', 'platform': platform}
         
-        # 2단계: 크롤링 실행
-        crawler = create_crawler(platform)
-        crawling_data = SongService.convert_to_crawling_format(platform_songs, platform)
-        crawling_results = crawler.crawl_songs(crawling_data)
-        
-        # 3단계: DB 저장
-        if platform == 'genie':
-            db_results = save_genie_to_db(crawling_results)
-        elif platform == 'youtube_music':
-            db_results = save_youtube_music_to_db(crawling_results)
-        elif platform == 'youtube':
-            db_results = save_youtube_to_db(crawling_results)
-        elif platform == 'melon':
-            db_results = save_melon_to_db(crawling_results)
-        else:
-            db_results = {'error': '지원하지 않는 플랫폼'}
-        
-        # 4단계: CSV 저장
-        if platform == 'genie':
-            csv_results = save_genie_csv(crawling_results)
-        elif platform == 'youtube_music':
-            csv_results = save_youtube_music_csv(crawling_results)
-        elif platform == 'youtube':
-            csv_results = save_youtube_csv(crawling_results)
-        elif platform == 'melon':
-            csv_results = save_melon_csv(crawling_results)
-        else:
-            csv_results = {'error': '지원하지 않는 플랫폼'}
+        platform_songs = CrawlScheduler.prioritize(platform_songs, platform, target_date)
+        
+        # 2~4단계: 크롤링 실행 + DB 저장 + CSV 저장 (스트리밍)
+        crawling_results, db_results, csv_results = _crawl_and_save_platform(platform, platform_songs, target_date)
         
         summary = {
             'status': 'success',
             'platform': platform,
             'target_date': target_date or date.today(),
             'total_songs': len(platform_songs),
+            'cadence_skipped': cadence_skipped,
             'crawling_results': crawling_results,
             'db_results': db_results,
             'csv_results': csv_results
@@ -194,7 +319,64 @@ def run_platform_crawling(platform, target_date=None):
         
         logger.info(f"✅ {platform} 크롤링 완료")
         return summary
-        
+    
     except Exception as e:
         logger.error(f"❌ {platform} 크롤링 실패: {e}", exc_info=True)
-        return {'status': 'error', 'platform': platform, 'message': str(e)} 
\ No newline at end of file
+        return {'status': 'error', 'platform': platform, 'message': str(e)}
+
+def run_dead_letter_crawling(target_date=None, platforms=None, workers=None):
+    """
+    실패 기록(dead-letter)에 남은 곡만 다시 크롤링
+    
+    Args:
+        target_date (date, optional): 실패 기록의 크롤링 대상 날짜. None이면 해결되지 않은 전체 날짜
+        platforms (list, optional): 플랫폼 리스트. None이면 전체 플랫폼
+        workers (int, optional): 플랫폼 내부 워커 수
+    
+    Returns:
+        dict: 크롤링 결과 요약
+    """
+    logger.info("📮 실패 곡 재크롤링 시작")
+    
+    try:
+        failures = DeadLetterService.get_unresolved(target_date, platforms)
+        if not failures:
+            logger.info("✅ 재크롤링할 실패 곡이 없습니다.")
+            return {'status': 'no_songs', 'message': '재크롤링할 실패 곡이 없습니다.'}
+        
+        # (플랫폼, 날짜)별로 묶어서 크롤링
+        groups = {}
+        for failure in failures:
+            groups.setdefault((failure.platform, failure.target_date), []).append(failure.song_id)
+        songs_by_id = {song.id: song for song in SongInfo.objects.filter(id__in={failure.song_id for failure in failures})}
+        
+        crawling_results = {}
+        db_results = {}
+        csv_results = {}
+        resolved_count = 0
+        for (platform, failure_date), song_ids in groups.items():
+            platform_songs = SongService.get_songs_by_platform(
+                [songs_by_id[song_id] for song_id in song_ids if song_id in songs_by_id], platform
+            )
+            if not platform_songs:
+                continue
+            
+            key = f"{platform}:{failure_date}"
+            crawling_results[key], db_results[key], csv_results[key] = _crawl_and_save_platform(
+                platform, platform_songs, failure_date, workers
+            )
+            resolved_count += len(RunJournal.get_completed_song_ids(platform, failure_date) & set(song_ids))
+        
+        logger.info(f"✅ 실패 곡 재크롤링 완료: {len(failures)}개 중 {resolved_count}개 해결")
+        return {
+            'status': 'success',
+            'total_songs': len(failures),
+            'resolved_count': resolved_count,
+            'crawling_results': crawling_results,
+            'db_results': db_results,
+            'csv_results': csv_results
+        }
+    
+    except Exception as e:
+        logger.error(f"❌ 실패 곡 재크롤링 실패: {e}", exc_info=True)
+        return {'status': 'error', 'message': str(e)}
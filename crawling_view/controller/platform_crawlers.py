@@ -3,7 +3,7 @@
 """
 import logging
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable
 
 from crawling_view.view.genie.genie_main import run_genie_crawling
 from crawling_view.view.youtube.youtube_main import run_youtube_crawling
@@ -17,11 +17,12 @@ logger = logging.getLogger(__name__)
 class BasePlatformCrawler:
     """플랫폼 크롤링 기본 클래스"""
     
-    def __init__(self):
+    def __init__(self, workers=None):
         self.platform_name = "base"
+        self.workers = workers  # 플랫폼 내부 워커 수 (None이면 ParallelSettings 사용)
     
-    def crawl_songs(self, song_data: List[Dict]) -> List[Dict]:
-        """크롤링 실행"""
+    def crawl_songs(self, song_data: List[Dict], on_result: Callable = None, on_failure: Callable = None) -> List[Dict]:
+        """크롤링 실행 (on_result: 곡별 결과 콜백, on_failure: 최종 실패 곡 콜백)"""
         raise NotImplementedError
     
     def _log_start(self, song_count: int):
@@ -36,11 +37,11 @@ class BasePlatformCrawler:
 class GenieCrawler(BasePlatformCrawler):
     """Genie 크롤링 클래스"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, workers=None):
+        super().__init__(workers)
         self.platform_name = "genie"
     
-    def crawl_songs(self, song_data: List[Dict]) -> List[Dict]:
+    def crawl_songs(self, song_data: List[Dict], on_result: Callable = None, on_failure: Callable = None) -> List[Dict]:
         """Genie 크롤링 실행"""
         if not song_data:
             logger.warning("⚠️ Genie 크롤링 대상 곡이 없습니다.")
@@ -50,7 +51,7 @@ class GenieCrawler(BasePlatformCrawler):
         start_time = time.time()
         
         # 크롤링 실행 (CSV, DB 저장은 분리)
-        crawling_results = run_genie_crawling(song_data, save_csv=False, save_db=False)
+        crawling_results = run_genie_crawling(song_data, save_csv=False, save_db=False, workers=self.workers, on_result=on_result, on_failure=on_failure)
         
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -63,11 +64,11 @@ class GenieCrawler(BasePlatformCrawler):
 class YouTubeMusicCrawler(BasePlatformCrawler):
     """YouTube Music 크롤링 클래스"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, workers=None):
+        super().__init__(workers)
         self.platform_name = "youtube_music"
     
-    def crawl_songs(self, song_data: List[Dict]) -> List[Dict]:
+    def crawl_songs(self, song_data: List[Dict], on_result: Callable = None, on_failure: Callable = None) -> List[Dict]:
         """YouTube Music 크롤링 실행"""
         if not song_data:
             logger.warning("⚠️ YouTube Music 크롤링 대상 곡이 없습니다.")
@@ -80,7 +81,10 @@ class YouTubeMusicCrawler(BasePlatformCrawler):
         crawling_results = run_youtube_music_crawling(
             song_data, 
             save_csv=False, 
-            save_db=False
+            save_db=False,
+            workers=self.workers,
+            on_result=on_result,
+            on_failure=on_failure
         )
         
         end_time = time.time()
@@ -94,11 +98,11 @@ class YouTubeMusicCrawler(BasePlatformCrawler):
 class YouTubeCrawler(BasePlatformCrawler):
     """YouTube 크롤링 클래스"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, workers=None):
+        super().__init__(workers)
         self.platform_name = "youtube"
     
-    def crawl_songs(self, song_data: List[tuple]) -> Dict[str, Dict]:
+    def crawl_songs(self, song_data: List[tuple], on_result: Callable = None, on_failure: Callable = None) -> Dict[str, Dict]:
         """YouTube 크롤링 실행"""
         if not song_data:
             logger.warning("⚠️ YouTube 크롤링 대상 곡이 없습니다.")
@@ -108,7 +112,7 @@ class YouTubeCrawler(BasePlatformCrawler):
         start_time = time.time()
         
         # 크롤링 실행 (CSV, DB 저장은 분리)
-        crawling_results = run_youtube_crawling(song_data, save_csv=False, save_db=False)
+        crawling_results = run_youtube_crawling(song_data, save_csv=False, save_db=False, workers=self.workers, on_result=on_result, on_failure=on_failure)
         
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -120,11 +124,11 @@ class YouTubeCrawler(BasePlatformCrawler):
 class MelonCrawler(BasePlatformCrawler):
     """Melon 크롤링 클래스"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, workers=None):
+        super().__init__(workers)
         self.platform_name = "melon"
     
-    def crawl_songs(self, song_data: List[Dict]) -> List[Dict]:
+    def crawl_songs(self, song_data: List[Dict], on_result: Callable = None, on_failure: Callable = None) -> List[Dict]:
         """Melon 크롤링 실행"""
         if not song_data:
             logger.warning("⚠️ Melon 크롤링 대상 곡이 없습니다.")
@@ -134,7 +138,7 @@ class MelonCrawler(BasePlatformCrawler):
         start_time = time.time()
         
         # 크롤링 실행 (CSV, DB 저장은 분리)
-        crawling_results = run_melon_crawling(song_data, save_csv=False, save_db=False)
+        crawling_results = run_melon_crawling(song_data, save_csv=False, save_db=False, workers=self.workers, on_result=on_result, on_failure=on_failure)
         
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -144,24 +148,25 @@ class MelonCrawler(BasePlatformCrawler):
         return crawling_results
 
 
-def create_crawler(platform: str):
+def create_crawler(platform: str, workers: int = None):
     """
     플랫폼별 크롤러 생성
     
     Args:
         platform: 플랫폼명 ('genie', 'youtube_music', 'youtube', 'melon')
+        workers: 플랫폼 내부 워커 수 (None이면 ParallelSettings 사용)
         
     Returns:
         BasePlatformCrawler: 해당 플랫폼의 크롤러
     """
     if platform == 'genie':
-        return GenieCrawler()
+        return GenieCrawler(workers)
     elif platform == 'youtube_music':
-        return YouTubeMusicCrawler()
+        return YouTubeMusicCrawler(workers)
     elif platform == 'youtube':
-        return YouTubeCrawler()
+        return YouTubeCrawler(workers)
     elif platform == 'melon':
-        return MelonCrawler()
+        return MelonCrawler(workers)
     else:
         raise ValueError(f"지원하지 않는 플랫폼: {platform}")
 
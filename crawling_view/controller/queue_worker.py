@@ -0,0 +1,137 @@
+"""
+DB 작업 큐 기반 크롤링 워커
+
+여러 호스트에서 같은 날짜로 실행하면 crawl_task 테이블의 작업을 나눠 처리한다.
+1. (한 곳에서) CrawlTaskQueue.enqueue 로 작업 생성
+2. (각 호스트에서) run_queue_worker 실행 → 작업 임대 → 크롤링/저장 → 완료/실패 처리
+"""
+import logging
+import os
+import socket
+import time
+from datetime import date
+from crawling_view.models import SongInfo
+from crawling_view.data.song_service import SongService
+from crawling_view.data.run_journal import RunJournal
+from crawling_view.data.task_queue import CrawlTaskQueue
+from crawling_view.controller.crawling_manager import PLATFORMS, _crawl_and_save_platform
+from crawling_view.utils.constants import TaskQueueSettings
+
+logger = logging.getLogger(__name__)
+
+def default_worker_id():
+    """호스트명-PID 형태의 워커 ID"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+def _process_tasks(platform, tasks, target_date, worker_id):
+    """
+    임대한 작업 배치 처리
+    
+    저장 성공 여부는 CrawlingData와 같은 트랜잭션으로 기록되는 완료 기록(CrawlingJournal)으로 판단한다.
+    
+    Args:
+        platform (str): 플랫폼명
+        tasks (list): 임대한 CrawlTask 리스트
+        target_date (date): 크롤링 대상 날짜
+        worker_id (str): 워커 ID
+    
+    Returns:
+        dict: {'done': 완료 수, 'retry': 재시도 대기 수, 'failed': 최종 실패 수}
+    """
+    task_by_song = {task.song_id: task for task in tasks}
+    songs = SongService.get_songs_by_platform(
+        list(SongInfo.objects.filter(id__in=task_by_song.keys())), platform
+    )
+    songs.sort(key=lambda song: task_by_song[song.id].priority, reverse=True)
+    
+    error = None
+    if songs:
+        try:
+            _crawl_and_save_platform(platform, songs, target_date)
+        except Exception as e:
+            logger.error(f"❌ {platform} 작업 배치 크롤링 실패: {e}", exc_info=True)
+            error = str(e)
+    
+    completed_song_ids = RunJournal.get_completed_song_ids(platform, target_date)
+    done_ids = [task.id for song_id, task in task_by_song.items() if song_id in completed_song_ids]
+    failed_ids = [task.id for song_id, task in task_by_song.items() if song_id not in completed_song_ids]
+    
+    done_count = CrawlTaskQueue.complete(done_ids, worker_id)
+    fail_counts = CrawlTaskQueue.fail(failed_ids, worker_id, error or '크롤링 결과 없음')
+    return {'done': done_count, **fail_counts}
+
+def run_queue_worker(platforms=None, target_date=None, worker_id=None, batch_size=None, lease_seconds=None):
+    """
+    작업 큐가 빌 때까지 작업을 임대해 크롤링
+    
+    다른 워커가 처리 중인 작업이 남아 있으면 임대 만료(죽은 워커)에 대비해
+    POLL_INTERVAL 간격으로 다시 확인하고, 모든 작업이 끝나면 종료한다.
+    
+    Args:
+        platforms (list, optional): 처리할 플랫폼 리스트. None이면 전체 플랫폼
+        target_date (date, optional): 크롤링 대상 날짜. None이면 오늘 날짜
+        worker_id (str, optional): 워커 ID. None이면 호스트명-PID
+        batch_size (int, optional): 한 번에 임대할 작업 수
+        lease_seconds (int, optional): 임대 유지 시간(초)
+    
+    Returns:
+        dict: 워커 처리 결과 요약
+    """
+    platforms = platforms or PLATFORMS
+    target_date = target_date or date.today()
+    worker_id = worker_id or default_worker_id()
+    totals = {'done': 0, 'retry': 0, 'failed': 0}
+    
+    logger.info(f"👷 큐 워커 시작: {worker_id} ({', '.join(platforms)}, {target_date})")
+    
+    while True:
+        claimed_any = False
+        for platform in platforms:
+            tasks = CrawlTaskQueue.claim(platform, worker_id, target_date, batch_size, lease_seconds)
+            if not tasks:
+                continue
+            
+            claimed_any = True
+            counts = _process_tasks(platform, tasks, target_date, worker_id)
+            for key, value in counts.items():
+                totals[key] += value
+            logger.info(f"📊 {platform} 배치 처리: 완료 {counts['done']}개, 재시도 대기 {counts['retry']}개, 실패 {counts['failed']}개")
+        
+        if claimed_any:
+            continue
+        if not CrawlTaskQueue.has_active_leases(platforms, target_date):
+            break
+        
+        logger.info(f"⏳ 다른 워커 작업 대기 중... ({TaskQueueSettings.POLL_INTERVAL}초 후 재확인)")
+        time.sleep(TaskQueueSettings.POLL_INTERVAL)
+    
+    logger.info(f"✅ 큐 워커 종료: {worker_id} - 완료 {totals['done']}개, 실패 {totals['failed']}개")
+    return {
+        'status': 'success',
+        'worker_id': worker_id,
+        'target_date': target_date,
+        'task_results': totals,
+        'queue_status': CrawlTaskQueue.get_status_counts(target_date)
+    }
+
+def log_queue_status(target_date=None):
+    """
+    플랫폼별 작업 상태 로그 출력
+    
+    Args:
+        target_date (date, optional): 크롤링 대상 날짜
+    
+    Returns:
+        dict: {platform: {status: count}}
+    """
+    target_date = target_date or date.today()
+    counts = CrawlTaskQueue.get_status_counts(target_date)
+    
+    logger.info(f"📋 작업 큐 상태: {target_date}")
+    if not counts:
+        logger.info("   생성된 작업이 없습니다.")
+    for platform, status_counts in counts.items():
+        total = sum(status_counts.values())
+        detail = ', '.join(f"{status} {count}" for status, count in status_counts.items())
+        logger.info(f"   {platform}: 총 {total}개 ({detail})")
+    return counts
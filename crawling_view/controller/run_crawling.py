@@ -14,27 +14,55 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
-from crawling_view.controller.crawling_manager import run_crawling, run_platform_crawling
+from crawling_view.controller.crawling_manager import run_crawling, run_platform_crawling, run_dead_letter_crawling
+from crawling_view.controller.queue_worker import run_queue_worker, log_queue_status
+from crawling_view.data.task_queue import CrawlTaskQueue
+from crawling_view.utils.constants import FilePaths
+from crawling_view.utils.launch_profile import apply_launch_profile_args
 from crawling_view.data.song_service import SongService
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'logs/crawling_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
-def run_full_crawling(target_date=None):
+def setup_logging(log_dir=None):
+    """
+    로깅 설정 (파일 + 콘솔)
+    
+    Args:
+        log_dir (str, optional): 로그 파일 디렉토리. None이면 FilePaths.LOG_DIR
+    
+    Returns:
+        str: 생성된 로그 파일 경로
+    """
+    log_dir = log_dir or FilePaths.LOG_DIR
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, f'crawling_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_path, encoding='utf-8'),
+            logging.StreamHandler()
+        ],
+        force=True
+    )
+    return log_path
+
+def run_full_crawling(target_date=None, parallel=None, max_parallel=None, resume=False,
+                      platforms=None, workers=None, shard=None, limit=None):
     """
     전체 크롤링 프로세스 실행 (운영용)
     
     Args:
         target_date (date, optional): 크롤링 대상 날짜. None이면 오늘 날짜
-        
+        parallel (bool, optional): 플랫폼 동시 실행 여부
+        max_parallel (int, optional): 최대 동시 실행 플랫폼 수
+        resume (bool): 이미 완료된 (곡, 플랫폼)을 건너뛰고 이어서 실행
+        platforms (list, optional): 크롤링할 플랫폼 리스트. None이면 전체 플랫폼
+        workers (int, optional): 플랫폼 내부 워커 수
+        shard (tuple, optional): (shard_index, shard_count)
+        limit (int, optional): 크롤링할 최대 곡 수
+    
     Returns:
         dict: 상세한 크롤링 결과
     """
@@ -47,7 +75,8 @@ def run_full_crawling(target_date=None):
     
     try:
         # 크롤링 실행
-        result = run_crawling(target_date)
+        result = run_crawling(target_date, parallel=parallel, max_parallel=max_parallel, resume=resume,
+                              platforms=platforms, workers=workers, shard=shard, limit=limit)
         
         # 실행 시간 계산
         end_time = time.time()
@@ -61,7 +90,7 @@ def run_full_crawling(target_date=None):
         log_detailed_results(analysis)
         
         return analysis
-        
+    
     except Exception as e:
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -88,7 +117,7 @@ def analyze_crawling_result(result, elapsed_time, start_datetime, end_datetime):
         elapsed_time (float): 실행 시간 (초)
         start_datetime (datetime): 시작 시간
         end_datetime (datetime): 종료 시간
-        
+    
     Returns:
         dict: 분석된 결과
     """
@@ -99,6 +128,7 @@ def analyze_crawling_result(result, elapsed_time, start_datetime, end_datetime):
         'elapsed_time': elapsed_time,
         'target_date': result.get('target_date'),
         'total_songs': result.get('total_songs', 0),
+        'cadence_skipped': result.get('cadence_skipped', {}),
         'platforms': {},
         'summary': {}
     }
@@ -139,7 +169,10 @@ def analyze_crawling_result(result, elapsed_time, start_datetime, end_datetime):
             # DB 저장 결과 분석
             if platform in db_results:
                 db_result = db_results[platform]
-                if isinstance(db_result, dict):
+                if isinstance(db_result, dict) and db_result.get('status') == 'error':
+                    platform_data['status'] = 'error'
+                    platform_data['error'] = db_result.get('message')
+                elif isinstance(db_result, dict):
                     platform_data['db_saved'] = db_result.get('saved_count', 0)
                     platform_data['db_failed'] = db_result.get('failed_count', 0)
                     platform_data['db_skipped'] = db_result.get('skipped_count', 0)
@@ -186,6 +219,9 @@ def log_detailed_results(analysis):
     
     if analysis['status'] == 'success':
         logger.info(f"🎵 전체 대상 곡: {analysis['total_songs']}개")
+        cadence_skipped = sum(analysis.get('cadence_skipped', {}).values())
+        if cadence_skipped:
+            logger.info(f"⏭️ 크롤링 주기 조절로 생략한 크롤링: {cadence_skipped}건")
         
         # 플랫폼별 결과
         logger.info("\n📈 플랫폼별 상세 결과:")
@@ -197,6 +233,8 @@ def log_detailed_results(analysis):
             logger.info(f"   크롤링: {data['crawled_count']}개")
             logger.info(f"   DB 저장: {data['db_saved']}개 성공, {data['db_failed']}개 실패, {data['db_skipped']}개 스킵")
             logger.info(f"   CSV 저장: {data['csv_saved']}개 파일")
+            if data.get('error'):
+                logger.info(f"   오류: {data['error']}")
         
         # 전체 요약
         summary = analysis['summary']
@@ -221,14 +259,15 @@ def log_detailed_results(analysis):
     
     logger.info("=" * 80)
 
-def run_single_platform_crawling(platform, target_date=None):
+def run_single_platform_crawling(platform, target_date=None, resume=False):
     """
     단일 플랫폼 크롤링 실행
     
     Args:
         platform (str): 플랫폼명 ('genie', 'youtube', 'youtube_music', 'melon')
         target_date (date, optional): 크롤링 대상 날짜
-        
+        resume (bool): 이미 완료된 곡을 건너뛰고 이어서 실행
+    
     Returns:
         dict: 크롤링 결과
     """
@@ -240,7 +279,7 @@ def run_single_platform_crawling(platform, target_date=None):
     logger.info(f"⏰ 시작 시간: {start_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
     
     try:
-        result = run_platform_crawling(platform, target_date)
+        result = run_platform_crawling(platform, target_date, resume=resume)
         
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -261,7 +300,7 @@ def run_single_platform_crawling(platform, target_date=None):
                 logger.info(f"📄 CSV 저장: {len(csv_result)}개 파일")
         
         return result
-        
+    
     except Exception as e:
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -278,8 +317,31 @@ if __name__ == "__main__":
     parser.add_argument('--platform', choices=['genie', 'youtube', 'youtube_music', 'melon'], 
                        help='특정 플랫폼만 크롤링')
     parser.add_argument('--date', type=str, help='크롤링 대상 날짜 (YYYY-MM-DD 형식)')
+    parser.add_argument('--parallel', action='store_true', default=None,
+                       help='플랫폼별 크롤링을 동시에 실행')
+    parser.add_argument('--max-parallel', type=int, help='최대 동시 실행 플랫폼 수')
+    parser.add_argument('--resume', action='store_true',
+                       help='같은 날짜에 이미 완료된 곡은 건너뛰고 이어서 크롤링')
+    parser.add_argument('--dead-letters', action='store_true',
+                       help='재시도 후에도 실패해 기록된 곡만 다시 크롤링 (--date 지정 시 해당 날짜만)')
+    
+    # 분산 작업 큐 (여러 호스트에서 같은 날짜 작업을 나눠 처리)
+    parser.add_argument('--enqueue', action='store_true', help='크롤링 작업을 DB 작업 큐에 생성')
+    parser.add_argument('--queue-worker', action='store_true', help='DB 작업 큐에서 작업을 임대해 크롤링')
+    parser.add_argument('--queue-status', action='store_true', help='DB 작업 큐의 플랫폼별 상태 출력')
+    parser.add_argument('--worker-id', type=str, help='큐 워커 ID (기본값: 호스트명-PID)')
+    parser.add_argument('--log-dir', type=str, help=f'로그 파일 디렉토리 (기본값: {FilePaths.LOG_DIR})')
+    parser.add_argument('--launch-profile', nargs='+', metavar='[PLATFORM=]PROFILE',
+                       help='Chrome 실행 프로필 (예: headless-lowmem, youtube_music=default)')
     
     args = parser.parse_args()
+    setup_logging(args.log_dir)
+    
+    try:
+        apply_launch_profile_args(args.launch_profile)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        sys.exit(1)
     
     # 날짜 파싱
     target_date = None
@@ -291,12 +353,24 @@ if __name__ == "__main__":
             sys.exit(1)
     
     # 크롤링 실행
-    if args.platform:
+    platforms = [args.platform] if args.platform else None
+    if args.enqueue or args.queue_status:
+        if args.enqueue:
+            CrawlTaskQueue.enqueue(target_date, platforms)
+        log_queue_status(target_date)
+        result = {'status': 'success'}
+    elif args.queue_worker:
+        result = run_queue_worker(platforms, target_date, worker_id=args.worker_id)
+    elif args.dead_letters:
+        # 실패 기록된 곡 재크롤링
+        result = run_dead_letter_crawling(target_date, platforms)
+    elif args.platform:
         # 단일 플랫폼 크롤링
-        result = run_single_platform_crawling(args.platform, target_date)
+        result = run_single_platform_crawling(args.platform, target_date, resume=args.resume)
     else:
         # 전체 크롤링
-        result = run_full_crawling(target_date)
+        result = run_full_crawling(target_date, parallel=args.parallel, max_parallel=args.max_parallel,
+                                   resume=args.resume)
     
     # 종료 코드 설정
     if result.get('status') == 'success':
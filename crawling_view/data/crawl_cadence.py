@@ -0,0 +1,81 @@
+"""
+곡별 크롤링 주기 조절 (변화가 적은 곡은 N일마다 크롤링)
+
+하루 조회수 증가율이 MIN_DAILY_GROWTH 미만인 곡은 누적 변화가 그 정도 쌓이는 간격
+(MIN_DAILY_GROWTH / 증가율 일, 최대 MAX_GAP_DAYS)마다만 크롤링한다.
+이력이 부족하거나 마지막 성공 이후 간격이 찬 곡은 항상 크롤링 대상이다.
+"""
+import math
+from datetime import date
+from django.utils import timezone
+from crawling_view.data.crawl_history import CrawlHistory
+from crawling_view.utils.constants import CadenceSettings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlCadence:
+    """
+    크롤링 주기 판단
+    """
+    
+    @staticmethod
+    def get_interval_days(growth_rate):
+        """
+        하루 증가율로 크롤링 간격(일) 계산
+        
+        Args:
+            growth_rate (float): 하루 조회수 증가율 (0.001 = 0.1%)
+        
+        Returns:
+            int: 크롤링 간격 (1이면 매일)
+        """
+        if growth_rate >= CadenceSettings.MIN_DAILY_GROWTH:
+            return 1
+        if growth_rate <= 0:
+            return CadenceSettings.MAX_GAP_DAYS
+        return max(1, min(CadenceSettings.MAX_GAP_DAYS, math.floor(CadenceSettings.MIN_DAILY_GROWTH / growth_rate)))
+    
+    @staticmethod
+    def filter_due(songs, platform, target_date=None):
+        """
+        오늘 크롤링해야 하는 곡만 남김
+        
+        Args:
+            songs (list): SongInfo 객체 리스트
+            platform (str): 플랫폼명
+            target_date (date, optional): 크롤링 대상 날짜. None이면 오늘 날짜
+        
+        Returns:
+            tuple: (크롤링 대상 SongInfo 리스트, 생략된 곡 수)
+        """
+        if not CadenceSettings.ENABLED or platform not in CadenceSettings.PLATFORMS or not songs:
+            return list(songs), 0
+        if target_date is None:
+            target_date = date.today()
+        
+        try:
+            history = CrawlHistory.get_platform_history(
+                [song.id for song in songs], platform, CadenceSettings.HISTORY_DAYS
+            )
+        except Exception as e:
+            # 주기 판단 실패 시 전체 크롤링
+            logger.warning(f"⚠️ {platform} 크롤링 주기 판단 실패, 전체 크롤링: {e}")
+            return list(songs), 0
+        
+        due_songs = []
+        for song in songs:
+            stats = history.get(song.id)
+            if not stats or stats['history_days'] < CadenceSettings.MIN_HISTORY_DAYS:
+                due_songs.append(song)
+                continue
+            
+            days_since = (target_date - timezone.localtime(stats['last_crawled_at']).date()).days
+            if days_since >= CrawlCadence.get_interval_days(stats['growth_rate']):
+                due_songs.append(song)
+        
+        skipped_count = len(songs) - len(due_songs)
+        if skipped_count:
+            logger.info(f"⏭️ {platform} 크롤링 주기 조절: {skipped_count}개 생략, {len(due_songs)}개 크롤링")
+        return due_songs, skipped_count
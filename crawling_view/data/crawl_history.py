@@ -0,0 +1,87 @@
+"""
+곡별 크롤링 이력 조회 서비스
+"""
+from datetime import timedelta
+from django.utils import timezone
+from crawling_view.models import CrawlingData
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlHistory:
+    """
+    CrawlingData 이력 기반 곡별 통계 (마지막 성공 시각, 조회수 증가율)
+    """
+    
+    @staticmethod
+    def get_platform_history(song_ids, platform, days=7):
+        """
+        플랫폼별 곡 이력 통계 조회
+        
+        정상 조회수(0 이상)가 저장된 행만 성공으로 본다.
+        
+        Args:
+            song_ids (list): song_id 리스트
+            platform (str): 플랫폼명
+            days (int): 증가율 계산에 사용하는 최근 기간(일)
+        
+        Returns:
+            dict: {song_id: {'last_crawled_at': datetime, 'latest_views': int, 'views_per_day': float,
+                             'growth_rate': float, 'history_days': float}}
+                  이력이 없는 곡은 포함되지 않음
+        """
+        if not song_ids:
+            return {}
+        
+        since = timezone.now() - timedelta(days=days)
+        rows = (
+            CrawlingData.objects.filter(
+                song_id__in=song_ids,
+                platform=platform,
+                views__gte=0,
+                created_at__gte=since
+            )
+            .order_by('song_id', 'created_at')
+            .values_list('song_id', 'views', 'created_at')
+        )
+        
+        first_rows = {}
+        last_rows = {}
+        for song_id, views, created_at in rows:
+            first_rows.setdefault(song_id, (views, created_at))
+            last_rows[song_id] = (views, created_at)
+        
+        history = {}
+        for song_id, (last_views, last_at) in last_rows.items():
+            first_views, first_at = first_rows[song_id]
+            elapsed_days = (last_at - first_at).total_seconds() / 86400
+            views_per_day = (last_views - first_views) / elapsed_days if elapsed_days > 0 else 0.0
+            history[song_id] = {
+                'last_crawled_at': last_at,
+                'latest_views': last_views,
+                'views_per_day': max(0.0, views_per_day),
+                # 곡 규모와 무관하게 비교할 수 있도록 하루 증가량을 누적 조회수 대비 비율로 환산
+                'growth_rate': max(0.0, views_per_day) / max(first_views, 1),
+                'history_days': elapsed_days,
+            }
+        
+        # 최근 기간 밖에 마지막 성공이 있는 곡은 마지막 성공 시각만 채움
+        missing_ids = [song_id for song_id in song_ids if song_id not in history]
+        if missing_ids:
+            older_rows = (
+                CrawlingData.objects.filter(song_id__in=missing_ids, platform=platform, views__gte=0)
+                .order_by('song_id', '-created_at')
+                .values_list('song_id', 'views', 'created_at')
+            )
+            for song_id, views, created_at in older_rows:
+                if song_id not in history:
+                    history[song_id] = {
+                        'last_crawled_at': created_at,
+                        'latest_views': views,
+                        'views_per_day': 0.0,
+                        'growth_rate': 0.0,
+                        'history_days': 0.0,
+                    }
+        
+        return history
@@ -0,0 +1,111 @@
+"""
+플랫폼별 크롤링 순서 결정 (우선순위 스케줄러)
+
+실행이 중간에 끊겨도 중요한 곡부터 저장되도록 곡 목록을 점수 순으로 정렬한다.
+- 오래 갱신되지 않은 곡 (마지막 성공 CrawlingData 이후 경과 시간)
+- 최근 조회수 증가율이 높은 곡
+- CrawlingPeriod.end_date 가 임박한 곡
+"""
+from datetime import date
+from django.db.models import Max
+from django.utils import timezone
+from crawling_view.models import CrawlingPeriod
+from crawling_view.data.crawl_history import CrawlHistory
+from crawling_view.utils.constants import SchedulerSettings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlScheduler:
+    """
+    곡별 우선순위 점수 계산 및 정렬
+    """
+    
+    @staticmethod
+    def get_priorities(songs, platform, target_date=None):
+        """
+        곡별 우선순위 점수 계산 (0~1, 높을수록 먼저 크롤링)
+        
+        Args:
+            songs (list): SongInfo 객체 리스트
+            platform (str): 플랫폼명
+            target_date (date, optional): 크롤링 대상 날짜. None이면 오늘 날짜
+        
+        Returns:
+            dict: {song_id: score}
+        """
+        if not songs:
+            return {}
+        if target_date is None:
+            target_date = date.today()
+        
+        song_ids = [song.id for song in songs]
+        history = CrawlHistory.get_platform_history(song_ids, platform, SchedulerSettings.HISTORY_DAYS)
+        end_dates = dict(
+            CrawlingPeriod.objects.filter(
+                song_id__in=song_ids,
+                is_active=True,
+                start_date__lte=target_date,
+                end_date__gte=target_date
+            )
+            .order_by()
+            .values('song_id')
+            .annotate(end_date=Max('end_date'))
+            .values_list('song_id', 'end_date')
+        )
+        
+        now = timezone.now()
+        cap_days = max(SchedulerSettings.STALENESS_CAP_DAYS, 0.01)
+        max_growth = max((stats['growth_rate'] for stats in history.values()), default=0.0)
+        
+        priorities = {}
+        for song_id in song_ids:
+            stats = history.get(song_id)
+            
+            # 한 번도 성공한 적 없는 곡은 가장 오래된 것으로 취급
+            if stats:
+                stale_days = (now - stats['last_crawled_at']).total_seconds() / 86400
+                staleness = min(stale_days, cap_days) / cap_days
+                velocity = stats['growth_rate'] / max_growth if max_growth > 0 else 0.0
+            else:
+                staleness = 1.0
+                velocity = 0.0
+            
+            end_date = end_dates.get(song_id)
+            deadline = 1.0 / (1 + (end_date - target_date).days) if end_date else 0.0
+            
+            priorities[song_id] = (
+                SchedulerSettings.STALENESS_WEIGHT * staleness
+                + SchedulerSettings.VELOCITY_WEIGHT * velocity
+                + SchedulerSettings.DEADLINE_WEIGHT * deadline
+            )
+        
+        return priorities
+    
+    @staticmethod
+    def prioritize(songs, platform, target_date=None):
+        """
+        곡 목록을 우선순위 높은 순으로 정렬 (SchedulerSettings.ENABLED=False 이면 그대로 반환)
+        
+        Args:
+            songs (list): SongInfo 객체 리스트
+            platform (str): 플랫폼명
+            target_date (date, optional): 크롤링 대상 날짜
+        
+        Returns:
+            list: 정렬된 SongInfo 객체 리스트
+        """
+        if not SchedulerSettings.ENABLED or len(songs) < 2:
+            return list(songs)
+        
+        try:
+            priorities = CrawlScheduler.get_priorities(songs, platform, target_date)
+        except Exception as e:
+            # 우선순위 계산 실패는 크롤링 자체를 막지 않음
+            logger.warning(f"⚠️ {platform} 우선순위 계산 실패, 기존 순서로 진행: {e}")
+            return list(songs)
+        
+        ordered = sorted(songs, key=lambda song: priorities.get(song.id, 0.0), reverse=True)
+        logger.info(f"📌 {platform} 우선순위 정렬: {len(ordered)}개 곡 (최고 {priorities[ordered[0].id]:.2f}, 최저 {priorities[ordered[-1].id]:.2f})")
+        return ordered
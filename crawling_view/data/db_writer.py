@@ -2,7 +2,7 @@
 DB 저장 관련 함수들
 """
 from django.db import transaction
-from crawling_view.models import SongInfo, CrawlingData, PlatformType
+from crawling_view.models import SongInfo, CrawlingData, CrawlingJournal, PlatformType
 from datetime import datetime
 from crawling_view.utils.constants import CommonSettings
 import logging
@@ -148,7 +148,7 @@ def get_song_info_id(platform, **kwargs):
         logger.error(f"❌ SongInfo 조회 실패: {platform} - {kwargs} - {e}")
         return None
 
-def _save_crawling_data(results, platform, platform_type):
+def _save_crawling_data(results, platform, platform_type, target_date=None, platform_id_field=None):
     """
     크롤링 데이터 저장 공통 함수
     
@@ -156,6 +156,8 @@ def _save_crawling_data(results, platform, platform_type):
         results (list/dict): 크롤링 결과
         platform (str): 플랫폼명 (로그용)
         platform_type: PlatformType enum 값
+        target_date (date, optional): 크롤링 대상 날짜. 지정 시 같은 트랜잭션으로 완료 기록(CrawlingJournal)을 남기고 이미 완료된 곡은 스킵
+        platform_id_field (str, optional): 결과에 이 키가 있으면 같은 이름의 SongInfo 필드에 저장 (검색으로 새로 확인한 플랫폼 곡 ID)
         
     Returns:
         dict: 저장 결과 (saved_count, failed_count, skipped_count)
@@ -190,13 +192,30 @@ def _save_crawling_data(results, platform, platform_type):
                 skipped_count += 1
                 continue
             
-            # DB 저장
-            CrawlingData.objects.create(
-                song_id=clean_data['song_id'],
-                views=clean_data['views'],
-                listeners=clean_data['listeners'],
-                platform=platform_type
-            )
+            # DB 저장 (완료 기록과 함께 원자적으로 저장)
+            with transaction.atomic():
+                if target_date:
+                    _, created = CrawlingJournal.objects.get_or_create(
+                        song_id=clean_data['song_id'],
+                        platform=platform_type,
+                        target_date=target_date
+                    )
+                    if not created:
+                        # 같은 날짜에 이미 저장된 곡 → 중복 저장 방지
+                        logger.debug(f"⏭️ {platform} 이미 완료된 곡 스킵: {clean_data['song_id']}")
+                        skipped_count += 1
+                        continue
+                
+                CrawlingData.objects.create(
+                    song_id=clean_data['song_id'],
+                    views=clean_data['views'],
+                    listeners=clean_data['listeners'],
+                    platform=platform_type
+                )
+                
+                # 다음 실행부터 검색 없이 바로 이동하도록 플랫폼 곡 ID 저장
+                if platform_id_field and isinstance(result, dict) and result.get(platform_id_field):
+                    SongInfo.objects.filter(id=clean_data['song_id']).update(**{platform_id_field: result[platform_id_field]})
             
             saved_count += 1
             # 성공한 DB 저장은 디버그 레벨로 변경
@@ -209,7 +228,7 @@ def _save_crawling_data(results, platform, platform_type):
     logger.info(f"✅ {platform} DB 저장 완료: {saved_count}개 성공, {failed_count}개 실패, {skipped_count}개 스킵")
     return {'saved_count': saved_count, 'failed_count': failed_count, 'skipped_count': skipped_count}
 
-def save_genie_to_db(results):
+def save_genie_to_db(results, target_date=None):
     """
     Genie 크롤링 결과를 DB에 저장
     
@@ -219,9 +238,9 @@ def save_genie_to_db(results):
     Returns:
         dict: 저장 결과 (saved_count, failed_count, skipped_count)
     """
-    return _save_crawling_data(results, 'genie', PlatformType.GENIE)
+    return _save_crawling_data(results, 'genie', PlatformType.GENIE, target_date, platform_id_field='genie_song_id')
 
-def save_youtube_music_to_db(results):
+def save_youtube_music_to_db(results, target_date=None):
     """
     YouTube Music 크롤링 결과를 DB에 저장
     
@@ -231,9 +250,10 @@ def save_youtube_music_to_db(results):
     Returns:
         dict: 저장 결과 (saved_count, failed_count, skipped_count)
     """
-    return _save_crawling_data(results, 'youtube_music', PlatformType.YOUTUBE_MUSIC)
+    return _save_crawling_data(results, 'youtube_music', PlatformType.YOUTUBE_MUSIC, target_date,
+                               platform_id_field='youtube_music_video_id')
 
-def save_youtube_to_db(results):
+def save_youtube_to_db(results, target_date=None):
     """
     YouTube 크롤링 결과를 DB에 저장
     
@@ -243,9 +263,9 @@ def save_youtube_to_db(results):
     Returns:
         dict: 저장 결과 (saved_count, failed_count, skipped_count)
     """
-    return _save_crawling_data(results, 'youtube', PlatformType.YOUTUBE)
+    return _save_crawling_data(results, 'youtube', PlatformType.YOUTUBE, target_date)
 
-def save_melon_to_db(results):
+def save_melon_to_db(results, target_date=None):
     """
     Melon 크롤링 결과를 DB에 저장
     
@@ -255,4 +275,4 @@ def save_melon_to_db(results):
     Returns:
         dict: 저장 결과 (saved_count, failed_count, skipped_count)
     """
-    return _save_crawling_data(results, 'melon', PlatformType.MELON) 
\ No newline at end of file
+    return _save_crawling_data(results, 'melon', PlatformType.MELON, target_date) 
\ No newline at end of file
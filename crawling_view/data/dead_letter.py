@@ -0,0 +1,116 @@
+"""
+크롤링 실패(dead-letter) 기록 서비스
+"""
+from datetime import date
+from django.db.models import F
+from crawling_view.models import CrawlingFailure
+from crawling_view.data.run_journal import RunJournal
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def get_item_song_id(item):
+    """
+    크롤링 입력 항목에서 song_id 추출
+    
+    Args:
+        item: dict (Genie/YouTube Music/Melon) 또는 (url, artist_name, song_id) 튜플 (YouTube)
+    
+    Returns:
+        str: song_id 또는 None
+    """
+    if isinstance(item, dict):
+        return item.get('song_id')
+    if isinstance(item, (tuple, list)) and len(item) >= 3:
+        return item[2]
+    return None
+
+
+class DeadLetterService:
+    """
+    재시도 후에도 실패한 곡 기록/조회/해결 처리
+    """
+    
+    @staticmethod
+    def record(platform, failures, target_date=None):
+        """
+        실패 곡 기록 (같은 날짜에 이미 있으면 사유 갱신 및 실패 횟수 증가)
+        
+        Args:
+            platform (str): 플랫폼명
+            failures (list): [(크롤링 입력 항목, 실패 사유), ...]
+            target_date (date, optional): 크롤링 대상 날짜. None이면 오늘 날짜
+        
+        Returns:
+            int: 기록된 곡 수
+        """
+        if target_date is None:
+            target_date = date.today()
+        
+        recorded_count = 0
+        for item, reason in failures:
+            song_id = get_item_song_id(item)
+            if not song_id:
+                continue
+            try:
+                failure, created = CrawlingFailure.objects.get_or_create(
+                    song_id=song_id,
+                    platform=platform,
+                    target_date=target_date,
+                    defaults={'reason': reason or 'unknown'}
+                )
+                if not created:
+                    CrawlingFailure.objects.filter(id=failure.id).update(
+                        reason=reason or 'unknown',
+                        failure_count=F('failure_count') + 1,
+                        is_resolved=False
+                    )
+                recorded_count += 1
+            except Exception as e:
+                logger.error(f"❌ {platform} 실패 기록 저장 실패: {song_id} - {e}")
+        
+        if recorded_count:
+            logger.warning(f"📮 {platform} 실패 곡 {recorded_count}개 기록 (재크롤링: --dead-letters)")
+        return recorded_count
+    
+    @staticmethod
+    def get_unresolved(target_date=None, platforms=None):
+        """
+        해결되지 않은 실패 기록 조회
+        
+        Args:
+            target_date (date, optional): 크롤링 대상 날짜. None이면 전체 날짜
+            platforms (list, optional): 플랫폼 리스트. None이면 전체 플랫폼
+        
+        Returns:
+            list: CrawlingFailure 객체 리스트
+        """
+        queryset = CrawlingFailure.objects.filter(is_resolved=False)
+        if target_date:
+            queryset = queryset.filter(target_date=target_date)
+        if platforms:
+            queryset = queryset.filter(platform__in=platforms)
+        return list(queryset.order_by('target_date', 'platform'))
+    
+    @staticmethod
+    def resolve_completed(platform, target_date):
+        """
+        완료 기록(CrawlingJournal)이 생긴 실패 곡을 해결 처리
+        
+        Args:
+            platform (str): 플랫폼명
+            target_date (date): 크롤링 대상 날짜
+        
+        Returns:
+            int: 해결 처리된 곡 수
+        """
+        completed_song_ids = RunJournal.get_completed_song_ids(platform, target_date)
+        if not completed_song_ids:
+            return 0
+        return CrawlingFailure.objects.filter(
+            platform=platform,
+            target_date=target_date,
+            is_resolved=False,
+            song_id__in=completed_song_ids
+        ).update(is_resolved=True)
@@ -0,0 +1,195 @@
+"""
+크롤링 결과 스트리밍 저장 파이프라인
+
+크롤러 → (크기 제한 큐) → DB 싱크 / CSV 싱크 (마이크로 배치 저장)
+전체 크롤링이 끝날 때까지 결과를 메모리에 모아두지 않고,
+곡 단위로 흘려보내 중간에 프로세스가 죽어도 이미 저장된 배치는 보존된다.
+"""
+import logging
+import queue
+import threading
+import time
+from django.db import connection
+from crawling_view.utils.constants import PipelineSettings
+
+logger = logging.getLogger(__name__)
+
+# 싱크 종료 신호
+_STOP = object()
+
+class _SinkWorker:
+    """
+    큐를 비우며 마이크로 배치 단위로 writer를 호출하는 싱크 스레드
+    """
+    
+    def __init__(self, name, writer, merge_fn, batch_size, queue_size, flush_interval, keyed_by=None, uses_db=False):
+        """
+        Args:
+            name (str): 싱크 이름 (로그/스레드명)
+            writer (callable): 배치 저장 함수 (save_*_to_db, save_*_csv)
+            merge_fn (callable): merge_fn(누적 결과, 배치 결과, 배치 크기) → 누적 결과
+            batch_size (int): 마이크로 배치 크기
+            queue_size (int): 큐 최대 크기 (가득 차면 put이 대기 → 역압)
+            flush_interval (float): 배치가 덜 찼어도 저장하는 최대 대기 시간(초)
+            keyed_by (str, optional): 지정 시 배치를 {result[keyed_by]: result} dict로 전달 (YouTube 형식)
+            uses_db (bool): 스레드 종료 시 DB 커넥션 정리 여부
+        """
+        self.name = name
+        self.writer = writer
+        self.merge_fn = merge_fn
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.keyed_by = keyed_by
+        self.uses_db = uses_db
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+        self.result = None
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+    
+    def start(self):
+        self.thread.start()
+    
+    def put(self, item):
+        # 큐가 가득 차면 싱크가 따라잡을 때까지 크롤러 스레드가 대기한다
+        self.queue.put(item)
+    
+    def stop(self):
+        self.queue.put(_STOP)
+        self.thread.join()
+    
+    def _run(self):
+        batch = []
+        last_flush = time.monotonic()
+        try:
+            while True:
+                timeout = max(0.0, self.flush_interval - (time.monotonic() - last_flush))
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                
+                if item is _STOP:
+                    break
+                if item is not None:
+                    batch.append(item)
+                
+                if len(batch) >= self.batch_size or (batch and time.monotonic() - last_flush >= self.flush_interval):
+                    self._flush(batch)
+                    batch = []
+                    last_flush = time.monotonic()
+                elif not batch:
+                    last_flush = time.monotonic()
+            
+            # 최종 플러시
+            if batch:
+                self._flush(batch)
+        finally:
+            if self.uses_db:
+                connection.close()
+    
+    def _flush(self, batch):
+        payload = {item.get(self.keyed_by): item for item in batch} if self.keyed_by else list(batch)
+        try:
+            batch_result = self.writer(payload)
+        except Exception as e:
+            logger.error(f"❌ {self.name} 배치 저장 실패 ({len(batch)}개): {e}", exc_info=True)
+            batch_result = None
+        self.result = self.merge_fn(self.result, batch_result, len(batch))
+        logger.debug(f"💾 {self.name} 배치 저장: {len(batch)}개")
+
+def _merge_db_results(total, batch_result, batch_count):
+    """DB 저장 결과(saved/failed/skipped count) 누적"""
+    total = total or {'saved_count': 0, 'failed_count': 0, 'skipped_count': 0}
+    if not isinstance(batch_result, dict):
+        # writer 자체가 실패한 경우 배치 전체를 실패로 집계
+        total['failed_count'] += batch_count
+        return total
+    for key, value in batch_result.items():
+        if isinstance(value, int):
+            total[key] = total.get(key, 0) + value
+    return total
+
+def _merge_csv_results(total, batch_result, batch_count):
+    """CSV 저장 파일 경로 리스트 누적"""
+    total = total or []
+    if isinstance(batch_result, list):
+        total.extend(batch_result)
+    return total
+
+class ResultPipeline:
+    """
+    플랫폼 단위 크롤링 결과 스트리밍 파이프라인
+    
+    사용 예:
+        pipeline = ResultPipeline('genie', save_genie_to_db, save_genie_csv).start()
+        try:
+            crawler.crawl_songs(song_data, on_result=pipeline.put)
+        finally:
+            db_results, csv_results = pipeline.close()
+    """
+    
+    def __init__(self, platform, db_writer, csv_writer, keyed_by=None,
+                 batch_size=None, queue_size=None, flush_interval=None):
+        """
+        Args:
+            platform (str): 플랫폼명
+            db_writer (callable): save_*_to_db 함수
+            csv_writer (callable): save_*_csv 함수
+            keyed_by (str, optional): 결과를 dict 형태로 넘겨야 하는 플랫폼(YouTube)의 키 필드
+            batch_size (int, optional): 마이크로 배치 크기. None이면 PipelineSettings 사용
+            queue_size (int, optional): 싱크별 큐 크기. None이면 PipelineSettings 사용
+            flush_interval (float, optional): 최대 플러시 간격(초). None이면 PipelineSettings 사용
+        """
+        self.platform = platform
+        batch_size = batch_size or PipelineSettings.BATCH_SIZE
+        queue_size = queue_size or PipelineSettings.QUEUE_SIZE
+        flush_interval = flush_interval or PipelineSettings.FLUSH_INTERVAL
+        
+        self.put_count = 0
+        self._db_sink = _SinkWorker(f"{platform}-db-sink", db_writer, _merge_db_results,
+                                    batch_size, queue_size, flush_interval, keyed_by, uses_db=True)
+        self._csv_sink = _SinkWorker(f"{platform}-csv-sink", csv_writer, _merge_csv_results,
+                                     batch_size, queue_size, flush_interval, keyed_by)
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def start(self):
+        """싱크 스레드 시작"""
+        self._db_sink.start()
+        self._csv_sink.start()
+        logger.info(f"🔀 {self.platform} 스트리밍 저장 파이프라인 시작")
+        return self
+    
+    def put(self, result):
+        """
+        크롤링 결과 1건을 파이프라인에 투입 (싱크 큐가 가득 차면 대기)
+        
+        Args:
+            result (dict): 크롤링 결과
+        """
+        if not result:
+            return
+        with self._lock:
+            if self._closed:
+                logger.warning(f"⚠️ {self.platform} 파이프라인 종료 후 투입된 결과 무시: {result.get('song_id')}")
+                return
+            self.put_count += 1
+        self._db_sink.put(result)
+        self._csv_sink.put(result)
+    
+    def close(self):
+        """
+        남은 배치를 모두 저장하고 싱크 스레드 종료
+        
+        Returns:
+            tuple: (db_results, csv_results) - 기존 save_*_to_db / save_*_csv 반환 형식과 동일
+        """
+        with self._lock:
+            self._closed = True
+        self._db_sink.stop()
+        self._csv_sink.stop()
+        
+        db_results = self._db_sink.result or {'saved_count': 0, 'failed_count': 0, 'skipped_count': 0}
+        csv_results = self._csv_sink.result or []
+        logger.info(f"🔀 {self.platform} 파이프라인 종료: {self.put_count}개 투입, "
+                    f"DB {db_results.get('saved_count', 0)}개 저장, CSV {len(csv_results)}개 파일")
+        return db_results, csv_results
@@ -0,0 +1,82 @@
+"""
+크롤링 완료 기록(저널) 조회 서비스
+"""
+from datetime import date
+from crawling_view.models import CrawlingJournal
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RunJournal:
+    """
+    (곡, 플랫폼, 대상 날짜) 완료 기록 조회 및 관리
+    
+    기록은 db_writer에서 CrawlingData 저장과 같은 트랜잭션으로 남는다.
+    """
+    
+    @staticmethod
+    def get_completed_song_ids(platform, target_date=None):
+        """
+        특정 플랫폼/날짜에 이미 완료된 song_id 집합 조회
+        
+        Args:
+            platform (str): 플랫폼명
+            target_date (date, optional): 대상 날짜. None이면 오늘 날짜
+        
+        Returns:
+            set: 완료된 song_id 집합
+        """
+        if target_date is None:
+            target_date = date.today()
+        
+        return set(
+            CrawlingJournal.objects.filter(
+                platform=platform,
+                target_date=target_date
+            ).values_list('song_id', flat=True)
+        )
+    
+    @staticmethod
+    def filter_pending(songs, platform, target_date=None):
+        """
+        이미 완료된 곡을 제외한 곡 목록 반환 (--resume 용)
+        
+        Args:
+            songs (list): SongInfo 객체 리스트
+            platform (str): 플랫폼명
+            target_date (date, optional): 대상 날짜
+        
+        Returns:
+            list: 아직 완료되지 않은 SongInfo 객체 리스트
+        """
+        completed = RunJournal.get_completed_song_ids(platform, target_date)
+        pending = [song for song in songs if song.id not in completed]
+        
+        if completed:
+            logger.info(f"⏭️ {platform} 재개 모드: 완료 {len(songs) - len(pending)}개 건너뜀, 남은 곡 {len(pending)}개")
+        
+        return pending
+    
+    @staticmethod
+    def clear(target_date=None, platform=None):
+        """
+        완료 기록 삭제 (같은 날짜를 처음부터 다시 크롤링할 때 사용)
+        
+        Args:
+            target_date (date, optional): 대상 날짜. None이면 오늘 날짜
+            platform (str, optional): 플랫폼명. None이면 전체 플랫폼
+        
+        Returns:
+            int: 삭제된 기록 수
+        """
+        if target_date is None:
+            target_date = date.today()
+        
+        queryset = CrawlingJournal.objects.filter(target_date=target_date)
+        if platform:
+            queryset = queryset.filter(platform=platform)
+        
+        deleted_count, _ = queryset.delete()
+        logger.info(f"🧹 완료 기록 삭제: {target_date} {platform or '전체'} {deleted_count}개")
+        return deleted_count
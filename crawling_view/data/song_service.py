@@ -1,6 +1,7 @@
 """
 크롤링 대상 곡 조회 서비스
 """
+import hashlib
 from datetime import date
 from crawling_view.models import SongInfo, CrawlingPeriod
 import logging
@@ -78,6 +79,32 @@ class SongService:
             logger.warning(f"❌ 알 수 없는 플랫폼: {platform}")
             return []
     
+    @staticmethod
+    def shard_songs(songs, shard_index, shard_count):
+        """
+        곡 목록을 SongInfo.id 해시 기준으로 결정적으로 분할
+        
+        같은 곡은 실행 시점/호스트와 관계없이 항상 같은 샤드에 속하므로
+        여러 cron/호스트가 겹치지 않게 카탈로그를 나눠 크롤링할 수 있다.
+        
+        Args:
+            songs (list): SongInfo 객체 리스트
+            shard_index (int): 샤드 번호 (0부터 시작)
+            shard_count (int): 전체 샤드 수
+            
+        Returns:
+            list: 해당 샤드에 속하는 SongInfo 객체 리스트
+        """
+        if shard_count <= 1:
+            return list(songs)
+        
+        sharded_songs = [
+            song for song in songs
+            if int(hashlib.md5(song.id.encode('utf-8')).hexdigest(), 16) % shard_count == shard_index
+        ]
+        logger.info(f"🧩 샤드 {shard_index}/{shard_count}: {len(sharded_songs)}개 곡 (전체 {len(songs)}개)")
+        return sharded_songs
+    
     @staticmethod
     def convert_to_crawling_format(songs, platform):
         """
@@ -95,7 +122,8 @@ class SongService:
                 {
                     'song_id': song.id,
                     'song_title': song.get_platform_info('genie')['title'],
-                    'artist_name': song.get_platform_info('genie')['artist']
+                    'artist_name': song.get_platform_info('genie')['artist'],
+                    'genie_song_id': song.get_platform_info('genie')['song_id']
                 }
                 for song in songs
                 if song.is_platform_available('genie')
@@ -105,7 +133,8 @@ class SongService:
                 {
                     'song_id': song.id,
                     'song_title': song.get_platform_info('youtube_music')['title'],
-                    'artist_name': song.get_platform_info('youtube_music')['artist']
+                    'artist_name': song.get_platform_info('youtube_music')['artist'],
+                    'video_id': song.get_platform_info('youtube_music')['video_id']
                 }
                 for song in songs
                 if song.is_platform_available('youtube_music')
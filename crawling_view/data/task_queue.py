@@ -0,0 +1,209 @@
+"""
+DB 기반 분산 크롤링 작업 큐
+
+Redis/Celery 없이 crawl_task 테이블 하나로 여러 호스트가 작업을 나눠 가진다.
+- PostgreSQL/MySQL 8+: SELECT ... FOR UPDATE SKIP LOCKED 로 배치 임대
+- SQLite 등: 조건부 UPDATE(원자적)로 한 건씩 선점
+임대 시간이 지난 running 작업은 죽은 워커의 작업으로 보고 다시 임대 대상이 된다.
+"""
+from datetime import date, timedelta
+from django.db import connection, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+from crawling_view.models import CrawlTask, TaskStatus, PlatformType
+from crawling_view.data.song_service import SongService
+from crawling_view.data.crawl_scheduler import CrawlScheduler
+from crawling_view.data.crawl_cadence import CrawlCadence
+from crawling_view.utils.constants import TaskQueueSettings
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlTaskQueue:
+    """
+    (곡, 플랫폼, 날짜) 단위 작업 생성/임대/완료 처리
+    """
+    
+    @staticmethod
+    def enqueue(target_date=None, platforms=None):
+        """
+        활성 곡 목록으로 작업 생성 (이미 있는 작업은 그대로 둠)
+        
+        Args:
+            target_date (date, optional): 크롤링 대상 날짜. None이면 오늘 날짜
+            platforms (list, optional): 대상 플랫폼 리스트. None이면 전체 플랫폼
+        
+        Returns:
+            int: 새로 생성된 작업 수
+        """
+        if target_date is None:
+            target_date = date.today()
+        if platforms is None:
+            platforms = PlatformType.values
+        
+        active_songs = SongService.get_active_songs(target_date)
+        tasks = []
+        for platform in platforms:
+            platform_songs = SongService.get_songs_by_platform(active_songs, platform)
+            platform_songs, _ = CrawlCadence.filter_due(platform_songs, platform, target_date)
+            priorities = CrawlScheduler.get_priorities(platform_songs, platform, target_date)
+            tasks.extend(
+                CrawlTask(song_id=song.id, platform=platform, target_date=target_date,
+                          priority=priorities.get(song.id, 0.0))
+                for song in platform_songs
+            )
+        
+        before_count = CrawlTask.objects.filter(target_date=target_date).count()
+        CrawlTask.objects.bulk_create(tasks, batch_size=500, ignore_conflicts=True)
+        created_count = CrawlTask.objects.filter(target_date=target_date).count() - before_count
+        
+        logger.info(f"📥 작업 생성: {target_date} {created_count}개 (후보 {len(tasks)}개)")
+        return created_count
+    
+    @staticmethod
+    def claim(platform, worker_id, target_date=None, batch_size=None, lease_seconds=None):
+        """
+        대기 중이거나 임대가 만료된 작업을 임대
+        
+        Args:
+            platform (str): 플랫폼명
+            worker_id (str): 워커 ID (호스트명-PID 등)
+            target_date (date, optional): 크롤링 대상 날짜
+            batch_size (int, optional): 임대할 최대 작업 수
+            lease_seconds (int, optional): 임대 유지 시간(초)
+        
+        Returns:
+            list: 임대한 CrawlTask 객체 리스트
+        """
+        if target_date is None:
+            target_date = date.today()
+        batch_size = batch_size or TaskQueueSettings.CLAIM_BATCH_SIZE
+        lease_seconds = lease_seconds or TaskQueueSettings.LEASE_SECONDS
+        
+        now = timezone.now()
+        claimable = Q(status=TaskStatus.PENDING) | Q(status=TaskStatus.RUNNING, lease_expires_at__lt=now)
+        candidates = CrawlTask.objects.filter(
+            claimable, platform=platform, target_date=target_date
+        ).order_by('-priority', 'created_at')
+        claim_values = {
+            'status': TaskStatus.RUNNING,
+            'worker_id': worker_id,
+            'lease_expires_at': now + timedelta(seconds=lease_seconds),
+            'attempts': F('attempts') + 1,
+            'updated_at': now,
+        }
+        
+        if connection.features.has_select_for_update_skip_locked:
+            # 다른 워커가 잠근 행은 건너뛰고 한 번에 배치 임대
+            with transaction.atomic():
+                task_ids = list(
+                    candidates.select_for_update(skip_locked=True).values_list('id', flat=True)[:batch_size]
+                )
+                if task_ids:
+                    CrawlTask.objects.filter(id__in=task_ids).update(**claim_values)
+        else:
+            # SKIP LOCKED 미지원(SQLite): 조건부 UPDATE가 1건이면 선점 성공, 0건이면 다른 워커가 먼저 가져감
+            task_ids = []
+            for task_id in candidates.values_list('id', flat=True)[:batch_size * 2]:
+                if CrawlTask.objects.filter(claimable, id=task_id).update(**claim_values):
+                    task_ids.append(task_id)
+                if len(task_ids) >= batch_size:
+                    break
+        
+        if task_ids:
+            logger.info(f"🔒 {platform} 작업 임대: {len(task_ids)}개 (워커 {worker_id})")
+        return list(CrawlTask.objects.filter(id__in=task_ids, worker_id=worker_id))
+    
+    @staticmethod
+    def complete(task_ids, worker_id):
+        """
+        임대한 작업을 완료 처리
+        
+        Args:
+            task_ids (list): CrawlTask ID 리스트
+            worker_id (str): 워커 ID (임대가 만료되어 다른 워커에게 넘어간 작업은 제외)
+        
+        Returns:
+            int: 완료 처리된 작업 수
+        """
+        if not task_ids:
+            return 0
+        return CrawlTask.objects.filter(
+            id__in=task_ids, worker_id=worker_id, status=TaskStatus.RUNNING
+        ).update(status=TaskStatus.DONE, lease_expires_at=None, last_error=None, updated_at=timezone.now())
+    
+    @staticmethod
+    def fail(task_ids, worker_id, error=None, max_attempts=None):
+        """
+        임대한 작업을 실패 처리 (시도 횟수가 남았으면 다시 대기 상태로)
+        
+        Args:
+            task_ids (list): CrawlTask ID 리스트
+            worker_id (str): 워커 ID
+            error (str, optional): 오류 메시지
+            max_attempts (int, optional): 최대 시도 횟수
+        
+        Returns:
+            dict: {'retry': 재시도 대기 작업 수, 'failed': 최종 실패 작업 수}
+        """
+        if not task_ids:
+            return {'retry': 0, 'failed': 0}
+        max_attempts = max_attempts or TaskQueueSettings.MAX_ATTEMPTS
+        
+        now = timezone.now()
+        tasks = CrawlTask.objects.filter(id__in=task_ids, worker_id=worker_id, status=TaskStatus.RUNNING)
+        failed_count = tasks.filter(attempts__gte=max_attempts).update(
+            status=TaskStatus.FAILED, lease_expires_at=None, last_error=error, updated_at=now
+        )
+        retry_count = tasks.filter(attempts__lt=max_attempts).update(
+            status=TaskStatus.PENDING, worker_id=None, lease_expires_at=None, last_error=error, updated_at=now
+        )
+        return {'retry': retry_count, 'failed': failed_count}
+    
+    @staticmethod
+    def has_active_leases(platforms, target_date=None):
+        """
+        다른 워커가 아직 유효한 임대로 처리 중인 작업이 있는지 확인
+        
+        Args:
+            platforms (list): 플랫폼 리스트
+            target_date (date, optional): 크롤링 대상 날짜
+        
+        Returns:
+            bool: 처리 중인 작업 존재 여부
+        """
+        if target_date is None:
+            target_date = date.today()
+        return CrawlTask.objects.filter(
+            platform__in=platforms,
+            target_date=target_date,
+            status=TaskStatus.RUNNING,
+            lease_expires_at__gte=timezone.now()
+        ).exists()
+    
+    @staticmethod
+    def get_status_counts(target_date=None):
+        """
+        플랫폼별 작업 상태 집계
+        
+        Args:
+            target_date (date, optional): 크롤링 대상 날짜
+        
+        Returns:
+            dict: {platform: {status: count}}
+        """
+        if target_date is None:
+            target_date = date.today()
+        
+        counts = {}
+        rows = (
+            CrawlTask.objects.filter(target_date=target_date)
+            .values('platform', 'status')
+            .annotate(count=Count('id'))
+            .order_by()
+        )
+        for row in rows:
+            platform_counts = counts.setdefault(row['platform'], {status: 0 for status in TaskStatus.values})
+            platform_counts[row['status']] = row['count']
+        return counts
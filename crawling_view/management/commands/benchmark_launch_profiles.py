@@ -0,0 +1,70 @@
+"""
+Chrome 실행 프로필 벤치마크 관리 명령어
+
+프로필별로 Chrome을 여러 번 띄워 기동 시간, 페이지 로드 시간, Chrome 프로세스 RSS 합계를 측정한다.
+호스트당 워커 수를 정할 때 (가용 메모리 / 프로필 RSS) 를 기준으로 삼는다.
+
+사용 예:
+    python manage.py benchmark_launch_profiles
+    python manage.py benchmark_launch_profiles --profiles default headless-lowmem --runs 5
+    python manage.py benchmark_launch_profiles --url https://www.genie.co.kr/ --platform genie
+"""
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from crawling_view.controller.crawling_manager import PLATFORMS
+from crawling_view.utils.constants import LaunchProfileSettings
+from crawling_view.utils.driver import create_driver
+from crawling_view.utils.driver_supervisor import get_chrome_rss_mb
+
+class Command(BaseCommand):
+    help = 'Chrome 실행 프로필별 기동 시간/페이지 로드 시간/RSS 측정'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--profiles', nargs='+', choices=list(LaunchProfileSettings.PROFILES),
+                            help='측정할 실행 프로필 (기본값: 전체)')
+        parser.add_argument('--runs', type=int, default=3, help='프로필당 측정 횟수 (기본값: 3)')
+        parser.add_argument('--url', type=str, default='https://www.genie.co.kr/',
+                            help='기동 후 불러올 페이지 (RSS는 이 페이지를 연 상태에서 측정)')
+        parser.add_argument('--platform', choices=PLATFORMS,
+                            help='적용할 네트워크 차단 프로필 플랫폼 (기본값: 차단 없음)')
+    
+    def handle(self, *args, **options):
+        profiles = options['profiles'] or list(LaunchProfileSettings.PROFILES)
+        runs = max(1, options['runs'])
+        
+        rows = []
+        for profile_name in profiles:
+            launch_times, load_times, rss_values = [], [], []
+            for run in range(runs):
+                started_at = time.monotonic()
+                driver = create_driver(platform=options['platform'], launch_profile=profile_name)
+                try:
+                    launch_times.append(time.monotonic() - started_at)
+                    
+                    started_at = time.monotonic()
+                    driver.get(options['url'])
+                    load_times.append(time.monotonic() - started_at)
+                    
+                    rss_mb = get_chrome_rss_mb(driver)
+                    if rss_mb is not None:
+                        rss_values.append(rss_mb)
+                except Exception as e:
+                    self.stderr.write(f"❌ {profile_name} {run + 1}회차 측정 실패: {e}")
+                finally:
+                    driver.quit()
+            
+            rows.append((profile_name, launch_times, load_times, rss_values))
+            self.stdout.write(f"⏱️ {profile_name}: {runs}회 측정 완료")
+        
+        self.stdout.write("")
+        self.stdout.write(f"{'프로필':<18}{'기동(초)':>10}{'로드(초)':>10}{'RSS(MB)':>10}")
+        self.stdout.write("-" * 48)
+        for profile_name, launch_times, load_times, rss_values in rows:
+            self.stdout.write(f"{profile_name:<18}{self._median(launch_times):>10}"
+                              f"{self._median(load_times):>10}{self._median(rss_values, '.0f'):>10}")
+        self.stdout.write(self.style.SUCCESS("✅ 실행 프로필 벤치마크 완료 (중앙값, RSS는 /proc 지원 환경에서만 측정)"))
+    
+    @staticmethod
+    def _median(values, spec='.2f'):
+        return format(statistics.median(values), spec) if values else '-'
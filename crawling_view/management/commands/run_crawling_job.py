@@ -0,0 +1,103 @@
+"""
+크롤링 실행 관리 명령어
+
+사용 예:
+    python manage.py run_crawling_job
+    python manage.py run_crawling_job --platforms genie melon --workers 2
+    python manage.py run_crawling_job --shard 0/3 --date 2025-07-07 --limit 100
+    python manage.py run_crawling_job --dead-letters --platforms genie
+    python manage.py run_crawling_job --launch-profile headless-lowmem youtube_music=default
+"""
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from crawling_view.controller.crawling_manager import PLATFORMS, run_dead_letter_crawling
+from crawling_view.controller.run_crawling import setup_logging, run_full_crawling
+from crawling_view.utils.constants import FilePaths
+from crawling_view.utils.launch_profile import apply_launch_profile_args
+
+def parse_shard(value):
+    """
+    '--shard i/n' 값 파싱
+    
+    Args:
+        value (str): 'i/n' 형식 문자열 (i는 0부터 n-1)
+    
+    Returns:
+        tuple: (shard_index, shard_count)
+    """
+    try:
+        shard_index, shard_count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise CommandError(f"--shard 형식이 올바르지 않습니다: {value} (예: 0/3)")
+    
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise CommandError(f"--shard 범위가 올바르지 않습니다: {value} (0 <= i < n)")
+    return shard_index, shard_count
+
+class Command(BaseCommand):
+    help = '활성 곡 크롤링 실행 (플랫폼/워커/샤드 선택 가능)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--platforms', nargs='+', choices=PLATFORMS,
+                            help='크롤링할 플랫폼 (기본값: 전체)')
+        parser.add_argument('--workers', type=int,
+                            help='플랫폼별 워커(독립 Chrome 드라이버) 수 (기본값: .env 설정)')
+        parser.add_argument('--shard', type=str,
+                            help='SongInfo.id 해시 기준 분할 중 담당할 조각 (i/n 형식, 예: 0/3)')
+        parser.add_argument('--date', type=str, help='크롤링 대상 날짜 (YYYY-MM-DD 형식)')
+        parser.add_argument('--limit', type=int, help='크롤링할 최대 곡 수')
+        parser.add_argument('--parallel', action='store_true', default=None,
+                            help='플랫폼별 크롤링을 동시에 실행')
+        parser.add_argument('--max-parallel', type=int, help='최대 동시 실행 플랫폼 수')
+        parser.add_argument('--resume', action='store_true',
+                            help='같은 날짜에 이미 완료된 곡은 건너뛰고 이어서 크롤링')
+        parser.add_argument('--dead-letters', action='store_true',
+                            help='재시도 후에도 실패해 기록된 곡만 다시 크롤링 (--date 지정 시 해당 날짜만)')
+        parser.add_argument('--log-dir', type=str, default=FilePaths.LOG_DIR,
+                            help=f'로그 파일 디렉토리 (기본값: {FilePaths.LOG_DIR})')
+        parser.add_argument('--launch-profile', nargs='+', metavar='[PLATFORM=]PROFILE',
+                            help='Chrome 실행 프로필 (예: headless-lowmem, youtube_music=default)')
+    
+    def handle(self, *args, **options):
+        target_date = None
+        if options['date']:
+            try:
+                target_date = datetime.strptime(options['date'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError("날짜 형식이 올바르지 않습니다. YYYY-MM-DD 형식을 사용하세요.")
+        
+        shard = parse_shard(options['shard']) if options['shard'] else None
+        if options['workers'] is not None and options['workers'] < 1:
+            raise CommandError("--workers 는 1 이상이어야 합니다.")
+        if options['limit'] is not None and options['limit'] < 1:
+            raise CommandError("--limit 은 1 이상이어야 합니다.")
+        
+        try:
+            apply_launch_profile_args(options['launch_profile'])
+        except ValueError as e:
+            raise CommandError(str(e))
+        
+        log_path = setup_logging(options['log_dir'])
+        self.stdout.write(f"📝 로그 파일: {log_path}")
+        
+        if options['dead_letters']:
+            result = run_dead_letter_crawling(target_date, options['platforms'], options['workers'])
+            if result.get('status') == 'error':
+                raise CommandError(f"실패 곡 재크롤링 실패: {result.get('message')}")
+            self.stdout.write(self.style.SUCCESS("✅ 실패 곡 재크롤링 완료"))
+            return
+        
+        result = run_full_crawling(
+            target_date,
+            parallel=options['parallel'],
+            max_parallel=options['max_parallel'],
+            resume=options['resume'],
+            platforms=options['platforms'],
+            workers=options['workers'],
+            shard=shard,
+            limit=options['limit'],
+        )
+        
+        if result.get('status') not in ('success', 'no_songs'):
+            raise CommandError(f"크롤링 실패: {result.get('error_message', result.get('status'))}")
+        self.stdout.write(self.style.SUCCESS("✅ 크롤링 작업 완료"))
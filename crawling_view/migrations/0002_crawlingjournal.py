@@ -0,0 +1,30 @@
+# Generated by Django 4.2.21 on 2026-10-18 09:00
+
+import crawling_view.models.base
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crawling_view', '0001_initial'),
+    ]
+    
+    operations = [
+        migrations.CreateModel(
+            name='CrawlingJournal',
+            fields=[
+                ('id', models.CharField(default=crawling_view.models.base.generate_uuid, editable=False, max_length=32, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='생성시간')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='수정시간')),
+                ('song_id', models.CharField(help_text='노래 ID (song_info.id 참조)', max_length=32)),
+                ('platform', models.CharField(choices=[('melon', 'Melon'), ('genie', 'Genie'), ('youtube', 'YouTube'), ('youtube_music', 'YouTube Music')], help_text='플랫폼명', max_length=20)),
+                ('target_date', models.DateField(help_text='크롤링 대상 날짜')),
+            ],
+            options={
+                'db_table': 'crawling_journal',
+                'ordering': ['-created_at'],
+                'unique_together': {('song_id', 'platform', 'target_date')},
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.21 on 2026-10-18 10:00
+
+import crawling_view.models.base
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crawling_view', '0002_crawlingjournal'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlTask',
+            fields=[
+                ('id', models.CharField(default=crawling_view.models.base.generate_uuid, editable=False, max_length=32, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='생성시간')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='수정시간')),
+                ('song_id', models.CharField(help_text='노래 ID (song_info.id 참조)', max_length=32)),
+                ('platform', models.CharField(choices=[('melon', 'Melon'), ('genie', 'Genie'), ('youtube', 'YouTube'), ('youtube_music', 'YouTube Music')], help_text='플랫폼명', max_length=20)),
+                ('target_date', models.DateField(help_text='크롤링 대상 날짜')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('running', '실행 중'), ('done', '완료'), ('failed', '실패')], default='pending', help_text='작업 상태', max_length=10)),
+                ('worker_id', models.CharField(blank=True, help_text='작업을 임대한 워커 ID', max_length=100, null=True)),
+                ('lease_expires_at', models.DateTimeField(blank=True, help_text='임대 만료 시간', null=True)),
+                ('attempts', models.IntegerField(default=0, help_text='시도 횟수')),
+                ('last_error', models.TextField(blank=True, help_text='마지막 오류 메시지', null=True)),
+            ],
+            options={
+                'db_table': 'crawl_task',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['target_date', 'platform', 'status'], name='crawl_task_claim_idx')],
+                'unique_together': {('song_id', 'platform', 'target_date')},
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.21 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crawling_view', '0003_crawltask'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='crawltask',
+            name='crawl_task_claim_idx',
+        ),
+        migrations.AddField(
+            model_name='crawltask',
+            name='priority',
+            field=models.FloatField(default=0, help_text='우선순위 점수 (높을수록 먼저 임대)'),
+        ),
+        migrations.AddIndex(
+            model_name='crawltask',
+            index=models.Index(fields=['target_date', 'platform', 'status', '-priority'], name='crawl_task_priority_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.21 on 2026-10-18 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crawling_view', '0005_crawlingfailure'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='songinfo',
+            name='genie_song_id',
+            field=models.CharField(blank=True, help_text='지니 곡 ID (곡 정보 페이지 xgnm)', max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='songinfo',
+            name='youtube_music_video_id',
+            field=models.CharField(blank=True, help_text='유튜브 뮤직 videoId', max_length=50, null=True),
+        ),
+    ]
@@ -5,6 +5,9 @@ from .base import BaseModel, generate_uuid
 from .song_info import SongInfo
 from .crawling_period import CrawlingPeriod
 from .crawling_data import CrawlingData, PlatformType
+from .crawling_journal import CrawlingJournal
+from .crawl_task import CrawlTask, TaskStatus
+from .crawling_failure import CrawlingFailure
 
 __all__ = [
     'BaseModel',
@@ -12,5 +15,9 @@ __all__ = [
     'SongInfo',
     'CrawlingPeriod',
     'CrawlingData',
-    'PlatformType'
+    'PlatformType',
+    'CrawlingJournal',
+    'CrawlTask',
+    'TaskStatus',
+    'CrawlingFailure'
 ] 
\ No newline at end of file
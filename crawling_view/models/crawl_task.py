@@ -0,0 +1,50 @@
+"""
+분산 크롤링 작업 큐 모델
+"""
+from django.db import models
+from .base import BaseModel
+from .crawling_data import PlatformType
+
+class TaskStatus(models.TextChoices):
+    """작업 상태 선택지"""
+    PENDING = 'pending', '대기'
+    RUNNING = 'running', '실행 중'
+    DONE = 'done', '완료'
+    FAILED = 'failed', '실패'
+
+class CrawlTask(BaseModel):
+    """
+    (곡, 플랫폼, 대상 날짜) 단위 크롤링 작업
+    
+    여러 호스트의 워커가 같은 테이블에서 작업을 임대(lease)해 가져간다.
+    임대 시간이 지나도 완료되지 않은 작업은 다른 워커가 다시 가져갈 수 있다.
+    """
+    song_id = models.CharField(max_length=32, help_text="노래 ID (song_info.id 참조)")
+    platform = models.CharField(
+        max_length=20,
+        choices=PlatformType.choices,
+        help_text="플랫폼명"
+    )
+    target_date = models.DateField(help_text="크롤링 대상 날짜")
+    status = models.CharField(
+        max_length=10,
+        choices=TaskStatus.choices,
+        default=TaskStatus.PENDING,
+        help_text="작업 상태"
+    )
+    worker_id = models.CharField(max_length=100, null=True, blank=True, help_text="작업을 임대한 워커 ID")
+    lease_expires_at = models.DateTimeField(null=True, blank=True, help_text="임대 만료 시간")
+    priority = models.FloatField(default=0, help_text="우선순위 점수 (높을수록 먼저 임대)")
+    attempts = models.IntegerField(default=0, help_text="시도 횟수")
+    last_error = models.TextField(null=True, blank=True, help_text="마지막 오류 메시지")
+    
+    class Meta:
+        db_table = 'crawl_task'
+        ordering = ['created_at']
+        unique_together = ['song_id', 'platform', 'target_date']
+        indexes = [
+            models.Index(fields=['target_date', 'platform', 'status', '-priority'], name='crawl_task_priority_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.platform} - Song {self.song_id}: {self.target_date} ({self.status})"
@@ -0,0 +1,31 @@
+"""
+크롤링 실패(dead-letter) 기록 모델
+"""
+from django.db import models
+from .base import BaseModel
+from .crawling_data import PlatformType
+
+class CrawlingFailure(BaseModel):
+    """
+    실행 중 재시도 후에도 실패한 (곡, 플랫폼, 대상 날짜) 기록
+    
+    실패 사유와 함께 남겨 두었다가 실패 곡만 따로 다시 크롤링할 수 있다.
+    """
+    song_id = models.CharField(max_length=32, help_text="노래 ID (song_info.id 참조)")
+    platform = models.CharField(
+        max_length=20,
+        choices=PlatformType.choices,
+        help_text="플랫폼명"
+    )
+    target_date = models.DateField(help_text="크롤링 대상 날짜")
+    reason = models.CharField(max_length=50, help_text="실패 사유 (not_found, timeout, captcha, http_429, circuit_open 등)")
+    failure_count = models.IntegerField(default=1, help_text="실패한 실행 횟수")
+    is_resolved = models.BooleanField(default=False, help_text="재크롤링 성공 여부")
+    
+    class Meta:
+        db_table = 'crawling_failure'
+        ordering = ['-created_at']
+        unique_together = ['song_id', 'platform', 'target_date']
+    
+    def __str__(self):
+        return f"{self.platform} - Song {self.song_id}: {self.target_date} {self.reason} (Resolved: {self.is_resolved})"
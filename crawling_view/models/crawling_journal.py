@@ -0,0 +1,29 @@
+"""
+크롤링 완료 기록(저널) 모델
+"""
+from django.db import models
+from .base import BaseModel
+from .crawling_data import PlatformType
+
+class CrawlingJournal(BaseModel):
+    """
+    (곡, 플랫폼, 대상 날짜) 단위 크롤링 완료 기록
+    
+    CrawlingData 저장과 같은 트랜잭션에서 기록되며,
+    --resume 실행 시 이미 완료된 작업을 건너뛰는 데 사용된다.
+    """
+    song_id = models.CharField(max_length=32, help_text="노래 ID (song_info.id 참조)")
+    platform = models.CharField(
+        max_length=20,
+        choices=PlatformType.choices,
+        help_text="플랫폼명"
+    )
+    target_date = models.DateField(help_text="크롤링 대상 날짜")
+    
+    class Meta:
+        db_table = 'crawling_journal'
+        ordering = ['-created_at']
+        unique_together = ['song_id', 'platform', 'target_date']  # 같은 날 같은 곡/플랫폼은 한 번만 완료 처리
+    
+    def __str__(self):
+        return f"{self.platform} - Song {self.song_id}: {self.target_date} 완료"
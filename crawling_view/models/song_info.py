@@ -17,6 +17,10 @@ class SongInfo(BaseModel):
     # 크롤링용 필수 정보
     youtube_url = models.URLField(max_length=500, blank=True, null=True, help_text="YouTube URL (YouTube 크롤링용)")
     melon_song_id = models.CharField(max_length=100, blank=True, null=True, help_text="멜론 곡 ID (Melon 크롤링용)", unique=True)
+    
+    # 첫 검색에서 확인한 플랫폼 곡 ID (이후 검색/매칭 없이 바로 사용)
+    genie_song_id = models.CharField(max_length=50, blank=True, null=True, help_text="지니 곡 ID (곡 정보 페이지 xgnm)")
+    youtube_music_video_id = models.CharField(max_length=50, blank=True, null=True, help_text="유튜브 뮤직 videoId")
 
     class Meta:
         db_table = 'song_info'
@@ -42,6 +46,7 @@ class SongInfo(BaseModel):
             }
         elif platform == 'genie':
             return {
+                'song_id': self.genie_song_id,
                 'title': self.genie_title,
                 'artist': self.genie_artist
             }
@@ -53,6 +58,7 @@ class SongInfo(BaseModel):
             }
         elif platform == 'youtube_music':
             return {
+                'video_id': self.youtube_music_video_id,
                 'title': self.youtube_music_title,
                 'artist': self.youtube_music_artist
             }
@@ -0,0 +1,67 @@
+"""
+서킷 브레이커 상태 전이 테스트 (closed → open → half_open → closed/open, 실제 크롤링 없음)
+"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from crawling_view.utils.circuit_breaker import CircuitBreaker
+
+# 차단 후 확인 요청까지 대기 시간(초) - 테스트용으로 짧게
+COOLDOWN = 0.2
+
+def test_open_after_consecutive_failures(threshold=3):
+    """연속 실패가 기준에 닿으면 open, 중간에 성공하면 연속 횟수 초기화"""
+    breaker = CircuitBreaker('test', failure_threshold=threshold, cooldown=COOLDOWN)
+    assert breaker.state == CircuitBreaker.CLOSED
+    
+    for _ in range(threshold - 1):
+        breaker.record_failure()
+    breaker.record_success()
+    for _ in range(threshold - 1):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED, "성공 후에는 연속 실패 횟수가 초기화되어야 함"
+    assert breaker.allow()
+    
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN, f"연속 실패 {threshold}회 후 open이어야 함"
+    assert not breaker.allow(), "cooldown 전에는 요청을 막아야 함"
+    assert 0 < breaker.time_until_probe() <= COOLDOWN
+    print(f"✅ closed → open (연속 실패 {threshold}회)")
+    return breaker
+
+def test_half_open_probe_success():
+    """cooldown 후 확인 요청 1건만 허용하고, 성공하면 closed로 복구"""
+    breaker = test_open_after_consecutive_failures()
+    time.sleep(COOLDOWN)
+    
+    assert breaker.time_until_probe() == 0
+    assert breaker.allow(), "cooldown 후에는 확인 요청을 허용해야 함"
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow(), "확인 요청 중에는 다른 요청을 막아야 함"
+    
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+    assert breaker.time_until_probe() == 0
+    print("✅ open → half_open → closed (확인 요청 성공)")
+
+def test_half_open_probe_failure():
+    """확인 요청이 실패하면 연속 실패 기준과 관계없이 다시 open"""
+    breaker = test_open_after_consecutive_failures()
+    time.sleep(COOLDOWN)
+    
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN, "확인 요청 실패 후 다시 open이어야 함"
+    assert not breaker.allow()
+    assert breaker.time_until_probe() > 0, "다시 open되면 cooldown을 새로 시작해야 함"
+    print("✅ open → half_open → open (확인 요청 실패)")
+
+if __name__ == "__main__":
+    print("🎯 서킷 브레이커 상태 전이 테스트")
+    test_half_open_probe_success()
+    test_half_open_probe_failure()
@@ -0,0 +1,72 @@
+"""
+워커 수 자동 조절(AIMD) 컨트롤러 테스트 (곡 처리 결과를 직접 기록, 실제 크롤링 없음)
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from crawling_view.utils.concurrency import AIMDController, classify_exception, classify_failure
+
+WINDOW = 5
+MAX_P95_LATENCY = 1.0
+
+def make_controller(initial=2, maximum=4):
+    return AIMDController('test', initial, minimum=1, maximum=maximum, window=WINDOW,
+                          max_error_rate=0.2, max_p95_latency=MAX_P95_LATENCY, decrease_factor=0.5)
+
+def record_window(controller, latency, error_kind=None):
+    """판단 구간 하나(WINDOW곡)를 같은 결과로 기록하고 목표 워커 수 반환"""
+    limit = controller.limit
+    for _ in range(WINDOW):
+        limit = controller.record(latency, error_kind)
+    return limit
+
+def test_additive_increase():
+    """구간이 끝날 때 p95가 허용치 안이면 1씩 증가 (최대 워커 수까지)"""
+    controller = make_controller(initial=2, maximum=4)
+    for _ in range(WINDOW - 1):
+        controller.record(0.1)
+    assert controller.limit == 2, "구간이 끝나기 전에는 바뀌지 않아야 함"
+    controller.record(0.1)
+    assert controller.limit == 3
+    assert record_window(controller, 0.1) == 4
+    assert record_window(controller, 0.1) == 4, "최대 워커 수를 넘지 않아야 함"
+    print("✅ 증가 확인 완료 (2 → 3 → 4, 최대 4)")
+
+def test_decrease_on_latency():
+    """구간의 p95 처리 시간이 허용치를 넘으면 decrease_factor배로 감소 (최소 워커 수까지)"""
+    controller = make_controller(initial=4)
+    assert record_window(controller, MAX_P95_LATENCY * 2) == 2
+    assert record_window(controller, MAX_P95_LATENCY * 2) == 1
+    assert record_window(controller, MAX_P95_LATENCY * 2) == 1, "최소 워커 수 아래로 줄지 않아야 함"
+    print("✅ p95 처리 시간 초과 시 감소 확인 완료 (4 → 2 → 1)")
+
+def test_decrease_on_throttle():
+    """차단성 오류가 허용 비율을 넘으면 구간이 끝나기 전이라도 즉시 감소"""
+    controller = make_controller(initial=4)
+    # 허용 오류 수 = max_error_rate(0.2) × 구간(5곡) = 1건
+    assert controller.record(0.1, 'http_429') == 4
+    assert controller.record(0.1, 'captcha') == 2, "허용치를 넘는 즉시 감소해야 함"
+    assert controller.record(0.1, 'timeout') == 2, "감소 후에는 새 구간에서 다시 집계해야 함"
+    assert controller.record(0.1, 'timeout') == 1
+    print("✅ 차단성 오류 급증 시 즉시 감소 확인 완료 (4 → 2 → 1)")
+
+def test_not_found_is_not_throttle():
+    """결과가 없거나 일반 오류로 끝난 곡은 차단성 오류로 세지 않음"""
+    controller = make_controller(initial=2)
+    assert record_window(controller, 0.1, 'not_found') == 3
+    assert record_window(controller, 0.1, 'error') == 4
+    
+    # 느리게 끝났더라도 결과 없음은 타임아웃으로 분류하지 않는다 (차단 페이지 확인은 드라이버가 있을 때만)
+    assert classify_failure() == 'not_found'
+    assert classify_exception(TimeoutError()) == 'timeout'
+    assert classify_exception(ValueError()) == 'error'
+    print("✅ not_found/error는 감소 신호가 아님 확인 완료")
+
+if __name__ == "__main__":
+    print("🎯 AIMD 워커 수 조절 테스트")
+    test_additive_increase()
+    test_decrease_on_latency()
+    test_decrease_on_throttle()
+    test_not_found_is_not_throttle()
@@ -0,0 +1,119 @@
+"""
+토큰 버킷 속도 제한기 테스트 (여러 스레드가 버킷 하나를 공유할 때의 요청 간격 확인, 실제 크롤링 없음)
+"""
+import sys
+import os
+import asyncio
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from crawling_view.utils.rate_limiter import TokenBucket
+
+# 측정 오차 허용치(초)
+TOLERANCE = 0.05
+
+def run_threads(buckets, thread_count, requests_per_thread):
+    """
+    스레드마다 버킷에서 토큰을 받아 요청 시각을 기록 (buckets를 스레드에 번갈아 배정)
+    
+    Returns:
+        tuple: (전체 소요 시간(초), 시작 기준 요청 시각 리스트(정렬됨))
+    """
+    times = []
+    times_lock = threading.Lock()
+    started_at = time.monotonic()
+    
+    def worker(bucket):
+        for _ in range(requests_per_thread):
+            bucket.acquire()
+            with times_lock:
+                times.append(time.monotonic() - started_at)
+    
+    threads = [threading.Thread(target=worker, args=(buckets[i % len(buckets)],)) for i in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.monotonic() - started_at, sorted(times)
+
+def assert_rate(times, rate, burst):
+    """어느 구간에서도 요청 수가 burst + rate × 구간 길이를 넘지 않는지 확인"""
+    for start, first in enumerate(times):
+        for end in range(start, len(times)):
+            allowed = burst + (times[end] - first + TOLERANCE) * rate
+            assert end - start + 1 <= allowed, \
+                f"{first:.2f}~{times[end]:.2f}초 구간 요청 {end - start + 1}개 (허용 {allowed:.1f}개)"
+
+def test_threads_share_bucket(rate=20, burst=2, thread_count=8, requests_per_thread=5):
+    """여러 스레드가 버킷 하나를 공유해도 요청 속도가 rate/burst를 넘지 않아야 함"""
+    total = thread_count * requests_per_thread
+    expected = (total - burst) / rate
+    bucket = TokenBucket('test_threads', rate, burst)
+    elapsed, times = run_threads([bucket], thread_count, requests_per_thread)
+    
+    print(f"스레드 {thread_count}개 × {requests_per_thread}회: {elapsed:.2f}초 (이론값 {expected:.2f}초)")
+    assert len(times) == total
+    assert elapsed >= expected - TOLERANCE, "요청이 설정 속도보다 빨리 나감"
+    assert elapsed < expected + 1.0, "대기 시간이 지나치게 김"
+    assert times[burst - 1] < TOLERANCE, "버스트만큼은 즉시 나가야 함"
+    assert_rate(times, rate, burst)
+    print("✅ 스레드 공유 버킷 속도 확인 완료")
+
+def test_shared_state_file(rate=20, burst=2, thread_count=4, requests_per_thread=5):
+    """상태 파일을 공유하는 버킷 두 개(다른 프로세스 역할)도 합산 속도가 rate/burst를 넘지 않아야 함"""
+    total = thread_count * requests_per_thread
+    expected = (total - burst) / rate
+    with tempfile.TemporaryDirectory() as state_dir:
+        buckets = [TokenBucket('test_shared', rate, burst, state_dir) for _ in range(2)]
+        if buckets[0].state_path is None:
+            print("⚠️ fcntl이 없는 환경이라 상태 파일 공유 테스트 생략")
+            return
+        elapsed, times = run_threads(buckets, thread_count, requests_per_thread)
+    
+    print(f"상태 파일 공유 버킷 2개, 스레드 {thread_count}개 × {requests_per_thread}회: {elapsed:.2f}초 (이론값 {expected:.2f}초)")
+    assert elapsed >= expected - TOLERANCE, "버킷 두 개가 상태를 공유하지 않음"
+    assert_rate(times, rate, burst)
+    print("✅ 상태 파일 공유 속도 확인 완료")
+
+def test_acquire_async(rate=20, burst=2, count=20):
+    """acquire_async도 같은 속도로 대기하고, 대기 중에 이벤트 루프를 막지 않아야 함"""
+    bucket = TokenBucket('test_async', rate, burst)
+    expected = (count - burst) / rate
+    
+    async def main():
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        
+        tick_task = asyncio.ensure_future(ticker())
+        started_at = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(count)))
+        elapsed = time.monotonic() - started_at
+        tick_task.cancel()
+        return elapsed, ticks
+    
+    elapsed, ticks = asyncio.run(main())
+    print(f"acquire_async {count}회: {elapsed:.2f}초 (이론값 {expected:.2f}초), 대기 중 이벤트 루프 틱 {ticks}회")
+    assert elapsed >= expected - TOLERANCE
+    assert ticks >= expected / 0.01 * 0.5, "대기 중 이벤트 루프가 막힘"
+    print("✅ acquire_async 확인 완료")
+
+def test_unlimited():
+    """rate가 0 이하이면 대기 없이 통과"""
+    bucket = TokenBucket('test_unlimited', 0, 1)
+    assert all(bucket.acquire() == 0 for _ in range(100))
+    print("✅ 속도 제한 없음(rate=0) 확인 완료")
+
+if __name__ == "__main__":
+    print("🎯 토큰 버킷 속도 제한기 테스트")
+    test_threads_share_bucket()
+    test_shared_state_file()
+    test_acquire_async()
+    test_unlimited()
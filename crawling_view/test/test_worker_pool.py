@@ -0,0 +1,132 @@
+"""
+워커 풀 재시도 큐/백오프 테스트 (가짜 크롤러와 crawl_fn 사용, 실제 Chrome/DB 접속 없음)
+"""
+import sys
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# 재시도 대기 시간을 줄여 테스트 (설정 import 전에 지정)
+os.environ.setdefault('CRAWL_RETRY_BACKOFF_BASE', '0.2')
+
+from crawling_view.utils.constants import RetrySettings
+from crawling_view.utils.circuit_breaker import CircuitBreaker
+from crawling_view.utils.worker_pool import CrawlWorkerPool
+
+# 측정 오차 허용치(초)
+TOLERANCE = 0.05
+
+class FakeCrawler:
+    """드라이버 없이 마지막 실패 종류만 기록하는 가짜 크롤러"""
+    
+    def __init__(self):
+        self.last_error = None
+
+@contextmanager
+def fake_session(worker_index):
+    yield FakeCrawler()
+
+class FakeSite:
+    """
+    곡 이름 규칙에 따라 응답하는 가짜 크롤링 대상
+    
+    - ok_*: 항상 성공
+    - flaky{N}_*: 처음 N번 실패(결과 없음) 후 성공
+    - blocked_*: 처음 한 번 HTTP 429 후 성공
+    - missing_*: 항상 결과 없음
+    - raises_*: 항상 예외
+    """
+    
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+    
+    def crawl(self, crawler, item):
+        crawler.last_error = None
+        with self._lock:
+            attempt = sum(1 for name, _ in self.calls if name == item) + 1
+            self.calls.append((item, time.monotonic() - self._started_at))
+        
+        if item.startswith('raises'):
+            raise ValueError(f"크롤링 실패: {item}")
+        if item.startswith('missing'):
+            return None
+        if item.startswith('blocked') and attempt == 1:
+            crawler.last_error = 'http_429'
+            return None
+        if item.startswith('flaky') and attempt <= int(item[len('flaky')]):
+            return None
+        return {'song_id': item, 'attempt': attempt}
+    
+    def call_times(self, item):
+        return [at for name, at in self.calls if name == item]
+
+def test_retry_backoff(max_attempts=3):
+    """실패한 곡만 입력 순서대로 지수 백오프 후 재시도하고, 끝까지 실패한 곡은 실패 사유와 함께 전달"""
+    site = FakeSite()
+    emitted, failed = [], []
+    pool = CrawlWorkerPool('test', fake_session, site.crawl, worker_count=1, adaptive=False, circuit_breaker=False,
+                           on_result=emitted.append, on_failure=lambda item, reason: failed.append((item, reason)),
+                           max_attempts=max_attempts)
+    items = ['ok_0', 'flaky1_1', 'flaky2_2', 'missing_3', 'raises_4']
+    print(f"🎯 재시도/백오프 테스트: {len(items)}곡, 최대 {max_attempts}회, 백오프 {RetrySettings.BACKOFF_BASE:g}초부터 2배")
+    results = pool.run(items)
+    
+    # 회차마다 실패한 곡만 입력 순서대로 다시 처리
+    expected_calls = items + ['flaky1_1', 'flaky2_2', 'missing_3', 'raises_4'] + ['flaky2_2', 'missing_3', 'raises_4']
+    assert [name for name, _ in site.calls] == expected_calls, f"처리 순서 불일치: {site.calls}"
+    
+    # 회차 사이 대기 시간: BACKOFF_BASE, BACKOFF_BASE × 2, ...
+    for item in ('flaky2_2', 'missing_3', 'raises_4'):
+        times = site.call_times(item)
+        for attempt in range(2, max_attempts + 1):
+            backoff = min(RetrySettings.BACKOFF_MAX, RetrySettings.BACKOFF_BASE * 2 ** (attempt - 2))
+            gap = times[attempt - 1] - times[attempt - 2]
+            assert gap >= backoff - TOLERANCE, f"{item} {attempt}회차 대기 {gap:.2f}초 < 백오프 {backoff:.2f}초"
+    
+    assert [result and result['song_id'] for result in results] == ['ok_0', 'flaky1_1', 'flaky2_2', None, None]
+    assert results[1]['attempt'] == 2 and results[2]['attempt'] == 3
+    assert [result['song_id'] for result in emitted] == ['ok_0', 'flaky1_1', 'flaky2_2']
+    assert pool.failed_items == [('missing_3', 'not_found'), ('raises_4', 'error')]
+    assert failed == pool.failed_items
+    assert pool.deferred_items == []
+    print(f"✅ 재시도 순서/백오프 확인 완료 (처리 {len(site.calls)}회, 실패 {pool.failed_items})")
+
+def test_not_found_does_not_trip_breaker():
+    """결과 없음(not_found)이 연속돼도 서킷 브레이커가 열리지 않아 뒤의 곡을 보류하지 않음"""
+    site = FakeSite()
+    pool = CrawlWorkerPool('test', fake_session, site.crawl, worker_count=1, adaptive=False, max_attempts=1)
+    pool.breaker = CircuitBreaker('test', failure_threshold=3, cooldown=60)
+    items = [f'missing_{i}' for i in range(6)] + ['ok_6']
+    results = pool.run(items)
+    
+    assert pool.breaker.state == CircuitBreaker.CLOSED, "결과 없음만으로 서킷 브레이커가 열리면 안 됨"
+    assert results[-1] and results[-1]['song_id'] == 'ok_6'
+    assert pool.deferred_items == []
+    assert {reason for _, reason in pool.failed_items} == {'not_found'}
+    print("✅ 결과 없음 연속 시 서킷 브레이커 closed 유지 확인 완료")
+
+def test_breaker_defers_and_probes(cooldown=0.5):
+    """차단(HTTP 429)이 연속되면 남은 곡을 보류하고, cooldown 후 첫 곡을 확인 요청으로 순차 재시도"""
+    site = FakeSite()
+    pool = CrawlWorkerPool('test', fake_session, site.crawl, worker_count=1, adaptive=False, max_attempts=2)
+    pool.breaker = CircuitBreaker('test', failure_threshold=3, cooldown=cooldown)
+    items = ['blocked_0', 'blocked_1', 'blocked_2', 'ok_3', 'ok_4']
+    results = pool.run(items)
+    
+    # 보류된 곡(ok_*)은 첫 회차에 크롤링하지 않고, 재시도 회차에 확인 요청(blocked_0) 다음으로 처리
+    assert [name for name, _ in site.calls] == items[:3] + items, f"처리 순서 불일치: {site.calls}"
+    gap = site.call_times('blocked_0')[1] - site.call_times('blocked_2')[0]
+    assert gap >= cooldown - TOLERANCE, f"cooldown 전에 확인 요청을 보냄 ({gap:.2f}초)"
+    assert pool.breaker.state == CircuitBreaker.CLOSED, "확인 요청 성공 후 closed로 복구되어야 함"
+    assert all(results), f"재시도 후 모두 성공해야 함: {results}"
+    assert pool.failed_items == []
+    print(f"✅ 서킷 브레이커 보류/확인 요청 확인 완료 (확인 요청까지 {gap:.2f}초)")
+
+if __name__ == "__main__":
+    test_retry_backoff()
+    test_not_found_does_not_trip_breaker()
+    test_breaker_defers_and_probes()
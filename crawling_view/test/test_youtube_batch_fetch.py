@@ -0,0 +1,103 @@
+"""
+YouTube asyncio 일괄 크롤러 테스트 (로컬 스텁 HTTP 서버 사용, 실제 YouTube/DB 접속 없음)
+"""
+import sys
+import os
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# 재시도 대기 시간을 줄여 테스트 (설정 import 전에 지정)
+os.environ.setdefault('CRAWL_RETRY_BACKOFF_BASE', '0.1')
+
+from crawling_view.view.youtube.youtube_async import YouTubeBatchFetcher
+
+# 스텁 서버 응답 지연(초) - 동시 요청이 실제로 겹치는지 확인용
+RESPONSE_DELAY = 0.2
+
+# 첫 요청에는 503을 응답하는 동영상 (재시도 확인용)
+_flaky_seen = set()
+_flaky_lock = threading.Lock()
+
+def make_watch_page(video_id):
+    """실제 동영상 페이지처럼 ytInitialPlayerResponse / ytInitialData가 내장된 HTML 생성"""
+    if video_id.startswith('unavailable'):
+        player_response = {'playabilityStatus': {'status': 'ERROR'}}
+        return f'<script>var ytInitialPlayerResponse = {json.dumps(player_response)};</script>'
+    
+    number = int(video_id.rsplit('_', 1)[1])
+    player_response = {
+        'playabilityStatus': {'status': 'OK'},
+        'videoDetails': {'videoId': video_id, 'title': f'테스트 곡 {number} (Official MV)', 'viewCount': str(1000 + number)},
+        'microformat': {'playerMicroformatRenderer': {'publishDate': f'2024-01-{number % 28 + 1:02d}T00:00:00-08:00'}},
+    }
+    padding = 'x' * 50000  # 실제 페이지처럼 큰 HTML
+    return (f'<html><head><script>{padding}</script></head><body>'
+            f'<script>var ytInitialPlayerResponse = {json.dumps(player_response, ensure_ascii=False)};var meta = {{}};</script>'
+            f'<script>var ytInitialData = {{"contents": {{}}}};</script></body></html>')
+
+class StubWatchPageHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive (연결 재사용 확인)
+    
+    def do_GET(self):
+        video_id = parse_qs(urlsplit(self.path).query).get('v', [''])[0]
+        with _flaky_lock:
+            flaky_first = video_id.startswith('flaky') and video_id not in _flaky_seen
+            _flaky_seen.add(video_id)
+        if video_id.startswith('missing'):
+            body = b'not found'
+            self.send_response(404)
+        elif flaky_first:
+            body = b'unavailable'
+            self.send_response(503)
+        else:
+            time.sleep(RESPONSE_DELAY)
+            body = make_watch_page(video_id).encode('utf-8')
+            self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+def test_batch_fetch(count=200, concurrency=16):
+    """스텁 서버의 동영상 페이지 count개를 동시 요청해 결과 확인"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubWatchPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/watch?v="
+    
+    items = [(f"{base_url}video_{i}", f"아티스트 {i}", f"song_{i}") for i in range(count)]
+    items.append((f"{base_url}unavailable_0", "아티스트", "song_unavailable"))
+    items.append((f"{base_url}missing_0", "아티스트", "song_missing"))
+    items.append((f"{base_url}flaky_1", "아티스트", "song_flaky"))
+    
+    print(f"🎯 YouTube 일괄 요청 테스트: {len(items)}개 URL, 동시 {concurrency}개")
+    fetcher = YouTubeBatchFetcher(concurrency=concurrency, host_rate=0, fallback=False)
+    started_at = time.monotonic()
+    results = fetcher.fetch(items)
+    elapsed = time.monotonic() - started_at
+    server.shutdown()
+    
+    print(f"소요 시간: {elapsed:.1f}초 (순차 요청 시 최소 {len(items) * RESPONSE_DELAY:.1f}초)")
+    print(f"성공: {len(results)}개, 실패: {len(fetcher.failed_items)}개")
+    
+    assert list(results) == [song_id for _, _, song_id in items[:count]] + ['song_flaky'], "입력 순서/성공 목록 불일치"
+    assert results['song_flaky']['views'] == 1001, "재시도 후 성공해야 함"
+    assert results['song_7']['views'] == 1007
+    assert results['song_7']['upload_date'] == '2024.01.08'
+    assert results['song_7']['song_name'] == '테스트 곡 7 (Official MV)'
+    assert results['song_7']['listeners'] == -1
+    assert {item[2] for item, reason in fetcher.failed_items} == {'song_unavailable', 'song_missing'}
+    print("✅ 결과 매핑 확인 완료")
+    print(f"  예시: {results['song_7']}")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        test_batch_fetch(int(sys.argv[1]))
+    else:
+        test_batch_fetch()
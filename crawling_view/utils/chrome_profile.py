@@ -0,0 +1,86 @@
+"""
+워커 슬롯별 영구 Chrome 프로필 (--user-data-dir)
+
+시크릿 모드 드라이버는 종료와 함께 로그인 세션이 사라지므로 YouTube Music은 매 실행마다 로그인해야 한다.
+슬롯별 프로필 디렉토리를 유지하면 한 번 로그인한 세션이 호스트에 남아 다음 실행은 로그인 과정을 건너뛴다.
+Chrome은 한 프로필을 두 프로세스가 동시에 쓸 수 없으므로 프로필마다 잠금 파일로 독점 사용을 보장한다.
+- 스레드 간: 사용 중인 프로필 집합
+- 프로세스 간: 잠금 파일 + fcntl.flock (fcntl이 없는 OS에서는 프로세스 내부에서만 보장)
+"""
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from crawling_view.utils.constants import ChromeProfileSettings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_in_use = set()
+_in_use_lock = threading.Lock()
+
+def _try_lock(profile_dir):
+    """
+    프로필 잠금 시도 (다른 스레드/프로세스가 사용 중이면 None)
+    
+    Returns:
+        file: 잠금 파일 객체 (fcntl이 없으면 None이 아닌 True)
+    """
+    with _in_use_lock:
+        if profile_dir in _in_use:
+            return None
+        
+        lock_file = True
+        if fcntl:
+            lock_file = open(f"{profile_dir}.lock", 'a+')
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return None
+        
+        _in_use.add(profile_dir)
+        return lock_file
+
+def _unlock(profile_dir, lock_file):
+    with _in_use_lock:
+        _in_use.discard(profile_dir)
+        if fcntl and lock_file is not True:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+@contextmanager
+def acquire_profile(platform, slot):
+    """
+    워커 슬롯의 영구 프로필 디렉토리를 독점 사용 (사용 중이면 다음 슬롯 프로필 사용)
+    
+    Args:
+        platform (str): 플랫폼명 (프로필 디렉토리 이름)
+        slot (int): 워커 슬롯 번호
+    
+    Yields:
+        str: Chrome --user-data-dir 로 사용할 디렉토리 경로
+    """
+    os.makedirs(ChromeProfileSettings.BASE_DIR, exist_ok=True)
+    
+    profile_dir = lock_file = None
+    for candidate in range(slot, slot + ChromeProfileSettings.MAX_SLOTS):
+        path = os.path.abspath(os.path.join(ChromeProfileSettings.BASE_DIR, f"{platform}-{candidate}"))
+        lock_file = _try_lock(path)
+        if lock_file:
+            profile_dir = path
+            break
+    
+    if not profile_dir:
+        raise Exception(f"사용 가능한 {platform} Chrome 프로필이 없습니다 (슬롯 {slot}~{slot + ChromeProfileSettings.MAX_SLOTS - 1} 모두 사용 중)")
+    
+    os.makedirs(profile_dir, exist_ok=True)
+    logger.info(f"🗄️ {platform} 영구 프로필 사용: {profile_dir}")
+    try:
+        yield profile_dir
+    finally:
+        _unlock(profile_dir, lock_file)
@@ -0,0 +1,88 @@
+"""
+플랫폼별 서킷 브레이커
+
+마크업 변경/차단 등으로 플랫폼 전체가 실패하고 있을 때, 남은 곡마다
+검색 재시도와 요소 대기 시간을 다 쓰지 않도록 빠르게 실패(보류) 처리한다.
+
+closed ──(연속 실패 N회)──▶ open ──(cooldown 경과)──▶ half_open (확인 요청 1건)
+  ▲                                                      │
+  └──────────────(확인 요청 성공)──────────────────────────┘
+                 (확인 요청 실패 → 다시 open)
+"""
+import logging
+import threading
+import time
+from crawling_view.utils.constants import CircuitBreakerSettings
+
+logger = logging.getLogger(__name__)
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커 (스레드 안전)
+    """
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, platform, failure_threshold=None, cooldown=None):
+        """
+        Args:
+            platform (str): 플랫폼명 (로그용)
+            failure_threshold (int, optional): 차단까지 연속 실패 횟수. None이면 CircuitBreakerSettings 사용
+            cooldown (float, optional): 차단 후 확인 요청까지 대기 시간(초). None이면 CircuitBreakerSettings 사용
+        """
+        self.platform = platform
+        self.failure_threshold = max(1, failure_threshold or CircuitBreakerSettings.FAILURE_THRESHOLD)
+        self.cooldown = CircuitBreakerSettings.COOLDOWN if cooldown is None else cooldown
+        self.state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+    
+    def allow(self):
+        """
+        요청 허용 여부
+        
+        open 상태에서 cooldown이 지나면 확인 요청(half-open) 1건만 허용한다.
+        
+        Returns:
+            bool: 요청해도 되면 True, 빠르게 실패(보류) 처리해야 하면 False
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.time_until_probe() <= 0:
+                self.state = self.HALF_OPEN
+                logger.info(f"🔌 {self.platform} 서킷 브레이커 확인 요청 (half-open)")
+                return True
+            return False
+    
+    def record_success(self):
+        """요청 성공 기록 (확인 요청 성공 시 차단 해제)"""
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"✅ {self.platform} 서킷 브레이커 복구 (closed)")
+            self.state = self.CLOSED
+            self._consecutive_failures = 0
+    
+    def record_failure(self):
+        """요청 실패 기록 (연속 실패가 기준을 넘거나 확인 요청이 실패하면 차단)"""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self.state == self.HALF_OPEN:
+                self._open("확인 요청 실패")
+            elif self.state == self.CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._open(f"연속 실패 {self._consecutive_failures}회")
+    
+    def time_until_probe(self):
+        """
+        다음 확인 요청까지 남은 시간(초). closed 상태면 0
+        """
+        if self.state == self.CLOSED or self._opened_at is None:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+    
+    def _open(self, reason):
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        logger.warning(f"⛔ {self.platform} 서킷 브레이커 차단 (open): {reason}, 남은 곡은 보류 후 재시도")
@@ -0,0 +1,153 @@
+"""
+플랫폼 내부 동시성 자동 조절 (AIMD: additive increase, multiplicative decrease)
+
+곡 단위 처리 결과(성공/실패 종류, 처리 시간)를 받아
+- 차단성 오류 비율과 p95 처리 시간이 건강하면 워커 수를 1씩 늘리고
+- CAPTCHA, HTTP 429/403, 타임아웃이 급증하거나 p95가 느려지면 워커 수를 절반으로 줄인다.
+"""
+import logging
+import threading
+from crawling_view.utils.constants import ConcurrencySettings
+
+logger = logging.getLogger(__name__)
+
+# 플랫폼이 요청 속도를 제한하고 있다는 신호로 보는 오류 종류
+THROTTLE_ERRORS = {'captcha', 'http_429', 'http_403', 'timeout'}
+
+# 차단/봇 확인 페이지 판별 문구
+BLOCK_PAGE_MARKERS = ['captcha', 'unusual traffic', '비정상적인 트래픽', '자동화된 요청', '로봇이 아닙니다']
+
+def classify_exception(error):
+    """
+    예외를 오류 종류로 분류
+    
+    Args:
+        error (Exception): 발생한 예외
+    
+    Returns:
+        str: 'timeout' 또는 'error'
+    """
+    return 'timeout' if 'timeout' in type(error).__name__.lower() else 'error'
+
+def detect_block_page(driver):
+    """
+    현재 페이지가 CAPTCHA/차단 페이지인지 확인
+    
+    Args:
+        driver: Selenium WebDriver
+    
+    Returns:
+        str: 차단 페이지면 'captcha', 아니면 None
+    """
+    try:
+        page_source = driver.page_source.lower()
+    except Exception:
+        return None
+    return 'captcha' if any(marker in page_source for marker in BLOCK_PAGE_MARKERS) else None
+
+def classify_failure(driver=None):
+    """
+    결과 없이 끝난(None) 곡의 실패 종류 추정
+    
+    처리 시간만으로는 타임아웃으로 보지 않는다. 느리지만 정상적으로 '결과 없음'으로 끝난 곡이
+    제한 신호로 집계되지 않도록, 타임아웃은 예외 종류(classify_exception)나 크롤러가 기록한
+    last_error로만 판단한다.
+    
+    Args:
+        driver (optional): Selenium WebDriver (차단 페이지 확인용)
+    
+    Returns:
+        str: 'captcha' 또는 'not_found'
+    """
+    if driver is not None:
+        block = detect_block_page(driver)
+        if block:
+            return block
+    return 'not_found'
+
+def _percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(ratio * (len(ordered) - 1) + 0.5))]
+
+class AIMDController:
+    """
+    곡 처리 결과로 목표 워커 수(limit)를 조절하는 AIMD 컨트롤러 (스레드 안전)
+    """
+    
+    def __init__(self, platform, initial, minimum=1, maximum=None, window=None,
+                 max_error_rate=None, max_p95_latency=None, decrease_factor=None):
+        """
+        Args:
+            platform (str): 플랫폼명 (로그용)
+            initial (int): 시작 워커 수
+            minimum (int): 최소 워커 수
+            maximum (int, optional): 최대 워커 수. None이면 ConcurrencySettings 사용
+            window (int, optional): 판단 구간(곡 수)
+            max_error_rate (float, optional): 차단성 오류 허용 비율
+            max_p95_latency (float, optional): p95 처리 시간 허용치(초)
+            decrease_factor (float, optional): 감소 배율
+        """
+        self.platform = platform
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum or ConcurrencySettings.MAX_WORKERS.get(platform, initial))
+        self.window = max(1, window or ConcurrencySettings.WINDOW)
+        self.max_error_rate = ConcurrencySettings.MAX_ERROR_RATE if max_error_rate is None else max_error_rate
+        self.max_p95_latency = max_p95_latency or ConcurrencySettings.MAX_P95_LATENCY.get(platform, 30)
+        self.decrease_factor = decrease_factor or ConcurrencySettings.DECREASE_FACTOR
+        self._limit = min(self.maximum, max(self.minimum, int(initial or 1)))
+        self._latencies = []
+        self._throttled = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def limit(self):
+        """현재 목표 워커 수"""
+        return self._limit
+    
+    def record(self, latency, error_kind=None):
+        """
+        곡 하나의 처리 결과 기록
+        
+        Args:
+            latency (float): 곡 처리 시간(초)
+            error_kind (str, optional): 실패 종류 (성공이면 None)
+        
+        Returns:
+            int: 기록 후 목표 워커 수
+        """
+        with self._lock:
+            self._latencies.append(latency)
+            if error_kind in THROTTLE_ERRORS:
+                self._throttled += 1
+            
+            # 구간은 최소 현재 워커 수만큼은 되어야 모든 워커의 결과가 반영된다
+            window = max(self.window, self._limit)
+            error_limit = self.max_error_rate * window
+            
+            if self._throttled > error_limit:
+                # 차단성 오류 급증 → 구간이 끝나기 전이라도 즉시 감소
+                self._decrease(f"차단성 오류 {self._throttled}건 ({error_kind})")
+            elif len(self._latencies) >= window:
+                p95 = _percentile(self._latencies, 0.95)
+                if p95 > self.max_p95_latency:
+                    self._decrease(f"p95 처리 시간 {p95:.1f}초")
+                else:
+                    self._increase(p95)
+            return self._limit
+    
+    def _increase(self, p95):
+        if self._limit < self.maximum:
+            self._limit += 1
+            logger.info(f"📈 {self.platform} 워커 수 증가 → {self._limit}개 (p95 {p95:.1f}초, 차단성 오류 {self._throttled}건)")
+        self._reset()
+    
+    def _decrease(self, reason):
+        new_limit = max(self.minimum, int(self._limit * self.decrease_factor))
+        if new_limit < self._limit:
+            logger.warning(f"📉 {self.platform} 워커 수 감소 {self._limit} → {new_limit}개 ({reason})")
+            self._limit = new_limit
+        self._reset()
+    
+    def _reset(self):
+        self._latencies = []
+        self._throttled = 0
@@ -1,6 +1,7 @@
 """
 크롤링에서 사용하는 상수 정의
 """
+import os
 
 # Genie 관련 셀렉터
 class GenieSelectors:
@@ -41,6 +42,8 @@ class GenieSelectors:
     # 검색 결과 테이블 관련
     SEARCH_RESULTS_TABLE = "table.list-wrap"
     RESULT_ROWS = "tr.list__item"
+    RESULT_TITLE_SELECTORS = ["td.info a.title", "a.title", "td.info a.link__text"]  # 검색 결과 행의 곡명
+    RESULT_ARTIST_SELECTORS = ["td.info a.artist", "a.artist"]  # 검색 결과 행의 아티스트명
     TITLE_COLUMN = "td.info"
     ARTIST_COLUMN = "td.info"
     COUNT_COLUMN = "td.count"
@@ -112,6 +115,9 @@ class CommonSettings:
         '--disable-extensions',
         '--disable-popup-blocking',
         '--disable-notifications',
+        '--disable-background-timer-throttling',  # 백그라운드 탭도 렌더링/타이머를 늦추지 않도록 (탭 멀티플렉싱)
+        '--disable-backgrounding-occluded-windows',
+        '--disable-renderer-backgrounding',
         '--lang=ko_KR',
         '--log-level=3',
         '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -137,8 +143,26 @@ INVALID_FILENAME_CHARS = r'[\\/:*?"<>|]'
 # Genie 전용 설정
 class GenieSettings:
     MAX_SEARCH_ATTEMPTS = 5
-    MAX_PARSE_ATTEMPTS = 6
     BASE_URL = "https://www.genie.co.kr/" 
+    # 검색/곡 정보 페이지를 HTTP로 직접 받아 파싱 (페이지 구조를 인식하지 못하면 Selenium으로 대체)
+    HTTP_ENABLED = os.getenv('GENIE_HTTP_ENABLED', 'True').lower() == 'true'
+    HTTP_TIMEOUT = float(os.getenv('GENIE_HTTP_TIMEOUT', '10'))
+
+class YouTubeSettings:
+    # 동영상 페이지를 HTTP로 받아 내장된 ytInitialPlayerResponse JSON만 파싱 (인식하지 못하면 Selenium으로 대체)
+    HTTP_ENABLED = os.getenv('YOUTUBE_HTTP_ENABLED', 'True').lower() == 'true'
+    HTTP_TIMEOUT = float(os.getenv('YOUTUBE_HTTP_TIMEOUT', '10'))
+    # asyncio 일괄 요청 (Chrome 대신 asyncio가 관리하는 스레드 풀에서 HTTP로 동영상 페이지를 동시에 요청)
+    # CrawlWorkerPool을 거치지 않으므로 서킷 브레이커/워커 수 자동 조절 없이 동시 요청 수와 호스트별 속도 제한만 적용
+    ASYNC_ENABLED = os.getenv('YOUTUBE_ASYNC_ENABLED', 'False').lower() == 'true'
+    ASYNC_CONCURRENCY = int(os.getenv('YOUTUBE_ASYNC_CONCURRENCY', '16'))
+    # 요청 하나의 전체 제한 시간(초, 연결/응답 대기 포함)
+    ASYNC_TIMEOUT = float(os.getenv('YOUTUBE_ASYNC_TIMEOUT', '30'))
+    # 호스트별 초당 요청 수/버스트 (0 이하이면 제한 없음)
+    # 일괄 요청 처리량은 이 값을 넘지 못한다 (동시 요청 수를 늘려도 초당 ASYNC_HOST_RATE개가 상한).
+    # Selenium 페이지 로드용 YOUTUBE_RATE_LIMIT(1.0/s)와 따로 두어, HTTP 요청은 더 높은 속도로 보낸다
+    ASYNC_HOST_RATE = float(os.getenv('YOUTUBE_ASYNC_HOST_RATE', '8.0'))
+    ASYNC_HOST_BURST = int(os.getenv('YOUTUBE_ASYNC_HOST_BURST', '16'))
 
 class FilePaths:
     """파일 경로 상수"""
@@ -148,4 +172,234 @@ class FilePaths:
     # CSV 파일 컬럼
     GENIE_COLUMNS = ['song_id','artist_name','song_title','total_person_count', 'views', 'crawl_date']
     YOUTUBE_MUSIC_COLUMNS = ['song_id','artist_name','song_title','views', 'crawl_date']
-    YOUTUBE_COLUMNS = ['song_id','artist_name','song_title','views', 'youtube_url', 'upload_date', 'crawl_date'] 
\ No newline at end of file
+    YOUTUBE_COLUMNS = ['song_id','artist_name','song_title','views', 'youtube_url', 'upload_date', 'crawl_date'] 
+
+class ParallelSettings:
+    """병렬 실행 관련 설정 (.env로 재정의 가능)"""
+    # 플랫폼 단위 동시 실행 여부 및 최대 동시 실행 플랫폼 수
+    PARALLEL_PLATFORMS = os.getenv('CRAWLING_PARALLEL_PLATFORMS', 'False').lower() == 'true'
+    MAX_PARALLEL_PLATFORMS = int(os.getenv('CRAWLING_MAX_PARALLEL_PLATFORMS', '4'))
+    
+    # 플랫폼 내부 워커(독립 Chrome 드라이버 / requests 세션) 수
+    PLATFORM_WORKERS = {
+        'genie': int(os.getenv('GENIE_WORKERS', '1')),
+        'youtube': int(os.getenv('YOUTUBE_WORKERS', '1')),
+        'youtube_music': int(os.getenv('YOUTUBE_MUSIC_WORKERS', '1')),
+        'melon': int(os.getenv('MELON_WORKERS', '1')),
+    }
+    
+    # 워커(Chrome 드라이버) 하나가 동시에 사용하는 탭 수 (1이면 탭 멀티플렉싱 안 함)
+    TABS_PER_DRIVER = {
+        'genie': int(os.getenv('GENIE_TABS', '1')),
+        'youtube': int(os.getenv('YOUTUBE_TABS', '1')),
+    }
+
+class PipelineSettings:
+    """크롤링 → 저장 스트리밍 파이프라인 설정"""
+    QUEUE_SIZE = int(os.getenv('PIPELINE_QUEUE_SIZE', '100'))  # 싱크별 대기 큐 크기 (가득 차면 크롤러가 대기)
+    BATCH_SIZE = int(os.getenv('PIPELINE_BATCH_SIZE', '20'))  # 마이크로 배치 크기
+    FLUSH_INTERVAL = float(os.getenv('PIPELINE_FLUSH_INTERVAL', '30'))  # 배치가 덜 찼어도 저장하는 최대 대기 시간(초)
+
+class TaskQueueSettings:
+    """DB 기반 분산 작업 큐 설정"""
+    CLAIM_BATCH_SIZE = int(os.getenv('TASK_CLAIM_BATCH_SIZE', '10'))  # 한 번에 임대하는 작업 수
+    LEASE_SECONDS = int(os.getenv('TASK_LEASE_SECONDS', '1800'))  # 임대 유지 시간(초). 배치 하나를 처리하는 시간보다 길어야 함
+    MAX_ATTEMPTS = int(os.getenv('TASK_MAX_ATTEMPTS', '3'))  # 최대 시도 횟수 (초과 시 failed)
+    POLL_INTERVAL = float(os.getenv('TASK_POLL_INTERVAL', '30'))  # 다른 워커의 작업이 끝나기를 기다리는 간격(초)
+
+class RateLimitSettings:
+    """플랫폼별 요청 속도 제한 (토큰 버킷, 같은 호스트의 모든 스레드/프로세스 공유)"""
+    # 초당 요청 수 (곡 1개 검색/조회 = 요청 1회)
+    RATES = {
+        'genie': float(os.getenv('GENIE_RATE_LIMIT', '0.5')),
+        'youtube_music': float(os.getenv('YOUTUBE_MUSIC_RATE_LIMIT', '0.5')),
+        'youtube': float(os.getenv('YOUTUBE_RATE_LIMIT', '1.0')),
+        'melon': float(os.getenv('MELON_RATE_LIMIT', '1.0')),
+    }
+    # 순간적으로 허용하는 최대 연속 요청 수
+    BURSTS = {
+        'genie': int(os.getenv('GENIE_RATE_BURST', '2')),
+        'youtube_music': int(os.getenv('YOUTUBE_MUSIC_RATE_BURST', '2')),
+        'youtube': int(os.getenv('YOUTUBE_RATE_BURST', '3')),
+        'melon': int(os.getenv('MELON_RATE_BURST', '3')),
+    }
+    # 프로세스 간 버킷 상태 공유 디렉토리 (None이면 시스템 임시 디렉토리)
+    STATE_DIR = os.getenv('RATE_LIMIT_STATE_DIR')
+
+class ConcurrencySettings:
+    """플랫폼 내부 워커 수 자동 조절(AIMD) 설정"""
+    ADAPTIVE = os.getenv('CRAWLING_ADAPTIVE_CONCURRENCY', 'False').lower() == 'true'
+    # 자동 조절 시 최대 워커 수 (시작값은 ParallelSettings.PLATFORM_WORKERS)
+    MAX_WORKERS = {
+        'genie': int(os.getenv('GENIE_MAX_WORKERS', '4')),
+        'youtube': int(os.getenv('YOUTUBE_MAX_WORKERS', '4')),
+        'youtube_music': int(os.getenv('YOUTUBE_MUSIC_MAX_WORKERS', '3')),
+        'melon': int(os.getenv('MELON_MAX_WORKERS', '4')),
+    }
+    # 판단 구간(곡 수). 구간이 끝날 때마다 증가/감소 여부 결정
+    WINDOW = int(os.getenv('AIMD_WINDOW', '10'))
+    # 차단성 오류(CAPTCHA, HTTP 429/403, 타임아웃) 허용 비율. 넘으면 워커 수를 DECREASE_FACTOR배로 감소
+    MAX_ERROR_RATE = float(os.getenv('AIMD_MAX_ERROR_RATE', '0.1'))
+    DECREASE_FACTOR = float(os.getenv('AIMD_DECREASE_FACTOR', '0.5'))
+    # 곡당 처리 시간 p95 허용치(초). 넘으면 감소
+    MAX_P95_LATENCY = {
+        'genie': float(os.getenv('GENIE_MAX_P95_LATENCY', '20')),
+        'youtube': float(os.getenv('YOUTUBE_MAX_P95_LATENCY', '20')),
+        'youtube_music': float(os.getenv('YOUTUBE_MUSIC_MAX_P95_LATENCY', '30')),
+        'melon': float(os.getenv('MELON_MAX_P95_LATENCY', '3')),
+    }
+
+class CircuitBreakerSettings:
+    """플랫폼별 서킷 브레이커 설정"""
+    ENABLED = os.getenv('CIRCUIT_BREAKER_ENABLED', 'True').lower() == 'true'
+    FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_BREAKER_FAILURE_THRESHOLD', '5'))  # 연속 실패 N회 시 차단
+    COOLDOWN = float(os.getenv('CIRCUIT_BREAKER_COOLDOWN', '60'))  # 차단 후 확인(half-open) 요청까지 대기 시간(초)
+
+class SchedulerSettings:
+    """플랫폼별 크롤링 순서(우선순위) 설정"""
+    ENABLED = os.getenv('CRAWL_PRIORITY_ENABLED', 'True').lower() == 'true'
+    HISTORY_DAYS = int(os.getenv('CRAWL_PRIORITY_HISTORY_DAYS', '7'))  # 증가율 계산에 사용하는 최근 기간(일)
+    STALENESS_CAP_DAYS = float(os.getenv('CRAWL_PRIORITY_STALENESS_CAP_DAYS', '3'))  # 이 이상 오래된 곡은 같은 점수
+    # 점수 가중치: 마지막 성공 이후 경과 시간 / 최근 조회수 증가율 / 크롤링 기간 종료 임박도
+    STALENESS_WEIGHT = float(os.getenv('CRAWL_PRIORITY_STALENESS_WEIGHT', '0.5'))
+    VELOCITY_WEIGHT = float(os.getenv('CRAWL_PRIORITY_VELOCITY_WEIGHT', '0.3'))
+    DEADLINE_WEIGHT = float(os.getenv('CRAWL_PRIORITY_DEADLINE_WEIGHT', '0.2'))
+
+class CadenceSettings:
+    """조회수 변화가 적은 곡의 크롤링 주기 조절 설정"""
+    ENABLED = os.getenv('CRAWL_CADENCE_ENABLED', 'False').lower() == 'true'
+    # 주기 조절을 적용할 플랫폼 (쉼표 구분)
+    PLATFORMS = [p.strip() for p in os.getenv('CRAWL_CADENCE_PLATFORMS', 'melon,genie').split(',') if p.strip()]
+    # 하루 조회수 증가율이 이 값(0.001 = 0.1%) 미만이면 누적 변화가 이 값에 도달하는 간격으로 크롤링
+    MIN_DAILY_GROWTH = float(os.getenv('CRAWL_CADENCE_MIN_DAILY_GROWTH', '0.001'))
+    MAX_GAP_DAYS = int(os.getenv('CRAWL_CADENCE_MAX_GAP_DAYS', '7'))  # 아무리 변화가 없어도 이 간격 안에는 크롤링
+    MIN_HISTORY_DAYS = int(os.getenv('CRAWL_CADENCE_MIN_HISTORY_DAYS', '3'))  # 증가율을 믿을 수 있는 최소 이력 기간(일)
+    HISTORY_DAYS = int(os.getenv('CRAWL_CADENCE_HISTORY_DAYS', '14'))  # 증가율 계산에 사용하는 최근 기간(일)
+
+class RetrySettings:
+    """실패 곡 재시도 설정 (플랫폼별 크롤링이 끝난 뒤 실패 곡만 다시 처리)"""
+    MAX_ATTEMPTS = int(os.getenv('CRAWL_RETRY_MAX_ATTEMPTS', '3'))  # 곡당 최대 시도 횟수 (첫 시도 포함)
+    BACKOFF_BASE = float(os.getenv('CRAWL_RETRY_BACKOFF_BASE', '10'))  # 첫 재시도 전 대기 시간(초), 재시도마다 2배
+    BACKOFF_MAX = float(os.getenv('CRAWL_RETRY_BACKOFF_MAX', '120'))  # 재시도 전 최대 대기 시간(초)
+
+class DriverPoolSettings:
+    """Chrome 드라이버 풀 설정 (로그인이 필요 없는 플랫폼의 드라이버 재사용)"""
+    ENABLED = os.getenv('DRIVER_POOL_ENABLED', 'True').lower() == 'true'
+    MAX_SIZE = int(os.getenv('DRIVER_POOL_MAX_SIZE', '4'))  # 반납 후 대기시켜 둘 최대 드라이버 수
+    IDLE_TIMEOUT = float(os.getenv('DRIVER_POOL_IDLE_TIMEOUT', '1800'))  # 이 시간(초) 이상 쓰이지 않은 드라이버는 종료
+
+class ChromeDriverSettings:
+    """chromedriver 경로 결정 설정 (설정 경로 → 버전별 캐시 → ChromeDriverManager)"""
+    PATH = os.getenv('CHROMEDRIVER_PATH')  # 로컬 chromedriver 경로 (폐쇄망 워커용)
+    CACHE_DIR = os.getenv('CHROMEDRIVER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'crawling_chromedriver'))
+    # 페이지 로드 전략 (eager: DOMContentLoaded 시점에 반환, 이후 렌더링은 조건 대기로 처리)
+    PAGE_LOAD_STRATEGY = os.getenv('CHROME_PAGE_LOAD_STRATEGY', 'eager')
+    # 버전 확인에 사용하는 Chrome 실행 파일 후보 (CHROME_BINARY 우선)
+    CHROME_BINARIES = [binary for binary in [
+        os.getenv('CHROME_BINARY'),
+        'google-chrome',
+        'google-chrome-stable',
+        'chromium',
+        'chromium-browser',
+        '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    ] if binary]
+
+class NetworkProfileSettings:
+    """Selenium 네트워크 리소스 차단 및 페이지 측정 설정"""
+    BLOCKING_ENABLED = os.getenv('NETWORK_BLOCKING_ENABLED', 'True').lower() == 'true'  # 이미지/폰트/미디어/광고 차단
+    METRICS_ENABLED = os.getenv('PAGE_METRICS_ENABLED', 'True').lower() == 'true'  # 페이지 로드 시간/전송량 측정
+
+class PacingSettings:
+    """의도적 지연(pacing) 프로필 설정. 조건 대기와 별개로 사람처럼 보이기 위한 지연만 포함"""
+    PROFILE = os.getenv('CRAWL_PACING_PROFILE', 'default')
+    # 단계별 (최소, 최대) 지연 시간(초)
+    PROFILES = {
+        'none': {},
+        'default': {
+            'login': (CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX),  # 로그인 입력 단계 사이
+        },
+        'human': {
+            'login': (CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX),
+            'typing': (0.3, 0.8),  # 검색어 입력 전후
+            'search': (CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX),  # 검색 결과 확인 후
+        },
+    }
+
+class DriverHealthSettings:
+    """워커 드라이버 상태 감시 및 자동 교체 설정"""
+    ENABLED = os.getenv('DRIVER_HEALTH_ENABLED', 'True').lower() == 'true'
+    MAX_PAGES = int(os.getenv('DRIVER_MAX_PAGES', '300'))  # 드라이버당 최대 페이지 수 (초과 시 교체, 0이면 무제한)
+    MAX_RENDERER_RSS_MB = float(os.getenv('DRIVER_MAX_RENDERER_RSS_MB', '1500'))  # 렌더러 프로세스 RSS 합계 상한(MB, 0이면 확인 안 함)
+    RSS_CHECK_INTERVAL = int(os.getenv('DRIVER_RSS_CHECK_INTERVAL', '20'))  # RSS 확인 주기(페이지 수)
+    LATENCY_WINDOW = int(os.getenv('DRIVER_LATENCY_WINDOW', '10'))  # 기준/최근 지연 시간 비교 구간(곡 수)
+    LATENCY_DRIFT_FACTOR = float(os.getenv('DRIVER_LATENCY_DRIFT_FACTOR', '2.0'))  # 최근 지연이 기준의 N배가 되면 교체
+
+class ChromeProfileSettings:
+    """영구 Chrome 프로필 설정 (YouTube Music 로그인 세션 유지)"""
+    YOUTUBE_MUSIC_PERSISTENT = os.getenv('YOUTUBE_MUSIC_PERSISTENT_PROFILE', 'False').lower() == 'true'
+    BASE_DIR = os.getenv('CHROME_PROFILE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'crawling_chrome_profiles'))
+    MAX_SLOTS = int(os.getenv('CHROME_PROFILE_MAX_SLOTS', '8'))  # 슬롯 프로필이 사용 중일 때 찾아볼 프로필 수
+
+class LaunchProfileSettings:
+    """
+    Chrome 실행 프로필 설정
+    
+    모든 프로필은 CommonSettings.CHROME_OPTIONS / CHROME_EXPERIMENTAL_OPTIONS 를 기반으로 하고
+    프로필별로 헤드리스 여부, 창 크기, 렌더러 프로세스 수, 디스크 캐시, 추가/제외 플래그만 바꾼다.
+    (--incognito 는 create_driver의 incognito/user_data_dir 인자로 결정)
+    """
+    DEFAULT = os.getenv('CHROME_LAUNCH_PROFILE', 'default')
+    # 플랫폼별 프로필 (지정하지 않으면 DEFAULT)
+    PLATFORM_PROFILES = {
+        'genie': os.getenv('GENIE_LAUNCH_PROFILE'),
+        'youtube': os.getenv('YOUTUBE_LAUNCH_PROFILE'),
+        'youtube_music': os.getenv('YOUTUBE_MUSIC_LAUNCH_PROFILE'),  # 수동 로그인이 필요하면 화면이 있는 프로필 사용
+        'melon': os.getenv('MELON_LAUNCH_PROFILE'),
+    }
+    PROFILES = {
+        # 기존 동작: 화면 표시, 1920x1080 최대화 (기존 create_driver처럼 캐시/메모리 플래그는 넘기지 않음)
+        'default': {
+            'headless': False,
+            'window_size': '1920,1080',
+            'start_maximized': True,
+            'remove_options': ['--disable-application-cache', '--disable-cache', '--disable-offline-load-stale-cache',
+                               '--media-cache-size=0', '--aggressive-cache-discard', '--memory-pressure-off',
+                               '--max_old_space_size=4096'],
+        },
+        # 서버에서 워커를 많이 띄우기 위한 헤드리스 저메모리 프로필
+        'headless-lowmem': {
+            'headless': True,
+            'window_size': '1280,800',
+            'renderer_process_limit': 2,
+            'disk_cache_size': 0,
+            'extra_options': [
+                '--disable-features=site-per-process,IsolateOrigins,Translate,MediaRouter,OptimizationHints',
+                '--js-flags=--max-old-space-size=512',
+                '--blink-settings=imagesEnabled=false',
+                '--mute-audio',
+                '--no-first-run',
+                '--disable-background-networking',
+                '--disable-component-update',
+                '--disable-default-apps',
+                '--disable-sync',
+            ],
+            'remove_options': ['--memory-pressure-off', '--max_old_space_size=4096'],
+        },
+        # 셀렉터 디버깅용: 화면 표시, 개발자 도구 자동 실행, Chrome 로그 출력, 캐시 사용
+        'headed-debug': {
+            'headless': False,
+            'window_size': '1920,1080',
+            'start_maximized': True,
+            'extra_options': ['--auto-open-devtools-for-tabs', '--enable-logging=stderr', '--v=1'],
+            'remove_options': ['--log-level=3', '--disable-cache', '--disable-application-cache',
+                               '--media-cache-size=0', '--aggressive-cache-discard'],
+        },
+        # 봇 탐지가 민감한 경우: 헤드리스지만 일반 Chrome과 같은 창 크기/언어/navigator 값을 사용
+        'stealth': {
+            'headless': True,
+            'window_size': '1920,1080',
+            'disk_cache_size': 0,
+            'extra_options': ['--accept-lang=ko-KR,ko', '--disable-features=Translate'],
+            'stealth_scripts': True,
+        },
+    }
@@ -3,56 +3,149 @@ Chrome WebDriver 설정 및 관리
 """
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from contextlib import contextmanager
 import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+from crawling_view.utils.constants import ChromeDriverSettings
+from crawling_view.utils.network_profile import apply_network_profile
+from crawling_view.utils.launch_profile import get_launch_profile_name, build_chrome_options, apply_stealth_scripts
 
 logger = logging.getLogger(__name__)
 
-@contextmanager
-def setup_driver(headless=False, incognito=True):
+# 프로세스당 한 번만 결정한 chromedriver 경로 (풀의 모든 드라이버가 공유)
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+def get_chrome_version():
     """
-    Chrome WebDriver 설정 및 생성
+    설치된 Chrome 버전 조회 (네트워크 없이 로컬 바이너리 실행)
+    
+    Returns:
+        str: '120.0.6099.109' 형식 버전. 찾지 못하면 None
+    """
+    for binary in ChromeDriverSettings.CHROME_BINARIES:
+        try:
+            output = subprocess.run([binary, '--version'], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r'(\d+\.\d+\.\d+\.\d+)', output)
+        if match:
+            return match.group(1)
+    return None
+
+def _install_with_manager(chrome_version):
+    """
+    ChromeDriverManager로 설치 후 버전별 캐시 디렉토리에 복사
     
     Args:
-        headless (bool): 헤드리스 모드 여부
-        incognito (bool): 시크릿 모드 여부
-    """
-    options = Options()
-    
-    if headless:
-        options.add_argument('--headless')
-    
-    # 기본 옵션들
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--disable-gpu')
-    options.add_argument('--disable-blink-features=AutomationControlled')
-    options.add_argument('--window-size=1920,1080')
-    options.add_argument('--start-maximized')
-    options.add_argument('--disable-extensions')
-    options.add_argument('--disable-popup-blocking')
-    options.add_argument('--disable-notifications')
-    options.add_argument('--lang=ko_KR')
-    options.add_argument('--log-level=3')
-    options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-    
-    if incognito:
-        options.add_argument('--incognito')
-    
-    # 자동화 탐지 방지
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
+        chrome_version (str): Chrome 버전 (None이면 캐시에 복사하지 않음)
+    
+    Returns:
+        str: chromedriver 경로
+    """
+    installed_path = ChromeDriverManager().install()
+    if not chrome_version:
+        return installed_path
+    
+    try:
+        cache_dir = os.path.join(ChromeDriverSettings.CACHE_DIR, chrome_version)
+        os.makedirs(cache_dir, exist_ok=True)
+        cached_path = os.path.join(cache_dir, os.path.basename(installed_path))
+        shutil.copy2(installed_path, cached_path)
+        logger.info(f"📦 chromedriver 캐시 저장: {cached_path}")
+        return cached_path
+    except OSError as e:
+        logger.warning(f"⚠️ chromedriver 캐시 저장 실패: {e}")
+        return installed_path
+
+def resolve_chromedriver_path():
+    """
+    chromedriver 경로 결정 (프로세스당 한 번)
+    
+    1. CHROMEDRIVER_PATH 로 지정한 로컬 chromedriver
+    2. Chrome 버전별 디스크 캐시 (CHROMEDRIVER_CACHE_DIR/<버전>/)
+    3. ChromeDriverManager 설치 (결과를 캐시에 저장)
+    
+    Returns:
+        str: chromedriver 실행 파일 경로
+    """
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path:
+            return _chromedriver_path
+        
+        configured_path = ChromeDriverSettings.PATH
+        if configured_path and os.path.isfile(configured_path):
+            logger.info(f"🔧 설정된 chromedriver 사용: {configured_path}")
+            _chromedriver_path = configured_path
+            return _chromedriver_path
+        if configured_path:
+            logger.warning(f"⚠️ CHROMEDRIVER_PATH 파일이 없습니다: {configured_path}")
+        
+        chrome_version = get_chrome_version()
+        if chrome_version:
+            for name in ('chromedriver', 'chromedriver.exe'):
+                cached_path = os.path.join(ChromeDriverSettings.CACHE_DIR, chrome_version, name)
+                if os.path.isfile(cached_path):
+                    logger.info(f"📦 캐시된 chromedriver 사용 (Chrome {chrome_version}): {cached_path}")
+                    _chromedriver_path = cached_path
+                    return _chromedriver_path
+        
+        logger.info(f"🌐 ChromeDriverManager로 chromedriver 설치 (Chrome {chrome_version or '버전 확인 불가'})")
+        _chromedriver_path = _install_with_manager(chrome_version)
+        return _chromedriver_path
 
-    service = Service(ChromeDriverManager().install())
+def create_driver(headless=None, incognito=True, platform=None, user_data_dir=None, launch_profile=None):
+    """
+    Chrome WebDriver 생성 (종료는 호출자가 책임)
+    
+    Args:
+        headless (bool, optional): 헤드리스 모드 여부. None이면 실행 프로필 설정
+        incognito (bool): 시크릿 모드 여부 (user_data_dir 지정 시 무시)
+        platform (str, optional): 실행 프로필/네트워크 차단 프로필을 고를 플랫폼명
+        user_data_dir (str, optional): 영구 프로필 디렉토리 (로그인 세션/쿠키 유지)
+        launch_profile (str, optional): 실행 프로필명. None이면 플랫폼 설정으로 결정
+    
+    Returns:
+        webdriver.Chrome: 실행된 Chrome 드라이버
+    """
+    profile_name = launch_profile or get_launch_profile_name(platform)
+    options = build_chrome_options(profile_name, headless, incognito, user_data_dir)
+    options.page_load_strategy = ChromeDriverSettings.PAGE_LOAD_STRATEGY
+    
+    service = Service(resolve_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=options)
     
+    driver.launch_profile = profile_name  # 풀에서 같은 프로필 드라이버만 재사용하도록 표시
+    
     # 자동화 탐지 방지 스크립트
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    apply_stealth_scripts(driver, profile_name)
+    
+    if platform:
+        apply_network_profile(driver, platform)
     
-    logger.info("🟢 Chrome 브라우저 실행 완료")
+    logger.info(f"🟢 Chrome 브라우저 실행 완료 (실행 프로필: {profile_name})")
+    return driver
 
+@contextmanager
+def setup_driver(headless=None, incognito=True, platform=None, user_data_dir=None):
+    """
+    Chrome WebDriver 설정 및 생성
+    
+    Args:
+        headless (bool, optional): 헤드리스 모드 여부. None이면 실행 프로필 설정
+        incognito (bool): 시크릿 모드 여부 (user_data_dir 지정 시 무시)
+        platform (str, optional): 실행 프로필/네트워크 차단 프로필을 고를 플랫폼명
+        user_data_dir (str, optional): 영구 프로필 디렉토리 (로그인 세션/쿠키 유지)
+    """
+    driver = create_driver(headless, incognito, platform, user_data_dir)
+    
     try:
         yield driver
     except Exception as e:
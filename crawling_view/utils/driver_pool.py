@@ -0,0 +1,232 @@
+"""
+Chrome WebDriver 풀
+
+로그인이 필요 없는 플랫폼(Genie, YouTube)은 곡/플랫폼/실행마다 Chrome을 새로 띄울 필요가 없다.
+반납된 드라이버는 쿠키/탭/스토리지만 초기화해 대기시켜 두고 다음 대여 때 재사용한다.
+풀은 프로세스 내 싱글턴이라 장시간 실행되는 큐 워커에서는 Chrome 기동 비용을 한 번만 낸다.
+"""
+import atexit
+import logging
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from crawling_view.utils.driver import create_driver, setup_driver
+from crawling_view.utils.constants import DriverPoolSettings
+from crawling_view.utils.network_profile import apply_network_profile
+from crawling_view.utils.launch_profile import get_launch_profile_name
+
+logger = logging.getLogger(__name__)
+
+class DriverPool:
+    """
+    초기화 후 재사용되는 Chrome 드라이버 풀 (스레드 안전)
+    
+    사용 예:
+        with get_driver_pool().lease() as driver:
+            crawler = GenieCrawler(driver)
+    """
+    
+    def __init__(self, max_size=None, idle_timeout=None, headless=None):
+        """
+        Args:
+            max_size (int, optional): 대기시켜 둘 최대 드라이버 수. None이면 DriverPoolSettings 사용
+            idle_timeout (float, optional): 대기 드라이버 최대 유휴 시간(초). None이면 DriverPoolSettings 사용
+            headless (bool, optional): 새로 띄우는 드라이버의 헤드리스 모드 여부. None이면 실행 프로필 설정
+        """
+        self.max_size = max(0, DriverPoolSettings.MAX_SIZE if max_size is None else max_size)
+        self.idle_timeout = DriverPoolSettings.IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+        self.headless = headless
+        self._idle = []  # [(driver, 반납 시각)]
+        self._lock = threading.Lock()
+        self._created_count = 0
+        self._reused_count = 0
+        self._retired = weakref.WeakSet()  # 반납 시 재사용하지 않고 종료할 드라이버
+    
+    def checkout(self, platform=None):
+        """
+        드라이버 대여 (같은 실행 프로필로 대기 중인 드라이버가 없으면 새로 실행)
+        
+        Args:
+            platform (str, optional): 실행 프로필/네트워크 차단 프로필을 고를 플랫폼명 (차단 프로필은 대여할 때마다 다시 적용)
+        
+        Returns:
+            webdriver.Chrome: 초기화된 Chrome 드라이버
+        """
+        self._evict_idle()
+        profile_name = get_launch_profile_name(platform)
+        while True:
+            with self._lock:
+                matches = [index for index, (idle_driver, _) in enumerate(self._idle)
+                           if getattr(idle_driver, 'launch_profile', None) == profile_name]
+                if not matches:
+                    break
+                driver, _ = self._idle.pop(matches[-1])
+            
+            if self._is_alive(driver):
+                with self._lock:
+                    self._reused_count += 1
+                logger.debug("♻️ 대기 중인 Chrome 드라이버 재사용")
+                apply_network_profile(driver, platform)
+                return driver
+            self._quit(driver)
+        
+        driver = create_driver(headless=self.headless, platform=platform)
+        with self._lock:
+            self._created_count += 1
+        return driver
+    
+    def checkin(self, driver, discard=False):
+        """
+        드라이버 반납 (상태 초기화 후 대기, 풀이 가득 찼거나 초기화 실패 시 종료)
+        
+        Args:
+            driver (webdriver.Chrome): 반납할 드라이버
+            discard (bool): True면 재사용하지 않고 바로 종료
+        """
+        if discard or driver in self._retired or not self._reset(driver):
+            self._quit(driver)
+            return
+        
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append((driver, time.monotonic()))
+                return
+        self._quit(driver)
+    
+    @contextmanager
+    def lease(self, platform=None):
+        """
+        드라이버 대여/반납 컨텍스트 매니저
+        
+        블록 안에서 드라이버가 응답하지 않게 되면 반납 시 초기화에 실패해 종료된다.
+        
+        Args:
+            platform (str, optional): 적용할 네트워크 차단 프로필 플랫폼명
+        """
+        driver = self.checkout(platform)
+        try:
+            yield driver
+        except Exception as e:
+            logger.error(f"❌ Chrome 드라이버 사용 중 오류: {e}", exc_info=True)
+            raise
+        finally:
+            self.checkin(driver)
+    
+    def retire(self, driver):
+        """
+        반납 시 재사용하지 않고 종료하도록 표시 (오래 사용한 드라이버 교체용)
+        
+        Args:
+            driver (webdriver.Chrome): 대여 중인 드라이버
+        """
+        self._retired.add(driver)
+    
+    def close_all(self):
+        """대기 중인 드라이버 전체 종료"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver, _ in idle:
+            self._quit(driver)
+        if self._created_count:
+            logger.info(f"🔴 Chrome 드라이버 풀 종료: {self._created_count}개 실행, {self._reused_count}회 재사용")
+    
+    def _evict_idle(self):
+        """유휴 시간이 지난 대기 드라이버 종료"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [driver for driver, returned_at in self._idle if now - returned_at > self.idle_timeout]
+            self._idle = [(driver, returned_at) for driver, returned_at in self._idle
+                          if now - returned_at <= self.idle_timeout]
+        for driver in expired:
+            logger.info("⏳ 유휴 시간 초과 Chrome 드라이버 종료")
+            self._quit(driver)
+    
+    def _reset(self, driver):
+        """
+        다음 대여자를 위한 상태 초기화 (추가 탭, 쿠키, 현재 사이트 스토리지)
+        
+        Returns:
+            bool: 초기화 성공 여부 (실패 시 드라이버를 재사용하지 않음)
+        """
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            
+            parsed = urlparse(driver.current_url)
+            if parsed.scheme in ('http', 'https'):
+                driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                    'origin': f"{parsed.scheme}://{parsed.netloc}",
+                    'storageTypes': 'local_storage,session_storage,indexeddb,websql,service_workers,cache_storage'
+                })
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+            driver.get('about:blank')
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ Chrome 드라이버 초기화 실패, 재사용하지 않음: {e}")
+            return False
+    
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+            logger.info("🔴 Chrome 브라우저 종료")
+        except Exception as e:
+            logger.warning(f"⚠️ Chrome 브라우저 종료 중 오류: {e}")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_driver_pool():
+    """
+    프로세스 공용 드라이버 풀 반환 (프로세스 종료 시 대기 드라이버 자동 종료)
+    
+    Returns:
+        DriverPool: 드라이버 풀
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool()
+            atexit.register(_pool.close_all)
+        return _pool
+
+def retire_driver(driver):
+    """
+    드라이버가 풀에서 빌린 것이라면 반납 시 종료되도록 표시 (풀을 쓰지 않으면 아무 일도 하지 않음)
+    
+    Args:
+        driver (webdriver.Chrome): 교체할 드라이버
+    """
+    if _pool is not None:
+        _pool.retire(driver)
+
+@contextmanager
+def pooled_driver(platform=None):
+    """
+    풀에서 드라이버를 빌려 쓰는 setup_driver 대체 컨텍스트 매니저
+    
+    DriverPoolSettings.ENABLED가 False면 매번 새 드라이버를 띄우고 종료한다.
+    
+    Args:
+        platform (str, optional): 적용할 네트워크 차단 프로필 플랫폼명
+    """
+    if not DriverPoolSettings.ENABLED:
+        with setup_driver(platform=platform) as driver:
+            yield driver
+        return
+    
+    with get_driver_pool().lease(platform) as driver:
+        yield driver
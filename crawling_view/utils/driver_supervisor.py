@@ -0,0 +1,239 @@
+"""
+워커 세션(Chrome 드라이버) 상태 감시 및 자동 재시작
+
+오래 실행된 Selenium 세션은 메모리가 늘고 느려지며, Chrome이 죽으면 그 워커의 남은 곡이 모두 실패한다.
+DriverSupervisor는 워커의 세션을 대신 열고 다음을 처리한다.
+- 드라이버별 페이지 수, 렌더러 프로세스 RSS, 페이지당 지연 시간 증가(drift) 추적
+- 기준치를 넘으면 곡 사이에서 드라이버를 미리 교체 (풀 드라이버는 반납하지 않고 종료)
+- 세션 종료(InvalidSessionIdException 등) 감지 시 드라이버를 재시작하고 실패한 곡부터 다시 처리
+"""
+import logging
+import os
+import statistics
+import weakref
+from collections import deque
+from crawling_view.utils.constants import DriverHealthSettings
+from crawling_view.utils.driver_pool import retire_driver
+
+logger = logging.getLogger(__name__)
+
+# 세션이 더 이상 쓸 수 없음을 뜻하는 예외 클래스명 / 메시지
+_DEAD_SESSION_ERRORS = ('InvalidSessionIdException', 'NoSuchWindowException', 'MaxRetryError',
+                        'ConnectionRefusedError', 'NewConnectionError', 'RemoteDisconnected')
+_DEAD_SESSION_MESSAGES = ('invalid session id', 'chrome not reachable', 'disconnected', 'session deleted',
+                          'tab crashed', 'target window already closed', 'no such window', 'connection refused')
+
+# 드라이버별 누적 페이지 수 (풀에서 재사용되는 드라이버도 세션을 넘어 누적)
+_page_counts = weakref.WeakKeyDictionary()
+
+def is_dead_session_error(error):
+    """
+    예외가 드라이버 세션 종료(Chrome 크래시/연결 끊김)를 뜻하는지 여부
+    
+    Args:
+        error (Exception): 크롤링 중 발생한 예외
+    
+    Returns:
+        bool: 세션을 다시 열어야 하면 True
+    """
+    if type(error).__name__ in _DEAD_SESSION_ERRORS:
+        return True
+    message = str(error).lower()
+    return any(keyword in message for keyword in _DEAD_SESSION_MESSAGES)
+
+def get_renderer_rss_mb(driver):
+    """
+    드라이버가 띄운 Chrome 렌더러 프로세스들의 RSS 합계 (Linux /proc 기준)
+    
+    Args:
+        driver (webdriver.Chrome): Chrome 드라이버
+    
+    Returns:
+        float: RSS 합계(MB). 측정할 수 없는 환경이면 None
+    """
+    return get_chrome_rss_mb(driver, renderer_only=True)
+
+def get_chrome_rss_mb(driver, renderer_only=False):
+    """
+    드라이버가 띄운 Chrome 프로세스들의 RSS 합계 (Linux /proc 기준, chromedriver 제외)
+    
+    Args:
+        driver (webdriver.Chrome): Chrome 드라이버
+        renderer_only (bool): True면 렌더러 프로세스만 합산
+    
+    Returns:
+        float: RSS 합계(MB). 측정할 수 없는 환경이면 None
+    """
+    try:
+        root_pid = driver.service.process.pid
+    except AttributeError:
+        return None
+    if not os.path.isdir('/proc'):
+        return None
+    
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as stat_file:
+                parent_pid = int(stat_file.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(parent_pid, []).append(int(entry))
+    
+    total_kb = 0
+    stack = [root_pid]
+    while stack:
+        for pid in children.get(stack.pop(), []):
+            stack.append(pid)
+            try:
+                if renderer_only:
+                    with open(f'/proc/{pid}/cmdline', 'rb') as cmdline_file:
+                        if b'--type=renderer' not in cmdline_file.read():
+                            continue
+                with open(f'/proc/{pid}/status') as status_file:
+                    for line in status_file:
+                        if line.startswith('VmRSS:'):
+                            total_kb += int(line.split()[1])
+                            break
+            except (OSError, ValueError):
+                continue
+    return total_kb / 1024
+
+class DriverSupervisor:
+    """
+    워커 세션을 열고 상태에 따라 교체/재시작하는 감독자
+    
+    사용 예:
+        with DriverSupervisor('genie', session_factory, worker_index) as supervisor:
+            supervisor.before_item()
+            result = crawl_fn(supervisor.crawler, item)
+    """
+    
+    def __init__(self, platform, session_factory, worker_index):
+        """
+        Args:
+            platform (str): 플랫폼명 (로그용)
+            session_factory (callable): session_factory(worker_index) → 크롤러를 yield하는 컨텍스트 매니저
+            worker_index (int): 워커 번호
+        """
+        self.platform = platform
+        self.session_factory = session_factory
+        self.worker_index = worker_index
+        self.crawler = None
+        self.restart_count = 0
+        self._session = None
+        self._baseline = []
+        self._recent = deque(maxlen=max(1, DriverHealthSettings.LATENCY_WINDOW))
+        self._pages_since_rss_check = 0
+        self._rss_mb = None
+    
+    def __enter__(self):
+        self._open()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._close()
+        return False
+    
+    @property
+    def driver(self):
+        return getattr(self.crawler, 'driver', None)
+    
+    def _open(self):
+        self._session = self.session_factory(self.worker_index)
+        self.crawler = self._session.__enter__()
+        self._baseline = []
+        self._recent.clear()
+        self._pages_since_rss_check = 0
+        self._rss_mb = None
+    
+    def _close(self, retire=False):
+        session, self._session = self._session, None
+        if session is None:
+            return
+        if retire and self.driver is not None:
+            # 풀 드라이버라면 반납 대신 종료되도록 표시
+            retire_driver(self.driver)
+        try:
+            session.__exit__(None, None, None)
+        except Exception as e:
+            logger.warning(f"⚠️ {self.platform} 워커 {self.worker_index} 세션 종료 중 오류: {e}")
+        self.crawler = None
+    
+    def restart(self, reason):
+        """
+        드라이버를 종료하고 새 세션 열기
+        
+        Args:
+            reason (str): 재시작 사유 (로그용)
+        """
+        self.restart_count += 1
+        logger.warning(f"♻️ {self.platform} 워커 {self.worker_index} 드라이버 재시작 ({reason})")
+        self._close(retire=True)
+        self._open()
+    
+    def is_alive(self):
+        """드라이버 세션 응답 여부 (드라이버가 없는 세션은 항상 True)"""
+        if self.driver is None:
+            return True
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    def before_item(self):
+        """곡 처리 전 상태 확인: 기준치를 넘었거나 세션이 죽었으면 교체"""
+        if self.driver is None or not DriverHealthSettings.ENABLED:
+            return
+        reason = self._recycle_reason()
+        if reason:
+            self.restart(reason)
+    
+    def after_item(self, latency, pages=1, success=True):
+        """
+        곡 처리 후 상태 기록
+        
+        Args:
+            latency (float): 곡당 처리 시간(초)
+            pages (int): 이번에 불러온 페이지 수
+            success (bool): 성공 여부 (지연 시간 추이는 성공한 곡만 반영)
+        """
+        driver = self.driver
+        if driver is None:
+            return
+        try:
+            _page_counts[driver] = _page_counts.get(driver, 0) + pages
+        except TypeError:
+            pass
+        self._pages_since_rss_check += pages
+        
+        if success:
+            if len(self._baseline) < self._recent.maxlen:
+                self._baseline.append(latency)
+            else:
+                self._recent.append(latency)
+    
+    def _recycle_reason(self):
+        """교체 사유 (교체가 필요 없으면 None)"""
+        if not self.is_alive():
+            return '세션 응답 없음'
+        
+        page_count = _page_counts.get(self.driver, 0)
+        if DriverHealthSettings.MAX_PAGES and page_count >= DriverHealthSettings.MAX_PAGES:
+            return f'페이지 {page_count}개 처리'
+        
+        if DriverHealthSettings.MAX_RENDERER_RSS_MB and self._pages_since_rss_check >= DriverHealthSettings.RSS_CHECK_INTERVAL:
+            self._pages_since_rss_check = 0
+            self._rss_mb = get_renderer_rss_mb(self.driver)
+            if self._rss_mb is not None and self._rss_mb >= DriverHealthSettings.MAX_RENDERER_RSS_MB:
+                return f'렌더러 메모리 {self._rss_mb:.0f}MB'
+        
+        if len(self._recent) == self._recent.maxlen:
+            baseline = statistics.median(self._baseline)
+            recent = statistics.median(self._recent)
+            if baseline > 0 and recent >= baseline * DriverHealthSettings.LATENCY_DRIFT_FACTOR:
+                return f'곡당 지연 {baseline:.1f}초 → {recent:.1f}초'
+        return None
@@ -0,0 +1,137 @@
+"""
+Chrome 실행 프로필 (플래그/창 크기/렌더러 프로세스 수/캐시)
+
+CommonSettings.CHROME_OPTIONS 를 기반으로 LaunchProfileSettings.PROFILES 의 차이만 적용해 Options를 만든다.
+프로필 선택 우선순위: CLI(--launch-profile) > 플랫폼별 설정(<PLATFORM>_LAUNCH_PROFILE) > CHROME_LAUNCH_PROFILE
+"""
+import logging
+import threading
+from selenium.webdriver.chrome.options import Options
+from crawling_view.utils.constants import CommonSettings, LaunchProfileSettings
+
+logger = logging.getLogger(__name__)
+
+# CLI로 지정한 프로필 (None 키는 전체 플랫폼 기본값)
+_overrides = {}
+_overrides_lock = threading.Lock()
+
+# create_driver가 관리하는 플래그 (프로필 키로 결정)
+_MANAGED_PREFIXES = ('--incognito', '--headless', '--window-size=', '--start-maximized',
+                     '--renderer-process-limit=', '--disk-cache-size=')
+
+# 헤드리스 Chrome이 일반 Chrome과 다르게 보이는 navigator 값 보정 (새 문서마다 실행)
+_STEALTH_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']});
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+window.chrome = window.chrome || {runtime: {}};
+"""
+
+def set_launch_profile(name, platform=None):
+    """
+    실행 프로필 지정 (CLI 옵션용, 설정값보다 우선)
+    
+    Args:
+        name (str): 프로필명 (LaunchProfileSettings.PROFILES 키)
+        platform (str, optional): 적용할 플랫폼. None이면 전체 플랫폼
+    
+    Raises:
+        ValueError: 알 수 없는 프로필명
+    """
+    if name not in LaunchProfileSettings.PROFILES:
+        raise ValueError(f"알 수 없는 실행 프로필: {name} (사용 가능: {', '.join(LaunchProfileSettings.PROFILES)})")
+    with _overrides_lock:
+        _overrides[platform] = name
+    logger.info(f"🧭 Chrome 실행 프로필 지정: {platform or '전체'} → {name}")
+
+def apply_launch_profile_args(values):
+    """
+    '--launch-profile' CLI 값 적용
+    
+    Args:
+        values (list): 'name' 또는 'platform=name' 형식 문자열 리스트
+    
+    Raises:
+        ValueError: 형식이 잘못됐거나 알 수 없는 프로필명
+    """
+    for value in values or []:
+        platform, _, name = value.rpartition('=')
+        set_launch_profile(name, platform or None)
+
+def get_launch_profile_name(platform=None):
+    """
+    플랫폼에 적용할 실행 프로필명
+    
+    Args:
+        platform (str, optional): 플랫폼명
+    
+    Returns:
+        str: 프로필명
+    """
+    with _overrides_lock:
+        name = _overrides.get(platform) or _overrides.get(None)
+    name = name or LaunchProfileSettings.PLATFORM_PROFILES.get(platform) or LaunchProfileSettings.DEFAULT
+    if name not in LaunchProfileSettings.PROFILES:
+        logger.warning(f"⚠️ 알 수 없는 실행 프로필 '{name}', default 사용")
+        return 'default'
+    return name
+
+def build_chrome_options(profile_name, headless=None, incognito=True, user_data_dir=None):
+    """
+    실행 프로필로 Chrome Options 생성
+    
+    Args:
+        profile_name (str): 프로필명
+        headless (bool, optional): 헤드리스 모드 여부. None이면 프로필 설정
+        incognito (bool): 시크릿 모드 여부 (user_data_dir 지정 시 무시)
+        user_data_dir (str, optional): 영구 프로필 디렉토리
+    
+    Returns:
+        Options: Chrome 옵션
+    """
+    profile = LaunchProfileSettings.PROFILES[profile_name]
+    removed = set(profile.get('remove_options', []))
+    options = Options()
+    
+    for argument in CommonSettings.CHROME_OPTIONS:
+        if argument in removed or argument.startswith(_MANAGED_PREFIXES):
+            continue
+        options.add_argument(argument)
+    for argument in profile.get('extra_options', []):
+        options.add_argument(argument)
+    
+    if profile.get('headless') if headless is None else headless:
+        options.add_argument('--headless=new')
+    if profile.get('window_size'):
+        options.add_argument(f"--window-size={profile['window_size']}")
+    if profile.get('start_maximized'):
+        options.add_argument('--start-maximized')
+    if profile.get('renderer_process_limit'):
+        options.add_argument(f"--renderer-process-limit={profile['renderer_process_limit']}")
+    if profile.get('disk_cache_size') is not None:
+        options.add_argument(f"--disk-cache-size={profile['disk_cache_size']}")
+    
+    if user_data_dir:
+        # 영구 프로필: 시크릿 모드를 쓰면 세션이 저장되지 않으므로 사용하지 않음
+        options.add_argument(f'--user-data-dir={user_data_dir}')
+    elif incognito:
+        options.add_argument('--incognito')
+    
+    for key, value in CommonSettings.CHROME_EXPERIMENTAL_OPTIONS.items():
+        options.add_experimental_option(key, value)
+    return options
+
+def apply_stealth_scripts(driver, profile_name):
+    """
+    프로필이 stealth_scripts를 사용하면 새 문서마다 navigator 보정 스크립트 실행
+    
+    Args:
+        driver (webdriver.Chrome): Chrome 드라이버
+        profile_name (str): 프로필명
+    """
+    if not LaunchProfileSettings.PROFILES[profile_name].get('stealth_scripts'):
+        return
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _STEALTH_SCRIPT})
+    except Exception as e:
+        logger.warning(f"⚠️ stealth 스크립트 적용 실패: {e}")
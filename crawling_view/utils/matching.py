@@ -98,6 +98,35 @@ def compare_song_info(song_title, artist_name, target_song_title, target_artist_
         'normalized_target_artist': normalized_target_artist
     }
 
+def score_song_match(song_title, artist_name, target_song_title, target_artist_name):
+    """
+    검색 결과 후보 점수 (여러 후보 중 가장 잘 맞는 곡 선택용)
+    
+    Args:
+        song_title (str): 후보 곡명
+        artist_name (str): 후보 아티스트명
+        target_song_title (str): 검색한 곡명
+        target_artist_name (str): 검색한 아티스트명
+        
+    Returns:
+        int: 점수 (곡명/아티스트명이 모두 일치하지 않으면 0)
+            - 일치 기본 1점
+            - 곡명/아티스트명 정규화 결과가 완전히 같으면 각 2점
+            - 키워드 유사도가 아닌 정확/부분 매칭이면 1점
+    """
+    comparison = compare_song_info(song_title, artist_name, target_song_title, target_artist_name)
+    if not comparison['both_match']:
+        return 0
+    
+    score = 1
+    if comparison['normalized_song'] == comparison['normalized_target_song']:
+        score += 2
+    if comparison['normalized_artist'] == comparison['normalized_target_artist']:
+        score += 2
+    if comparison['match_type'] == 'exact_partial':
+        score += 1
+    return score
+
 def exact_and_partial_match(normalized_song, normalized_target_song, normalized_artist, normalized_target_artist):
     """
     정확 매칭 + 부분 매칭
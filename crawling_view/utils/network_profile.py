@@ -0,0 +1,193 @@
+"""
+플랫폼별 네트워크 리소스 차단 프로필 및 페이지 로드 측정
+
+크롤링에는 페이지의 텍스트만 필요하므로 이미지/폰트/동영상 세그먼트/광고/분석 스크립트를
+Chrome DevTools Protocol Network.setBlockedURLs 로 차단한다.
+setBlockedURLs 는 URL 패턴만 지원하므로 리소스 종류는 확장자/호스트 패턴으로 표현하고,
+검색/플레이어 JSON 등 반드시 받아야 하는 요청은 허용 목록으로 보호한다.
+"""
+import logging
+import threading
+from fnmatch import fnmatchcase
+from crawling_view.utils.constants import NetworkProfileSettings
+
+logger = logging.getLogger(__name__)
+
+# 모든 플랫폼 공통 차단 패턴 (이미지, 폰트, 미디어, 광고/분석)
+COMMON_BLOCKED_URLS = [
+    '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.svg*', '*.ico*',
+    '*.woff*', '*.ttf*', '*.otf*',
+    '*.mp4*', '*.webm*', '*.m4a*', '*.mp3*',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googleadservices.com*',
+    '*google-analytics.com*', '*googletagmanager.com*', '*facebook.net*',
+]
+
+# 플랫폼별 추가 차단 패턴
+PLATFORM_BLOCKED_URLS = {
+    'youtube': [
+        '*googlevideo.com/videoplayback*',  # 동영상 세그먼트
+        '*ytimg.com/vi/*',  # 썸네일
+        '*youtube.com/api/stats/*',
+        '*youtube.com/ptracking*',
+        '*youtube.com/pagead/*',
+        '*youtube.com/generate_204*',
+    ],
+    'youtube_music': [
+        '*googlevideo.com/videoplayback*',
+        '*ytimg.com/vi/*',
+        '*lh3.googleusercontent.com/*',  # 앨범 아트
+        '*youtube.com/api/stats/*',
+        '*youtube.com/ptracking*',
+        '*youtube.com/pagead/*',
+        '*youtube.com/generate_204*',
+    ],
+    'genie': [
+        '*image.genie.co.kr/*',  # 앨범 아트
+    ],
+}
+
+# 차단되면 크롤링이 깨지는 요청 (이 URL과 일치하는 차단 패턴은 적용하지 않음)
+ALLOWED_URLS = {
+    'youtube': [
+        'https://www.youtube.com/youtubei/v1/player',
+        'https://www.youtube.com/youtubei/v1/next',
+        'https://www.youtube.com/s/player/base.js',
+    ],
+    'youtube_music': [
+        'https://music.youtube.com/youtubei/v1/search',
+        'https://music.youtube.com/youtubei/v1/browse',
+        'https://music.youtube.com/youtubei/v1/next',
+    ],
+    'genie': [
+        'https://www.genie.co.kr/search/searchMain',
+        'https://www.genie.co.kr/detail/songInfo',
+    ],
+}
+
+def get_blocked_urls(platform):
+    """
+    플랫폼 차단 패턴 목록 (허용 목록과 겹치는 패턴 제외)
+    
+    Args:
+        platform (str): 플랫폼명
+    
+    Returns:
+        list: Network.setBlockedURLs 에 전달할 URL 패턴
+    """
+    allowed = ALLOWED_URLS.get(platform, [])
+    blocked = []
+    for pattern in COMMON_BLOCKED_URLS + PLATFORM_BLOCKED_URLS.get(platform, []):
+        conflicts = [url for url in allowed if fnmatchcase(url, pattern)]
+        if conflicts:
+            logger.warning(f"⚠️ {platform} 차단 패턴이 허용 URL과 겹쳐 제외: {pattern} ({conflicts[0]})")
+            continue
+        blocked.append(pattern)
+    return blocked
+
+def apply_network_profile(driver, platform):
+    """
+    드라이버에 플랫폼 차단 프로필 적용 (platform이 None이면 차단 해제)
+    
+    Args:
+        driver (webdriver.Chrome): Chrome 드라이버
+        platform (str): 플랫폼명 또는 None
+    
+    Returns:
+        bool: 적용 성공 여부
+    """
+    urls = get_blocked_urls(platform) if platform and NetworkProfileSettings.BLOCKING_ENABLED else []
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+        if urls:
+            logger.debug(f"🚫 {platform} 네트워크 차단 프로필 적용: {len(urls)}개 패턴")
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ 네트워크 차단 프로필 적용 실패 ({platform}): {e}")
+        return False
+
+# 마지막 측정 이후의 리소스만 집계하고, 새 문서가 로드됐을 때만 로드 시간을 보고한다 (SPA 대응)
+_METRICS_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+const resources = performance.getEntriesByType('resource');
+const isNewPage = !window.__crawlMetricsSeen;
+let bytes = resources.reduce((sum, entry) => sum + (entry.transferSize || 0), 0);
+let loadMs = null;
+if (isNewPage && nav) {
+    bytes += nav.transferSize || 0;
+    loadMs = (nav.loadEventEnd || nav.domContentLoadedEventEnd || performance.now()) - nav.startTime;
+}
+window.__crawlMetricsSeen = true;
+performance.clearResourceTimings();
+return {load_ms: loadMs, transfer_bytes: bytes, resource_count: resources.length};
+"""
+
+class PageMetrics:
+    """
+    플랫폼별 페이지 로드 시간/전송량 누적 (스레드 안전)
+    """
+    
+    def __init__(self, platform):
+        self.platform = platform
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        with self._lock:
+            self.page_count = 0
+            self.load_count = 0
+            self.total_load_ms = 0.0
+            self.total_bytes = 0
+    
+    def record(self, driver):
+        """
+        현재 페이지의 로드 시간/전송량 측정 후 누적
+        
+        Args:
+            driver (webdriver.Chrome): 측정할 드라이버
+        """
+        if not NetworkProfileSettings.METRICS_ENABLED:
+            return
+        try:
+            metrics = driver.execute_script(_METRICS_SCRIPT) or {}
+        except Exception as e:
+            logger.debug(f"페이지 측정 실패 ({self.platform}): {e}")
+            return
+        
+        with self._lock:
+            self.page_count += 1
+            self.total_bytes += int(metrics.get('transfer_bytes') or 0)
+            if metrics.get('load_ms') is not None:
+                self.load_count += 1
+                self.total_load_ms += float(metrics['load_ms'])
+    
+    def log_summary(self):
+        """누적 측정 결과를 로그로 남기고 초기화"""
+        with self._lock:
+            page_count, load_count = self.page_count, self.load_count
+            total_load_ms, total_bytes = self.total_load_ms, self.total_bytes
+        if page_count:
+            avg_load = f"{total_load_ms / load_count:.0f}ms" if load_count else "측정 없음"
+            blocking = 'on' if NetworkProfileSettings.BLOCKING_ENABLED else 'off'
+            logger.info(f"📊 {self.platform} 페이지 {page_count}개: 평균 로드 {avg_load}, "
+                        f"평균 전송 {total_bytes / page_count / 1024:.1f}KB, 총 전송 {total_bytes / 1024 / 1024:.1f}MB "
+                        f"(차단 프로필: {blocking})")
+        self.reset()
+
+_metrics = {}
+_metrics_lock = threading.Lock()
+
+def get_page_metrics(platform):
+    """
+    플랫폼별 페이지 측정 누적기 반환 (프로세스 내 싱글턴)
+    
+    Args:
+        platform (str): 플랫폼명
+    
+    Returns:
+        PageMetrics: 해당 플랫폼의 측정 누적기
+    """
+    with _metrics_lock:
+        if platform not in _metrics:
+            _metrics[platform] = PageMetrics(platform)
+        return _metrics[platform]
@@ -0,0 +1,28 @@
+"""
+사람처럼 보이기 위한 의도적 지연 (pacing profile)
+
+DOM 상태를 기다리는 대기와 달리, 탐지 회피용으로 일부러 넣는 지연만 여기서 관리한다.
+CRAWL_PACING_PROFILE 로 프로필을 고르며, 단계별 지연은 (최소, 최대) 초 범위에서 무작위로 정해진다.
+"""
+import random
+import time
+from crawling_view.utils.constants import PacingSettings
+
+def pace(step):
+    """
+    현재 pacing 프로필에 정의된 단계별 지연
+    
+    Args:
+        step (str): 지연 단계 ('login', 'search', 'typing' 등). 프로필에 없으면 지연 없음
+    
+    Returns:
+        float: 실제로 대기한 시간(초)
+    """
+    delay_range = PacingSettings.PROFILES.get(PacingSettings.PROFILE, {}).get(step)
+    if not delay_range:
+        return 0.0
+    
+    delay = random.uniform(*delay_range)
+    if delay > 0:
+        time.sleep(delay)
+    return delay
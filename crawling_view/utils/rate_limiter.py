@@ -0,0 +1,171 @@
+"""
+플랫폼별 토큰 버킷 속도 제한기
+
+같은 호스트에서 실행 중인 모든 워커 스레드/프로세스가 플랫폼별 버킷 하나를 공유한다.
+- 스레드 간: threading.Lock
+- 프로세스 간: 상태 파일 + fcntl.flock (fcntl이 없는 OS에서는 프로세스 내부에서만 공유)
+
+워커 수를 늘려도 플랫폼으로 나가는 요청 속도는 설정값(초당 요청 수 + 버스트)을 넘지 않는다.
+"""
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from crawling_view.utils.constants import RateLimitSettings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """
+    초당 rate개씩 토큰이 차고 최대 burst개까지 쌓이는 토큰 버킷
+    
+    acquire()는 토큰을 미리 예약(잔량이 음수가 될 수 있음)하고 자기 차례까지 대기하므로,
+    여러 호출자가 동시에 들어와도 한 번의 잠금으로 순서가 정해진다.
+    """
+    
+    def __init__(self, name, rate, burst=1, state_dir=None):
+        """
+        Args:
+            name (str): 버킷 이름 (상태 파일명)
+            rate (float): 초당 토큰 보충 수 (초당 요청 수). 0 이하이면 제한 없음
+            burst (int): 버킷 최대 크기
+            state_dir (str, optional): 상태 파일 디렉토리. None이면 프로세스 내부에서만 공유
+        """
+        self.name = name
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated_at = time.time()
+        
+        self.state_path = None
+        if state_dir and fcntl:
+            os.makedirs(state_dir, exist_ok=True)
+            self.state_path = os.path.join(state_dir, f"{name}.bucket")
+    
+    def acquire(self, tokens=1):
+        """
+        토큰을 확보할 때까지 대기
+        
+        Args:
+            tokens (int): 필요한 토큰 수
+        
+        Returns:
+            float: 대기한 시간(초)
+        """
+        wait = self._reserve_wait(tokens)
+        if wait > 0:
+            logger.debug(f"⏳ {self.name} 속도 제한 대기: {wait:.2f}초")
+            time.sleep(wait)
+        return wait
+    
+    async def acquire_async(self, tokens=1):
+        """
+        acquire()의 asyncio 버전 (대기하는 동안 이벤트 루프를 막지 않음)
+        
+        Args:
+            tokens (int): 필요한 토큰 수
+        
+        Returns:
+            float: 대기한 시간(초)
+        """
+        wait = self._reserve_wait(tokens)
+        if wait > 0:
+            logger.debug(f"⏳ {self.name} 속도 제한 대기: {wait:.2f}초")
+            await asyncio.sleep(wait)
+        return wait
+    
+    def _reserve_wait(self, tokens):
+        """토큰을 예약하고 자기 차례까지 대기해야 할 시간(초) 반환"""
+        if self.rate <= 0:
+            return 0.0
+        
+        with self._lock:
+            if self.state_path:
+                return self._reserve_shared(tokens)
+            self._tokens, self._updated_at, wait = self._reserve(self._tokens, self._updated_at, tokens)
+            return wait
+    
+    def _reserve(self, current_tokens, updated_at, tokens):
+        """토큰 보충 후 예약. (남은 토큰, 갱신 시각, 대기 시간) 반환"""
+        now = time.time()
+        current_tokens = min(self.burst, current_tokens + max(0.0, now - updated_at) * self.rate)
+        current_tokens -= tokens
+        wait = -current_tokens / self.rate if current_tokens < 0 else 0.0
+        return current_tokens, now, wait
+    
+    def _reserve_shared(self, tokens):
+        """상태 파일을 잠그고 프로세스 간 공유 버킷에서 예약"""
+        with open(self.state_path, 'a+') as state_file:
+            fcntl.flock(state_file, fcntl.LOCK_EX)
+            try:
+                state_file.seek(0)
+                try:
+                    state = json.loads(state_file.read() or '{}')
+                except ValueError:
+                    state = {}
+                
+                current_tokens, updated_at, wait = self._reserve(
+                    state.get('tokens', float(self.burst)),
+                    state.get('updated_at', time.time()),
+                    tokens
+                )
+                
+                state_file.seek(0)
+                state_file.truncate()
+                state_file.write(json.dumps({'tokens': current_tokens, 'updated_at': updated_at}))
+                state_file.flush()
+                return wait
+            finally:
+                fcntl.flock(state_file, fcntl.LOCK_UN)
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(platform):
+    """
+    플랫폼별 공유 속도 제한기 반환 (프로세스 내 싱글턴)
+    
+    Args:
+        platform (str): 플랫폼명 ('genie', 'youtube_music', 'youtube', 'melon')
+    
+    Returns:
+        TokenBucket: 해당 플랫폼의 토큰 버킷
+    """
+    with _limiters_lock:
+        if platform not in _limiters:
+            state_dir = RateLimitSettings.STATE_DIR or os.path.join(tempfile.gettempdir(), 'crawling_rate_limit')
+            _limiters[platform] = TokenBucket(
+                platform,
+                RateLimitSettings.RATES.get(platform, 0),
+                RateLimitSettings.BURSTS.get(platform, 1),
+                state_dir
+            )
+        return _limiters[platform]
+
+def get_host_rate_limiter(host, rate, burst=1):
+    """
+    호스트별 공유 속도 제한기 반환 (프로세스 내 싱글턴, 처음 만들 때의 rate/burst 사용)
+    
+    Args:
+        host (str): 호스트명 (예: 'www.youtube.com', 'localhost:8000')
+        rate (float): 초당 요청 수. 0 이하이면 제한 없음
+        burst (int): 순간적으로 허용하는 최대 연속 요청 수
+    
+    Returns:
+        TokenBucket: 해당 호스트의 토큰 버킷
+    """
+    name = 'host_' + ''.join(char if char.isalnum() or char in '.-' else '_' for char in host)
+    with _limiters_lock:
+        if name not in _limiters:
+            state_dir = RateLimitSettings.STATE_DIR or os.path.join(tempfile.gettempdir(), 'crawling_rate_limit')
+            _limiters[name] = TokenBucket(name, rate, burst, state_dir)
+        return _limiters[name]
@@ -0,0 +1,168 @@
+"""
+Chrome 탭 멀티플렉서
+
+Chrome 하나(300~500MB)당 곡 하나씩 처리하는 대신, 드라이버 하나에 K개의 탭을 열고
+모든 탭에서 페이지 이동을 동시에 시작한 뒤 로딩이 끝난 탭부터 결과를 수거한다.
+Selenium 명령은 한 번에 한 탭에서만 실행되지만, 페이지 로딩(네트워크/렌더링)은 탭마다 병렬로 진행된다.
+"""
+import logging
+import time
+from crawling_view.utils.constants import CommonSettings
+
+logger = logging.getLogger(__name__)
+
+# 이동을 시작한 문서에 표시를 남겨, 새 문서가 뜨기 전의 이전 페이지를 읽지 않도록 한다
+_NAVIGATE_SCRIPT = "window.__tabNavigating = true; window.location.href = arguments[0];"
+_LOADED_SCRIPT = "return !window.__tabNavigating && document.readyState !== 'loading';"
+
+class Follow:
+    """step_fn 반환값: 같은 탭에서 다음 페이지로 이동 (예: 검색 결과 → 곡 정보)"""
+    
+    def __init__(self, url):
+        self.url = url
+
+# step_fn 반환값: 아직 필요한 요소가 렌더링되지 않음
+PENDING = object()
+
+class TabMultiplexer:
+    """
+    드라이버 하나의 여러 탭으로 페이지를 병렬 로딩
+    
+    사용 예:
+        with TabMultiplexer(driver, 4) as tabs:
+            results = tabs.run(items, start_fn, step_fn)
+    """
+    
+    def __init__(self, driver, tab_count, timeout=None, poll_interval=0.2):
+        """
+        Args:
+            driver (webdriver.Chrome): Chrome 드라이버
+            tab_count (int): 동시에 사용할 탭 수
+            timeout (float, optional): 항목당 최대 대기 시간(초). None이면 CommonSettings.DEFAULT_WAIT_TIME의 2배
+            poll_interval (float): 완료된 탭이 없을 때 다시 확인하기까지 대기 시간(초)
+        """
+        self.driver = driver
+        self.tab_count = max(1, int(tab_count or 1))
+        self.timeout = timeout or CommonSettings.DEFAULT_WAIT_TIME * 2
+        self.poll_interval = poll_interval
+        self.handles = []
+    
+    def __enter__(self):
+        self.open_tabs()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close_tabs()
+        return False
+    
+    def open_tabs(self):
+        """기존 탭을 첫 번째 탭으로 쓰고 부족한 탭을 새로 연다"""
+        self.handles = list(self.driver.window_handles[:self.tab_count])
+        while len(self.handles) < self.tab_count:
+            self.driver.switch_to.new_window('tab')
+            self.handles.append(self.driver.current_window_handle)
+        logger.debug(f"🗂️ 탭 {len(self.handles)}개 준비")
+    
+    def close_tabs(self):
+        """첫 번째 탭만 남기고 닫기"""
+        try:
+            for handle in self.handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            if self.handles:
+                self.driver.switch_to.window(self.handles[0])
+        except Exception as e:
+            logger.warning(f"⚠️ 탭 정리 실패: {e}")
+        self.handles = self.handles[:1]
+    
+    def _navigate(self, handle, url):
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(_NAVIGATE_SCRIPT, url)
+    
+    def run(self, items, start_fn, step_fn, on_result=None):
+        """
+        항목들을 탭에 나눠 병렬 로딩 후 결과 수거
+        
+        Args:
+            items (list): 처리할 항목 리스트
+            start_fn (callable): start_fn(item) → 처음 이동할 URL (None이면 바로 실패 처리)
+            step_fn (callable): step_fn(driver, item, final) → PENDING / Follow(url) / 최종 결과.
+                                final=True 는 시간 초과 직전 마지막 호출이며 PENDING을 반환하면 None으로 처리
+            on_result (callable, optional): 항목이 끝날 때마다 on_result(index, result) 호출
+        
+        Returns:
+            list: items와 같은 순서/길이의 결과 리스트
+        """
+        if not self.handles:
+            self.open_tabs()
+        
+        results = [None] * len(items)
+        pending = list(range(len(items)))
+        busy = {}  # handle → (index, 이동 시작 시각)
+        started_at = time.monotonic()
+        
+        while pending or busy:
+            # 빈 탭에 다음 항목 배정
+            for handle in self.handles:
+                if handle in busy or not pending:
+                    continue
+                index = pending.pop(0)
+                try:
+                    url = start_fn(items[index])
+                    if not url:
+                        self._finish(results, index, None, on_result)
+                        continue
+                    self._navigate(handle, url)
+                    busy[handle] = (index, time.monotonic())
+                except Exception as e:
+                    logger.error(f"❌ 탭 이동 시작 실패: {items[index]} - {e}", exc_info=True)
+                    self._finish(results, index, None, on_result)
+            
+            # 로딩이 끝난 탭부터 수거
+            progressed = False
+            for handle, (index, navigated_at) in list(busy.items()):
+                final = time.monotonic() - navigated_at >= self.timeout
+                try:
+                    self.driver.switch_to.window(handle)
+                    if not final and not self.driver.execute_script(_LOADED_SCRIPT):
+                        continue
+                    outcome = step_fn(self.driver, items[index], final)
+                except Exception as e:
+                    logger.error(f"❌ 탭 결과 수거 실패: {items[index]} - {e}", exc_info=True)
+                    outcome = None
+                
+                if outcome is PENDING and not final:
+                    continue
+                progressed = True
+                if isinstance(outcome, Follow) and not final:
+                    try:
+                        self._navigate(handle, outcome.url)
+                        busy[handle] = (index, time.monotonic())
+                    except Exception as e:
+                        logger.error(f"❌ 탭 다음 페이지 이동 실패: {items[index]} - {e}", exc_info=True)
+                        del busy[handle]
+                        self._finish(results, index, None, on_result)
+                    continue
+                
+                if final and (outcome is PENDING or isinstance(outcome, Follow)):
+                    logger.warning(f"⏳ 탭 로딩 시간 초과: {items[index]}")
+                    outcome = None
+                del busy[handle]
+                self._finish(results, index, outcome, on_result)
+            
+            if busy and not progressed:
+                time.sleep(self.poll_interval)
+        
+        elapsed = time.monotonic() - started_at
+        logger.info(f"🗂️ 탭 {len(self.handles)}개로 {len(items)}개 처리: {elapsed:.1f}초 "
+                    f"(성공 {sum(1 for result in results if result)}개)")
+        return results
+    
+    @staticmethod
+    def _finish(results, index, result, on_result):
+        results[index] = result
+        if on_result:
+            try:
+                on_result(index, result)
+            except Exception as e:
+                logger.error(f"❌ 탭 결과 전달 실패: {e}", exc_info=True)
@@ -0,0 +1,110 @@
+"""
+Selenium 조건 기반 대기 헬퍼
+
+고정 time.sleep 대신 DOM 상태(요소 렌더링, 텍스트 채워짐, 문서 로드)를 기다린다.
+"""
+import logging
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from crawling_view.utils.constants import CommonSettings
+
+logger = logging.getLogger(__name__)
+
+def text_present_in_any(selectors, by=By.CSS_SELECTOR):
+    """
+    여러 셀렉터 중 하나라도 텍스트가 비어있지 않은 요소가 있으면 그 요소를 반환하는 대기 조건
+    
+    Args:
+        selectors (list): 셀렉터 리스트
+        by (str): 셀렉터 종류
+    
+    Returns:
+        callable: WebDriverWait.until 에 전달할 조건
+    """
+    def _condition(driver):
+        for selector in selectors:
+            for element in driver.find_elements(by, selector):
+                try:
+                    if element.text.strip():
+                        return element
+                except Exception:
+                    continue
+        return False
+    return _condition
+
+def any_element_present(selectors, by=By.CSS_SELECTOR):
+    """
+    여러 셀렉터 중 하나라도 존재하면 그 요소를 반환하는 대기 조건
+    
+    Args:
+        selectors (list): 셀렉터 리스트
+        by (str): 셀렉터 종류
+    
+    Returns:
+        callable: WebDriverWait.until 에 전달할 조건
+    """
+    def _condition(driver):
+        for selector in selectors:
+            elements = driver.find_elements(by, selector)
+            if elements:
+                return elements[0]
+        return False
+    return _condition
+
+def wait_for(driver, condition, timeout=None, description=None):
+    """
+    조건이 만족될 때까지 대기 (시간 초과 시 예외 대신 None 반환)
+    
+    Args:
+        driver (webdriver.Chrome): Chrome 드라이버
+        condition (callable): 대기 조건
+        timeout (float, optional): 최대 대기 시간(초). None이면 CommonSettings.DEFAULT_WAIT_TIME
+        description (str, optional): 시간 초과 시 로그에 남길 설명
+    
+    Returns:
+        조건의 반환값 또는 None
+    """
+    try:
+        return WebDriverWait(driver, timeout or CommonSettings.DEFAULT_WAIT_TIME).until(condition)
+    except Exception:
+        if description:
+            logger.warning(f"⚠️ 대기 시간 초과: {description}")
+        return None
+
+def wait_for_document_ready(driver, timeout=None):
+    """
+    문서 파싱 완료(readyState가 interactive 이상)까지 대기 (eager 페이지 로드 전략 기준)
+    
+    Args:
+        driver (webdriver.Chrome): Chrome 드라이버
+        timeout (float, optional): 최대 대기 시간(초)
+    
+    Returns:
+        bool: 대기 성공 여부
+    """
+    return bool(wait_for(
+        driver,
+        lambda d: d.execute_script('return document.readyState') in ('interactive', 'complete'),
+        timeout,
+        '문서 로드'
+    ))
+
+def wait_for_replacement(driver, old_element, selectors, timeout=None, description=None, stale_timeout=3):
+    """
+    기존 요소가 DOM에서 사라지고 새 요소가 렌더링될 때까지 대기 (SPA 탭 전환 등)
+    
+    Args:
+        driver (webdriver.Chrome): Chrome 드라이버
+        old_element (WebElement): 교체될 기존 요소 (None이면 새 요소만 대기)
+        selectors (list): 새로 렌더링될 요소 셀렉터
+        timeout (float, optional): 최대 대기 시간(초)
+        description (str, optional): 시간 초과 시 로그에 남길 설명
+        stale_timeout (float): 기존 요소가 사라지기를 기다리는 최대 시간(초). 요소를 재사용하는 화면에서 길게 막히지 않도록 짧게 둔다
+    
+    Returns:
+        WebElement: 새 요소 또는 None
+    """
+    if old_element is not None:
+        wait_for(driver, EC.staleness_of(old_element), stale_timeout)
+    return wait_for(driver, any_element_present(selectors), timeout, description)
@@ -0,0 +1,409 @@
+"""
+플랫폼 내부 멀티 드라이버 워커 풀
+"""
+import heapq
+import logging
+import queue
+import threading
+import time
+from crawling_view.utils.concurrency import AIMDController, THROTTLE_ERRORS, classify_exception, classify_failure
+from crawling_view.utils.circuit_breaker import CircuitBreaker
+from crawling_view.utils.driver_supervisor import DriverSupervisor, is_dead_session_error
+from crawling_view.utils.constants import ConcurrencySettings, CircuitBreakerSettings, RetrySettings
+
+logger = logging.getLogger(__name__)
+
+# 서킷 브레이커가 실패로 세는 실패 종류 (차단/제한/타임아웃/세션 종료). 'not_found' 등 곡 자체의 실패는 정상 응답으로 본다
+BREAKER_ERRORS = THROTTLE_ERRORS | {'session_error'}
+
+def emit_result(on_result, result, platform):
+    """
+    on_result 콜백 호출 (콜백 오류가 크롤링을 중단시키지 않도록 보호)
+    """
+    try:
+        on_result(result)
+    except Exception as e:
+        logger.error(f"❌ {platform} 결과 전달 실패: {e}", exc_info=True)
+
+class CrawlWorkerPool:
+    """
+    곡 리스트를 N개의 독립 워커로 나눠 크롤링하고 결과를 입력 순서대로 병합
+    
+    각 워커는 session_factory로 자신만의 크롤러(Chrome 드라이버 등)를 열고,
+    공유 작업 큐에서 곡을 하나씩 가져가 처리한다. 느린 곡이 한 워커에 몰려도
+    나머지 워커가 남은 곡을 가져가므로 고정 분할보다 부하가 고르게 나뉜다.
+    
+    adaptive=True 이면 AIMDController가 곡별 결과로 목표 워커 수를 조절하고,
+    풀은 실행 중에 워커를 추가하거나(증가) 곡 사이에서 워커를 종료(감소)한다.
+    
+    실패한 곡은 재시도 큐에 모아 전체 처리가 끝난 뒤 지수 백오프로 다시 처리하고
+    (곡당 최대 RetrySettings.MAX_ATTEMPTS회), 끝까지 실패한 곡은 failed_items와 on_failure로 넘긴다.
+    플랫폼 전체가 실패하면 CircuitBreaker가 남은 곡을 빠르게 보류(circuit_open) 처리하고,
+    재시도 시 cooldown 후 한 워커로 순차 처리한다(첫 곡이 확인 요청).
+    
+    각 워커의 세션은 DriverSupervisor가 감시해, 오래 쓴 드라이버는 곡 사이에서 교체하고
+    세션이 죽으면 재시작 후 실패한 곡부터 다시 처리한다.
+    
+    batch_fn과 batch_size(>1)를 주면 워커가 곡을 batch_size개씩 가져가 한 번에 처리한다
+    (예: 드라이버 하나의 여러 탭에서 병렬 로딩).
+    """
+    
+    def __init__(self, platform, session_factory, crawl_fn, worker_count=1, on_result=None,
+                 adaptive=None, max_workers=None, circuit_breaker=None, on_failure=None, max_attempts=None,
+                 batch_fn=None, batch_size=1):
+        """
+        Args:
+            platform (str): 플랫폼명 (로그용)
+            session_factory (callable): session_factory(worker_index) → 크롤러를 yield하는 컨텍스트 매니저
+            crawl_fn (callable): crawl_fn(crawler, item) → 크롤링 결과 또는 None
+            worker_count (int): 워커 수 (자동 조절 시 시작 워커 수)
+            on_result (callable, optional): 곡 하나가 성공할 때마다 결과를 전달받는 콜백 (스트리밍 저장용)
+            adaptive (bool, optional): 워커 수 자동 조절 여부. None이면 ConcurrencySettings 사용
+            max_workers (int, optional): 자동 조절 시 최대 워커 수. None이면 ConcurrencySettings 사용
+            circuit_breaker (bool, optional): 서킷 브레이커 사용 여부. None이면 CircuitBreakerSettings 사용
+            on_failure (callable, optional): 재시도 후에도 실패한 항목마다 on_failure(item, reason) 호출
+            max_attempts (int, optional): 곡당 최대 시도 횟수. None이면 RetrySettings 사용
+            batch_fn (callable, optional): batch_fn(crawler, items) → items와 같은 길이의 결과 리스트
+            batch_size (int): batch_fn 사용 시 워커가 한 번에 가져가는 곡 수
+        """
+        self.platform = platform
+        self.session_factory = session_factory
+        self.crawl_fn = crawl_fn
+        self.worker_count = max(1, int(worker_count or 1))
+        self.on_result = on_result
+        self.on_failure = on_failure
+        self.max_attempts = max(1, max_attempts or RetrySettings.MAX_ATTEMPTS)
+        self.batch_fn = batch_fn
+        self.batch_size = max(1, int(batch_size or 1)) if batch_fn else 1
+        
+        if adaptive is None:
+            adaptive = ConcurrencySettings.ADAPTIVE
+        self.controller = AIMDController(platform, self.worker_count, maximum=max_workers) if adaptive else None
+        
+        if circuit_breaker is None:
+            circuit_breaker = CircuitBreakerSettings.ENABLED
+        self.breaker = CircuitBreaker(platform) if circuit_breaker else None
+        self.failed_items = []
+        self.deferred_items = []
+        self._failures = {}
+        
+        self._lock = threading.Lock()
+        self._threads = []
+        self._active_slots = set()
+        self._free_slots = []
+        self._next_slot = 0
+    
+    def run(self, items):
+        """
+        워커 풀 실행
+        
+        Args:
+            items (list): 크롤링 대상 리스트
+        
+        Returns:
+            list: items와 같은 순서/길이의 결과 리스트 (실패한 항목은 None)
+        """
+        results = [None] * len(items)
+        self.failed_items = []
+        self.deferred_items = []
+        self._failures = {}
+        if not items:
+            return results
+        
+        self._run_pass(list(enumerate(items)), results)
+        
+        # 재시도 큐: 실패/보류된 곡만 지수 백오프 후 다시 처리
+        for attempt in range(2, self.max_attempts + 1):
+            retry_entries = self._take_failures()
+            if not retry_entries:
+                break
+            
+            backoff = min(RetrySettings.BACKOFF_MAX, RetrySettings.BACKOFF_BASE * 2 ** (attempt - 2))
+            breaker_open = self.breaker is not None and self.breaker.state != CircuitBreaker.CLOSED
+            wait = max(backoff, self.breaker.time_until_probe()) if breaker_open else backoff
+            logger.info(f"🔁 {self.platform} 실패 {len(retry_entries)}곡 재시도 ({attempt}/{self.max_attempts}회차, {wait:.0f}초 후)")
+            time.sleep(wait)
+            
+            # 차단 중이면 한 워커로 순차 처리 (첫 곡이 half-open 확인 요청)
+            self._run_pass(retry_entries, results, single_worker=breaker_open)
+        
+        self.failed_items = [(item, reason) for _, (item, reason) in sorted(self._failures.items())]
+        self.deferred_items = [item for item, reason in self.failed_items if reason == 'circuit_open']
+        if self.failed_items:
+            logger.warning(f"⛔ {self.platform} 재시도 후에도 실패한 곡 {len(self.failed_items)}개")
+        
+        for index in sorted(self._failures):
+            item, reason = self._failures[index]
+            # 실패로 분류됐지만 결과가 있는 항목(예: 조회수 없는 YouTube 결과)은 마지막에 한 번만 전달
+            if results[index] and self.on_result:
+                emit_result(self.on_result, results[index], self.platform)
+            if self.on_failure:
+                try:
+                    self.on_failure(item, reason)
+                except Exception as e:
+                    logger.error(f"❌ {self.platform} 실패 항목 전달 실패: {e}", exc_info=True)
+        
+        return results
+    
+    def _take_failures(self):
+        """재시도할 (index, item) 목록을 입력 순서로 반환"""
+        with self._lock:
+            return [(index, item) for index, (item, _) in sorted(self._failures.items())]
+    
+    def _run_pass(self, entries, results, single_worker=False):
+        """
+        (index, item) 목록을 워커들로 처리 (single_worker=True 이면 현재 스레드에서 순차 처리)
+        """
+        work_queue = queue.Queue()
+        for entry in entries:
+            work_queue.put(entry)
+        
+        worker_count = min(self.worker_count, len(entries))
+        if single_worker or (worker_count == 1 and not self.controller):
+            # 워커가 하나면 별도 스레드 없이 현재 스레드에서 실행
+            self._worker_loop(0, work_queue, results)
+            self._fail_unprocessed(work_queue)
+            return
+        
+        if self.controller:
+            logger.info(f"⚡ {self.platform} 워커 풀 시작: {worker_count}개 워커 (자동 조절 {self.controller.minimum}~{self.controller.maximum}개), {len(entries)}개 작업")
+        else:
+            logger.info(f"⚡ {self.platform} 워커 풀 시작: {worker_count}개 워커, {len(entries)}개 작업")
+        
+        for _ in range(worker_count):
+            self._spawn(work_queue, results)
+        self._supervise(work_queue, results)
+        self._fail_unprocessed(work_queue)
+    
+    def _fail_unprocessed(self, work_queue):
+        """모든 워커가 비정상 종료되어 큐에 남은 곡을 실패 처리 (재시도 큐로)"""
+        leftover = 0
+        while True:
+            try:
+                index, item = work_queue.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._failures[index] = (item, 'session_error')
+            leftover += 1
+        if leftover:
+            logger.warning(f"⚠️ {self.platform} 워커 세션 오류로 처리하지 못한 곡 {leftover}개 (재시도 대상)")
+    
+    def _spawn(self, work_queue, results):
+        """빈 슬롯 번호로 워커 스레드 추가"""
+        with self._lock:
+            if self._free_slots:
+                slot = heapq.heappop(self._free_slots)
+            else:
+                slot = self._next_slot
+                self._next_slot += 1
+            self._active_slots.add(slot)
+        
+        thread = threading.Thread(
+            target=self._worker_thread,
+            args=(slot, work_queue, results),
+            name=f"{self.platform}-worker-{slot}",
+            daemon=True
+        )
+        self._threads.append(thread)
+        thread.start()
+    
+    def _release(self, slot):
+        """슬롯 반납 (중복 호출 무시)"""
+        with self._lock:
+            if slot in self._active_slots:
+                self._active_slots.remove(slot)
+                heapq.heappush(self._free_slots, slot)
+    
+    def _should_retire(self, slot):
+        """목표 워커 수보다 많이 실행 중이면 이 워커를 종료 대상으로 반납"""
+        if not self.controller:
+            return False
+        with self._lock:
+            if len(self._active_slots) <= self.controller.limit:
+                return False
+            self._active_slots.discard(slot)
+            heapq.heappush(self._free_slots, slot)
+            return True
+    
+    def _supervise(self, work_queue, results):
+        """
+        모든 워커가 끝날 때까지 대기하면서 목표 워커 수가 늘어나면 워커를 추가
+        """
+        while True:
+            alive = [thread for thread in self._threads if thread.is_alive()]
+            if not alive:
+                break
+            
+            if self.controller and not work_queue.empty():
+                with self._lock:
+                    shortage = min(self.controller.limit, work_queue.qsize()) - len(self._active_slots)
+                for _ in range(max(0, shortage)):
+                    self._spawn(work_queue, results)
+            
+            alive[0].join(timeout=1.0)
+    
+    def _worker_thread(self, slot, work_queue, results):
+        try:
+            self._worker_loop(slot, work_queue, results)
+        finally:
+            self._release(slot)
+    
+    def _worker_loop(self, worker_index, work_queue, results):
+        """
+        단일 워커 루프: 세션을 열고 큐가 빌 때까지 작업 처리
+        
+        세션 생성에 실패한 워커는 작업을 가져가지 않으므로 남은 작업은 다른 워커가 처리한다.
+        """
+        try:
+            with DriverSupervisor(self.platform, self.session_factory, worker_index) as supervisor:
+                while True:
+                    if self._should_retire(worker_index):
+                        logger.info(f"🔻 {self.platform} 워커 {worker_index} 종료 (목표 워커 수 {self.controller.limit}개)")
+                        break
+                    
+                    entries = self._take_entries(work_queue)
+                    if entries is None:
+                        break
+                    if not entries:
+                        continue
+                    
+                    # 처리 중 드라이버 재시작이 실패해 워커가 끝나도 곡을 잃지 않도록 미리 실패로 기록
+                    # (결과가 나오면 _record_outcome에서 갱신)
+                    self._mark_in_flight(entries)
+                    supervisor.before_item()
+                    if self.batch_size > 1:
+                        self._process_batch(worker_index, supervisor, entries, results)
+                        continue
+                    
+                    index, item = entries[0]
+                    started_at = time.monotonic()
+                    result, error_kind = self._crawl_supervised(
+                        worker_index, supervisor, lambda crawler: self.crawl_fn(crawler, item), item
+                    )
+                    results[index] = result
+                    
+                    latency = time.monotonic() - started_at
+                    crawler = supervisor.crawler
+                    error_kind = error_kind or getattr(crawler, 'last_error', None)
+                    self._record_outcome(crawler, index, item, result, error_kind, latency)
+                    supervisor.after_item(latency, success=bool(result) and not error_kind)
+        
+        except Exception as e:
+            logger.error(f"❌ {self.platform} 워커 {worker_index} 실행 실패: {e}", exc_info=True)
+    
+    def _mark_in_flight(self, entries):
+        """큐에서 꺼낸 곡을 세션 오류 실패로 먼저 기록 (재시도 큐/on_failure 대상)"""
+        with self._lock:
+            for index, item in entries:
+                self._failures[index] = (item, 'session_error')
+    
+    def _crawl_supervised(self, worker_index, supervisor, crawl, label):
+        """
+        crawl(crawler) 실행. 세션이 죽어 실패했으면 드라이버를 재시작해 한 번 더 실행
+        
+        크롤러가 예외를 내부에서 처리하고 None을 반환하는 경우도 있으므로,
+        결과가 없으면 세션 응답 여부를 확인한다.
+        
+        Returns:
+            tuple: (결과, 실패 종류 또는 None)
+        """
+        for attempt in range(2):
+            try:
+                result = crawl(supervisor.crawler)
+                error = None
+            except Exception as e:
+                logger.error(f"❌ {self.platform} 워커 {worker_index} 작업 실패: {label} - {e}", exc_info=True)
+                result, error = None, e
+            
+            session_dead = is_dead_session_error(error) if error else (not result and not supervisor.is_alive())
+            if session_dead and attempt == 1:
+                return result, 'session_error'
+            if not session_dead:
+                return result, classify_exception(error) if error else None
+            # 세션 종료: 드라이버를 재시작하고 실패한 곡부터 다시 처리
+            supervisor.restart('세션 종료 감지')
+        return None, None
+    
+    def _take_entries(self, work_queue):
+        """
+        큐에서 batch_size개까지 (index, item)을 가져옴 (서킷 브레이커가 막은 곡은 보류 처리)
+        
+        Returns:
+            list: 처리할 (index, item) 목록. 큐가 비어 있으면 None
+        """
+        entries = []
+        while len(entries) < self.batch_size:
+            try:
+                index, item = work_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if self.breaker and not self.breaker.allow():
+                # 차단 중: 크롤링하지 않고 보류 (재시도 큐로)
+                with self._lock:
+                    self._failures[index] = (item, 'circuit_open')
+                continue
+            entries.append((index, item))
+            
+            if self.breaker and self.breaker.state == CircuitBreaker.HALF_OPEN:
+                # 확인 요청은 한 곡만 보낸다
+                break
+        
+        if not entries and work_queue.empty():
+            return None
+        return entries
+    
+    def _process_batch(self, worker_index, supervisor, entries, results):
+        """
+        batch_fn으로 여러 곡을 한 번에 처리 (곡당 지연 시간은 배치 소요 시간을 곡 수로 나눈 값)
+        
+        배치 도중 세션이 죽으면 드라이버를 재시작해 결과가 없는 곡만 다시 처리한다.
+        """
+        started_at = time.monotonic()
+        items = [item for _, item in entries]
+        batch_results, error_kind = self._crawl_supervised(
+            worker_index, supervisor, lambda crawler: self.batch_fn(crawler, items), f"{len(items)}곡 배치"
+        )
+        batch_results = list(batch_results or [])
+        batch_results += [None] * (len(items) - len(batch_results))
+        
+        missing = [position for position, result in enumerate(batch_results) if not result]
+        if missing and not error_kind and not supervisor.is_alive():
+            supervisor.restart('배치 중 세션 종료')
+            retried, error_kind = self._crawl_supervised(
+                worker_index, supervisor, lambda crawler: self.batch_fn(crawler, [items[p] for p in missing]),
+                f"{len(missing)}곡 재처리"
+            )
+            for position, result in zip(missing, retried or []):
+                batch_results[position] = result
+        
+        latency = (time.monotonic() - started_at) / len(entries)
+        for position, (index, item) in enumerate(entries):
+            results[index] = batch_results[position]
+            self._record_outcome(supervisor.crawler, index, item, results[index], error_kind, latency)
+        supervisor.after_item(latency, pages=len(entries), success=not error_kind)
+    
+    def _record_outcome(self, crawler, index, item, result, error_kind, latency):
+        """곡 하나의 처리 결과를 실패 목록/서킷 브레이커/동시성 조절/결과 콜백에 반영"""
+        failed = not result or bool(error_kind)
+        if failed and not error_kind:
+            error_kind = classify_failure(getattr(crawler, 'driver', None))
+        
+        with self._lock:
+            if failed:
+                self._failures[index] = (item, error_kind)
+            else:
+                self._failures.pop(index, None)
+        
+        if self.breaker:
+            if failed and error_kind in BREAKER_ERRORS:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+        
+        if self.controller:
+            self.controller.record(latency, error_kind)
+        
+        if not failed and self.on_result:
+            emit_result(self.on_result, result, self.platform)
@@ -0,0 +1,200 @@
+"""
+Genie HTTP 크롤러 (Selenium 없이 검색/곡 정보 페이지를 직접 요청)
+
+Genie의 검색 결과와 곡 정보 페이지(h2.name, .daily-chart .total)는 서버에서 렌더링되므로
+브라우저로 검색창 입력/버튼 클릭을 거치지 않고 HTTP 요청 두 번으로 같은 HTML을 받을 수 있다.
+페이지 구조를 인식하지 못하면(차단/마크업 변경 등) 그 곡만 Selenium 크롤러로 대체하며,
+Chrome 드라이버는 처음 대체가 필요할 때만 빌린다.
+"""
+import logging
+from urllib.parse import quote
+import requests
+from requests.adapters import HTTPAdapter
+from crawling_view.utils.constants import GenieSelectors, GenieSettings, CommonSettings
+from crawling_view.utils.utils import make_soup
+from crawling_view.utils.rate_limiter import get_rate_limiter
+from .genie_logic import GenieParser, GenieCrawler
+
+logger = logging.getLogger(__name__)
+
+_USER_AGENT = next((option.split('=', 1)[1] for option in CommonSettings.CHROME_OPTIONS
+                    if option.startswith('--user-agent=')), None)
+
+# HTTP로 처리할 수 없어 Selenium으로 대체해야 함을 뜻하는 반환값
+FALLBACK = object()
+
+class GenieHttpCrawler(GenieParser):
+    """
+    HTTP 우선 Genie 크롤러 (워커당 하나, HTTP 연결은 크롤러 세션 안에서 재사용)
+    
+    사용 예:
+        with GenieHttpCrawler(lambda: pooled_driver('genie')) as crawler:
+            result = crawler.crawl_song('Supernova', 'aespa')
+    """
+    
+    def __init__(self, driver_factory=None):
+        """
+        Args:
+            driver_factory (callable, optional): 대체용 Chrome 드라이버 컨텍스트 매니저를 반환하는 함수.
+                                                 None이면 대체하지 않고 실패 처리
+        """
+        self.driver_factory = driver_factory
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=1))
+        self.session.headers.update({
+            'User-Agent': _USER_AGENT or requests.utils.default_user_agent(),
+            'Accept-Language': 'ko-KR,ko;q=0.9',
+            'Referer': GenieSettings.BASE_URL,
+        })
+        self._fallback_context = None
+        self._fallback_crawler = None
+        self.http_count = 0
+        self.fallback_count = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    @property
+    def driver(self):
+        """대체용 Chrome 드라이버 (아직 빌리지 않았으면 None, 워커 상태 감시용)"""
+        return self._fallback_crawler.driver if self._fallback_crawler else None
+    
+    def close(self):
+        """HTTP 세션과 대체용 드라이버 정리"""
+        if self.http_count or self.fallback_count:
+            logger.info(f"🌐 Genie HTTP 크롤링 {self.http_count}곡, Selenium 대체 {self.fallback_count}곡")
+        self.session.close()
+        context, self._fallback_context, self._fallback_crawler = self._fallback_context, None, None
+        if context is not None:
+            context.__exit__(None, None, None)
+    
+    def crawl_song(self, song_title, artist_name, song_id=None, genie_song_id=None):
+        """
+        단일 곡 크롤링 (HTTP 실패 시 Selenium 대체)
+        
+        Args:
+            song_title (str): 곡 제목
+            artist_name (str): 아티스트명
+            song_id (str, optional): SongInfo의 pk값
+            genie_song_id (str, optional): 저장된 Genie 곡 ID (있으면 검색 없이 곡 정보 페이지로 바로 이동)
+        
+        Returns:
+            dict: 크롤링 결과 또는 None
+        """
+        result = self._crawl_song_http(song_title, artist_name, song_id, genie_song_id)
+        if result is not FALLBACK:
+            return result
+        
+        crawler = self._get_fallback_crawler()
+        if not crawler:
+            return None
+        self.fallback_count += 1
+        return crawler.crawl_song(song_title, artist_name, song_id, genie_song_id)
+    
+    def crawl_multiple(self, song_list, tabs=1):
+        """
+        여러 곡 크롤링 (HTTP로 처리하지 못한 곡만 Selenium 탭으로 대체)
+        
+        Args:
+            song_list (list): [{'song_title': '곡명', 'artist_name': '가수명', 'song_id': 'id'}, ...]
+            tabs (int): 대체 시 동시에 로딩할 탭 수
+        
+        Returns:
+            list: 입력과 같은 순서의 크롤링 결과 (실패 시 None)
+        """
+        results = [
+            self._crawl_song_http(song_info.get('song_title', ''), song_info.get('artist_name', ''), song_info.get('song_id'),
+                                  song_info.get('genie_song_id'))
+            for song_info in song_list
+        ]
+        fallback_indexes = [index for index, result in enumerate(results) if result is FALLBACK]
+        if not fallback_indexes:
+            return results
+        
+        crawler = self._get_fallback_crawler()
+        self.fallback_count += len(fallback_indexes) if crawler else 0
+        fallback_results = crawler.crawl_multiple([song_list[index] for index in fallback_indexes],
+                                                  tabs=min(tabs, len(fallback_indexes))) if crawler else []
+        for position, index in enumerate(fallback_indexes):
+            results[index] = fallback_results[position] if position < len(fallback_results) else None
+        return results
+    
+    def _crawl_song_http(self, song_title, artist_name, song_id=None, genie_song_id=None):
+        """
+        HTTP 요청으로 곡 크롤링 (저장된 곡 ID가 있으면 곡 정보 페이지부터 시도)
+        
+        Returns:
+            dict: 크롤링 결과, 곡 정보가 일치하지 않으면 None, Selenium 대체가 필요하면 FALLBACK
+        """
+        try:
+            # 플랫폼 공유 속도 제한 (Selenium 검색과 같은 한도 사용)
+            get_rate_limiter('genie').acquire()
+            if genie_song_id:
+                song_info_html = self._get_html(self._song_info_url_for_id(genie_song_id))
+                song_info_soup = make_soup(song_info_html)
+                if song_info_soup is not None and song_info_soup.select_one(GenieSelectors.SONG_TITLE):
+                    self.http_count += 1
+                    return self._parse_song_info(song_info_html, song_title, artist_name, song_id, verify=False)
+                logger.info(f"↪️ 저장된 Genie 곡 ID({genie_song_id})로 곡 정보를 찾지 못해 검색으로 대체: {song_title} - {artist_name}")
+                get_rate_limiter('genie').acquire()
+            
+            query = f"{artist_name} {song_title}"
+            search_html = self._get_html(f"{GenieSettings.BASE_URL}search/searchMain?query={quote(query)}")
+            if search_html is None:
+                return FALLBACK
+            
+            # 검색 결과 목록의 모든 후보 중 가장 잘 맞는 곡만 요청
+            song_info_url, verified = self._rank_search_results(search_html, song_title, artist_name)
+            if not song_info_url:
+                if verified:
+                    self.http_count += 1
+                    return None
+                logger.info(f"↪️ HTTP 검색 결과에서 곡 정보 버튼을 찾지 못해 Selenium으로 대체: {song_title} - {artist_name}")
+                return FALLBACK
+            
+            song_info_html = self._get_html(song_info_url)
+            song_info_soup = make_soup(song_info_html)
+            if song_info_soup is None or not song_info_soup.select_one(GenieSelectors.SONG_TITLE):
+                logger.info(f"↪️ HTTP 곡 정보 페이지 구조를 인식하지 못해 Selenium으로 대체: {song_title} - {artist_name}")
+                return FALLBACK
+            
+            self.http_count += 1
+            return self._parse_song_info(song_info_html, song_title, artist_name, song_id,
+                                         self._genie_song_id_from_url(song_info_url), verify=not verified)
+        
+        except requests.RequestException as e:
+            logger.warning(f"⚠️ Genie HTTP 요청 실패, Selenium으로 대체: {song_title} - {artist_name} ({e})")
+            return FALLBACK
+    
+    def _get_html(self, url):
+        """
+        페이지 HTML 요청
+        
+        Returns:
+            str: HTML (200 응답이 아니면 None)
+        """
+        response = self.session.get(url, timeout=GenieSettings.HTTP_TIMEOUT)
+        if response.status_code != 200:
+            logger.warning(f"⚠️ Genie HTTP 응답 코드 {response.status_code}: {url}")
+            return None
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = 'utf-8'
+        return response.text
+    
+    def _get_fallback_crawler(self):
+        """
+        대체용 Selenium 크롤러 (처음 필요할 때 드라이버를 빌려 세션이 끝날 때까지 유지)
+        
+        Returns:
+            GenieCrawler: Selenium 크롤러 또는 None (driver_factory가 없으면)
+        """
+        if self._fallback_crawler is None and self.driver_factory:
+            context = self.driver_factory()
+            driver = context.__enter__()
+            self._fallback_context = context
+            self._fallback_crawler = GenieCrawler(driver)
+        return self._fallback_crawler
@@ -1,25 +1,252 @@
 """
 Genie 크롤링 및 파싱 로직
 """
-import time
-import random
 import logging
+import re
+from urllib.parse import quote
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from crawling_view.utils.constants import GenieSelectors, GenieSettings, CommonSettings
 from crawling_view.utils.utils import make_soup, get_current_timestamp
-from crawling_view.utils.matching import compare_song_info
+from crawling_view.utils.matching import compare_song_info, score_song_match
+from crawling_view.utils.rate_limiter import get_rate_limiter
+from crawling_view.utils.network_profile import get_page_metrics
+from crawling_view.utils.waits import wait_for_document_ready
+from crawling_view.utils.tab_multiplexer import TabMultiplexer, Follow, PENDING
 
 logger = logging.getLogger(__name__)
 
-class GenieCrawler:
+class GenieParser:
+    """검색 결과/곡 정보 페이지 파싱 (Selenium/HTTP 크롤러 공용)"""
+    
+    @staticmethod
+    def _song_info_url(onclick):
+        """
+        검색 결과의 곡 정보 버튼 onclick(fnViewSongInfo('...'))에서 곡 정보 페이지 URL 생성
+        
+        Args:
+            onclick (str): 곡 정보 버튼의 onclick 속성값
+            
+        Returns:
+            str: 곡 정보 페이지 URL 또는 None
+        """
+        match = re.search(r"fnViewSongInfo\(\s*'?(\d+)", onclick or '')
+        if not match:
+            return None
+        return GenieParser._song_info_url_for_id(match.group(1))
+    
+    def _rank_search_results(self, html, target_song, target_artist):
+        """
+        검색 결과 목록의 모든 후보를 점수화해 가장 잘 맞는 곡의 정보 페이지 선택
+        
+        Args:
+            html (str): 검색 결과 페이지 HTML
+            target_song (str): 검색한 곡명
+            target_artist (str): 검색한 아티스트명
+            
+        Returns:
+            tuple: (곡 정보 페이지 URL 또는 None, 검색 결과에서 일치를 확인했는지 여부)
+                - 일치하는 후보가 없으면 (None, True)
+                - 목록을 해석하지 못하면 첫 번째 곡 정보 버튼 URL과 False (곡 정보 페이지에서 검증)
+        """
+        soup = make_soup(html)
+        if not soup:
+            return None, False
+        
+        candidate_count = 0
+        best_score, best_url = 0, None
+        for row in soup.select(GenieSelectors.RESULT_ROWS):
+            title = self._select_text(row, GenieSelectors.RESULT_TITLE_SELECTORS)
+            artist = self._select_text(row, GenieSelectors.RESULT_ARTIST_SELECTORS)
+            button = row.select_one(GenieSelectors.SONG_INFO_BUTTON)
+            song_info_url = self._song_info_url(button.get('onclick')) if button else None
+            if not title or not artist or not song_info_url:
+                continue
+            
+            candidate_count += 1
+            score = score_song_match(title, artist, target_song, target_artist)
+            # 점수가 같으면 검색 결과 순서(정확도순)가 앞선 후보 유지
+            if score > best_score:
+                best_score, best_url = score, song_info_url
+        
+        if not candidate_count:
+            button = soup.select_one(GenieSelectors.SONG_INFO_BUTTON)
+            logger.debug("검색 결과 목록을 해석하지 못해 첫 번째 곡 정보 버튼 사용")
+            return (self._song_info_url(button.get('onclick')) if button else None), False
+        
+        if not best_url:
+            logger.warning(f"❌ 검색 결과 {candidate_count}개 중 일치하는 곡 없음: {target_song} - {target_artist}")
+            return None, True
+        logger.info(f"✅ 검색 결과 {candidate_count}개 중 최적 후보 선택 (점수 {best_score}): {target_song} - {target_artist}")
+        return best_url, True
+    
+    @staticmethod
+    def _select_text(element, selectors):
+        """셀렉터 목록 중 처음 찾은 요소의 텍스트 (없으면 None)"""
+        for selector in selectors:
+            tag = element.select_one(selector)
+            if tag and tag.get_text(strip=True):
+                return tag.get_text(strip=True)
+        return None
+    
+    @staticmethod
+    def _song_info_url_for_id(genie_song_id):
+        """Genie 곡 ID로 곡 정보 페이지 URL 생성"""
+        return f"{GenieSettings.BASE_URL}detail/songInfo?xgnm={genie_song_id}"
+    
+    @staticmethod
+    def _genie_song_id_from_url(url):
+        """곡 정보 페이지 URL에서 Genie 곡 ID 추출 (없으면 None)"""
+        match = re.search(r"[?&]xgnm=(\d+)", url or '')
+        return match.group(1) if match else None
+    
+    def _parse_song_info(self, html, target_song, target_artist, song_id=None, genie_song_id=None, verify=True):
+        """
+        곡 정보 페이지 HTML 파싱
+        
+        Args:
+            html (str): 곡 정보 페이지 HTML
+            target_song (str): 검색한 곡명
+            target_artist (str): 검색한 아티스트명
+            song_id (str, optional): SongInfo의 pk값
+            genie_song_id (str, optional): 검색으로 새로 확인한 Genie 곡 ID (결과에 포함해 SongInfo에 저장)
+            verify (bool): 곡명/아티스트명 일치 검증 여부 (저장된 곡 ID로 바로 연 페이지는 검증 생략)
+            
+        Returns:
+            dict: 파싱된 곡 정보 또는 None
+        """
+        try:
+            logger.info(f"'{target_artist} - {target_song}' 정보 추출 시도 중...")
+            
+            soup = make_soup(html)
+            if not soup:
+                return None
+            
+            # 곡명 추출
+            song_title = self._extract_song_title(soup)
+            if not song_title:
+                logger.warning("❌ 곡명 추출 실패")
+                return None
+            
+            # 아티스트명 추출
+            artist_name = self._extract_artist_name(soup)
+            if not artist_name:
+                logger.warning("❌ 아티스트명 추출 실패, 검색한 값 사용")
+                artist_name = target_artist
+            
+            # 곡명과 아티스트명 검증 (엄격한 매칭)
+            comparison_result = compare_song_info(song_title, artist_name, target_song, target_artist) if verify else None
+            
+            if comparison_result and not comparison_result['both_match']:
+                if not comparison_result['title_match']:
+                    logger.warning(f"❌ 곡명 불일치: '{comparison_result['normalized_song']}' != '{comparison_result['normalized_target_song']}'")
+                if not comparison_result['artist_match']:
+                    logger.warning(f"❌ 아티스트명 불일치: '{comparison_result['normalized_artist']}' != '{comparison_result['normalized_target_artist']}'")
+                logger.warning(f"❌ 매칭 타입: {comparison_result.get('match_type', 'unknown')}")
+                return None
+            
+            # 조회수 정보 추출
+            view_data = self._extract_view_count(soup)
+            
+            # 결과 반환 (실제 추출된 정보 사용)
+            result = {
+                'song_title': song_title,
+                'artist_name': artist_name,
+                'views': view_data.get('views', -1),
+                'listeners': view_data.get('listeners', -1),
+                'crawl_date': get_current_timestamp(),
+                'song_id': song_id
+            }
+            if genie_song_id:
+                result['genie_song_id'] = genie_song_id
+            
+            logger.info(f"✅ '{song_title}' - '{artist_name}' 파싱 성공!")
+            return result
+            
+        except Exception as e:
+            logger.error(f"❌ '{target_song}' 파싱 실패: {e}", exc_info=True)
+            return None
+    
+    def _extract_song_title(self, soup):
+        """곡명 추출"""
+        song_title_tag = soup.select_one(GenieSelectors.SONG_TITLE)
+        if song_title_tag:
+            song_title = song_title_tag.text.strip()
+            logger.info(f"✅ 곡명 추출 성공: {song_title}")
+            return song_title
+        return None
+    
+    def _extract_artist_name(self, soup):
+        """아티스트명 추출"""
+        try:
+            # 곡 정보 페이지에서 아티스트명 추출 시도
+            for selector in GenieSelectors.ARTIST_SELECTORS:
+                artist_tag = soup.select_one(selector)
+                if artist_tag:
+                    artist_name = artist_tag.text.strip()
+                    logger.info(f"✅ 아티스트명 추출 성공: {artist_name}")
+                    return artist_name
+            
+            logger.warning("❌ 아티스트명 추출 실패: 해당 selector를 찾지 못함")
+            return None
+            
+        except Exception as e:
+            logger.error(f"❌ 아티스트명 추출 실패: {e}")
+            return None
+    
+    def _extract_view_count(self, soup):
+        """조회수 정보 추출"""
+        try:
+            # 더 정확한 셀렉터 사용
+            total_container = soup.select_one('.daily-chart .total')
+            if total_container:
+                # 첫 번째 div (전체 청취자수)
+                first_div = total_container.select_one('div:first-child')
+                # 두 번째 div (전체 재생수)
+                second_div = total_container.select_one('div:nth-child(2)')
+                
+                total_person_count = -999
+                total_play_count = -999
+                
+                if first_div:
+                    p_tag = first_div.select_one('p')
+                    if p_tag:
+                        try:
+                            total_person_count = int(p_tag.text.replace(',', '').strip())
+                            logger.info(f"✅ 전체 청취자수 추출 성공: {total_person_count}")
+                        except (ValueError, TypeError) as e:
+                            logger.warning(f"❌ 전체 청취자수 변환 실패: {e}")
+                
+                if second_div:
+                    p_tag = second_div.select_one('p')
+                    if p_tag:
+                        try:
+                            total_play_count = int(p_tag.text.replace(',', '').strip())
+                            logger.info(f"✅ 전체 재생수 추출 성공: {total_play_count}")
+                        except (ValueError, TypeError) as e:
+                            logger.warning(f"❌ 전체 재생수 변환 실패: {e}")
+                
+                return {
+                    'views': total_play_count,
+                    'listeners': total_person_count
+                }
+            
+            logger.warning("❌ 통계 정보 컨테이너를 찾을 수 없음")
+            return {'views': -999, 'listeners': -999}
+            
+        except Exception as e:
+            logger.error(f"❌ 조회수 정보 추출 실패: {e}")
+            return {'views': -999, 'listeners': -999}
+
+class GenieCrawler(GenieParser):
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, CommonSettings.DEFAULT_WAIT_TIME)
+        self._stale_song_ids = set()  # 곡 정보 페이지가 열리지 않아 검색으로 대체한 저장 곡 ID
+        self._verified_tabs = set()  # 탭 검색 결과에서 일치를 확인한 (곡 ID, 곡명, 아티스트명)
     
-    def crawl_song(self, song_title, artist_name, song_id=None):
+    def crawl_song(self, song_title, artist_name, song_id=None, genie_song_id=None):
         """
         단일 곡 크롤링
         
@@ -27,24 +254,133 @@ class GenieCrawler:
             song_title (str): 곡 제목
             artist_name (str): 아티스트명
             song_id (str, optional): SongInfo의 pk값
+            genie_song_id (str, optional): 저장된 Genie 곡 ID (있으면 검색 없이 곡 정보 페이지로 바로 이동)
             
         Returns:
             dict: 크롤링 결과 또는 None
         """
         try:
+            # 저장된 곡 ID가 있으면 검색/매칭 없이 곡 정보 페이지로 바로 이동
+            if genie_song_id:
+                html = self._open_song_info(genie_song_id)
+                result = self._parse_song_info(html, song_title, artist_name, song_id, verify=False) if html else None
+                if result:
+                    return result
+                logger.info(f"↪️ 저장된 Genie 곡 ID({genie_song_id})로 곡 정보를 찾지 못해 검색으로 대체: {song_title} - {artist_name}")
+            
             # 검색 실행
-            html = self._search_song(song_title, artist_name)
-            if not html:
+            searched = self._search_song(song_title, artist_name)
+            if not searched:
                 return None
+            html, verified = searched
             
-            # 파싱 실행
-            result = self._parse_song_info(html, song_title, artist_name, song_id)
+            # 파싱 실행 (검색 결과에서 이미 일치를 확인했으면 재검증 생략, 확인한 곡 ID는 결과에 포함해 저장)
+            result = self._parse_song_info(html, song_title, artist_name, song_id,
+                                           self._genie_song_id_from_url(self.driver.current_url), verify=not verified)
             return result
             
         except Exception as e:
             logger.error(f"❌ 곡 크롤링 실패 ({song_title} - {artist_name}): {e}", exc_info=True)
             return None
     
+    def crawl_multiple(self, song_list, tabs=1):
+        """
+        여러 곡 크롤링
+        
+        Args:
+            song_list (list): [{'song_title': '곡명', 'artist_name': '가수명', 'song_id': 'id'}, ...]
+            tabs (int): 동시에 로딩할 탭 수 (1이면 한 곡씩 순서대로)
+            
+        Returns:
+            list: 입력과 같은 순서의 크롤링 결과 (실패 시 None)
+        """
+        if tabs > 1:
+            with TabMultiplexer(self.driver, tabs) as multiplexer:
+                return multiplexer.run(song_list, self._start_search_tab, self._step_search_tab)
+        
+        return [
+            self.crawl_song(song_info.get('song_title', ''), song_info.get('artist_name', ''), song_info.get('song_id'),
+                            song_info.get('genie_song_id'))
+            for song_info in song_list
+        ]
+    
+    def _open_song_info(self, genie_song_id):
+        """
+        저장된 Genie 곡 ID로 곡 정보 페이지 바로 열기
+        
+        Args:
+            genie_song_id (str): Genie 곡 ID
+            
+        Returns:
+            str: 곡 정보 페이지 HTML 또는 None (곡 정보가 없는 페이지)
+        """
+        # 플랫폼 공유 속도 제한 (검색과 같은 한도 사용)
+        get_rate_limiter('genie').acquire()
+        self.driver.get(self._song_info_url_for_id(genie_song_id))
+        
+        # 곡 정보 페이지는 서버 렌더링이므로 문서 로드 후 곡명이 없으면 유효하지 않은 ID
+        if not self.driver.find_elements(By.CSS_SELECTOR, GenieSelectors.SONG_TITLE):
+            return None
+        get_page_metrics('genie').record(self.driver)
+        return self.driver.page_source
+    
+    @staticmethod
+    def _search_url(song_info):
+        """검색 결과 페이지 URL (검색창 입력 없이 바로 이동)"""
+        query = f"{song_info.get('artist_name', '')} {song_info.get('song_title', '')}"
+        return f"{GenieSettings.BASE_URL}search/searchMain?query={quote(query)}"
+    
+    def _start_search_tab(self, song_info):
+        """탭에서 열 URL (저장된 곡 ID가 있으면 곡 정보 페이지, 없으면 검색 결과 페이지)"""
+        # 플랫폼 공유 속도 제한 (워커 수와 관계없이 초당 검색 수 유지)
+        get_rate_limiter('genie').acquire()
+        if song_info.get('genie_song_id'):
+            return self._song_info_url_for_id(song_info['genie_song_id'])
+        return self._search_url(song_info)
+    
+    def _step_search_tab(self, driver, song_info, final):
+        """
+        탭 하나의 진행 상태 처리: 검색 결과 → 곡 정보 페이지로 이동 → 곡 정보 파싱
+        (저장된 곡 ID로 연 곡 정보 페이지가 유효하지 않으면 검색 결과로 이동)
+        """
+        song_title = song_info.get('song_title', '')
+        artist_name = song_info.get('artist_name', '')
+        
+        if 'songInfo' in driver.current_url:
+            current_id = self._genie_song_id_from_url(driver.current_url)
+            stored_id = song_info.get('genie_song_id')
+            direct = bool(stored_id) and current_id == stored_id and stored_id not in self._stale_song_ids
+            
+            if not driver.find_elements(By.CSS_SELECTOR, GenieSelectors.SONG_TITLE):
+                if not direct:
+                    return PENDING
+                self._stale_song_ids.add(stored_id)
+                logger.info(f"↪️ 저장된 Genie 곡 ID({stored_id})로 곡 정보를 찾지 못해 검색으로 대체: {song_title} - {artist_name}")
+                get_rate_limiter('genie').acquire()
+                return Follow(self._search_url(song_info))
+            
+            verified_key = (current_id, song_title, artist_name)
+            verified = verified_key in self._verified_tabs
+            self._verified_tabs.discard(verified_key)
+            
+            get_page_metrics('genie').record(driver)
+            return self._parse_song_info(driver.page_source, song_title, artist_name, song_info.get('song_id'),
+                                         None if direct else current_id, verify=not (direct or verified))
+        
+        # 검색 결과 페이지는 서버 렌더링이므로 문서 로드 후 버튼이 없으면 검색 결과 없음
+        if not driver.find_elements(By.CSS_SELECTOR, GenieSelectors.SONG_INFO_BUTTON):
+            logger.warning(f"❌ 검색 결과 없음: {song_title} - {artist_name}")
+            return None
+        
+        song_info_url, verified = self._rank_search_results(driver.page_source, song_title, artist_name)
+        if not song_info_url:
+            if not verified:
+                logger.warning(f"❌ 곡 정보 ID 추출 실패: {song_title} - {artist_name}")
+            return None
+        if verified:
+            self._verified_tabs.add((self._genie_song_id_from_url(song_info_url), song_title, artist_name))
+        return Follow(song_info_url)
+    
     def _search_song(self, song_title, artist_name):
         """
         Genie에서 곡 검색
@@ -54,10 +390,12 @@ class GenieCrawler:
             artist_name (str): 아티스트명
             
         Returns:
-            str: 곡 정보 페이지 HTML 또는 None
+            tuple: (곡 정보 페이지 HTML, 검색 결과에서 일치를 확인했는지 여부) 또는 None
         """
         try:
             query = f"{artist_name} {song_title}"
+            # 플랫폼 공유 속도 제한 (워커 수와 관계없이 초당 검색 수 유지)
+            get_rate_limiter('genie').acquire()
             self.driver.get(GenieSettings.BASE_URL)
             
             max_attempts = 2
@@ -85,9 +423,7 @@ class GenieCrawler:
                     
                     # 검색어 입력
                     search_input.clear()
-                    time.sleep(random.uniform(0.7, 1.5))
                     search_input.send_keys(query)
-                    time.sleep(random.uniform(0.7, 1.5))
                     
                     # 엔터키 입력 - 새로운 방식으로 시도
                     try:
@@ -111,16 +447,19 @@ class GenieCrawler:
                         else:
                             raise
                     
-                    time.sleep(3)
+                    # 검색 결과 페이지로 이동할 때까지 대기
+                    self.wait.until(EC.url_contains('searchMain'))
                     
-                    # 검색 결과 로딩 대기 후, 곡 정보 버튼 클릭
+                    # 검색 결과 로딩 대기 후, 모든 후보 중 가장 잘 맞는 곡의 정보 페이지로 이동
                     try:
-                        # 곡 정보 버튼 찾기 (여러 개 있을 수 있으니 첫 번째 것 클릭)
-                        song_info_button = self.wait.until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, 'a.btn-basic.btn-info[onclick^="fnViewSongInfo"]'))
+                        self.wait.until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, GenieSelectors.SONG_INFO_BUTTON))
                         )
-                        song_info_button.click()
-                        logger.info("✅ 곡 정보 페이지 버튼 클릭 완료")
+                        song_info_url, verified = self._rank_search_results(self.driver.page_source, song_title, artist_name)
+                        if not song_info_url:
+                            return None
+                        self.driver.get(song_info_url)
+                        logger.info("✅ 곡 정보 페이지 이동 완료")
                         
                         # 곡 정보 페이지의 곡명(h2.name)이 나타날 때까지 wait
                         try:
@@ -130,16 +469,17 @@ class GenieCrawler:
                             logger.warning(f"곡 정보 페이지 로딩 대기 실패: {e}")
                         
                         # 곡 정보 페이지의 html 반환
-                        return self.driver.page_source
+                        get_page_metrics('genie').record(self.driver)
+                        return self.driver.page_source, verified
                     except Exception as e:
-                        logger.error(f"❌ 곡 정보 버튼 클릭 실패: {e}")
+                        logger.error(f"❌ 곡 정보 페이지 이동 실패: {e}")
                         return None
                     break
                 except Exception as e:
                     logger.warning(f"검색 입력창 입력 실패(시도 {attempt+1}): {e}")
                     if attempt < max_attempts - 1:
                         self.driver.refresh()
-                        time.sleep(3)
+                        wait_for_document_ready(self.driver)
                     else:
                         logger.error(f"검색 입력창 입력 마지막 시도({attempt+1})도 실패: {e}")
                         raise
@@ -186,141 +526,3 @@ class GenieCrawler:
         except Exception as e:
             logger.error(f"❌ 곡 정보 버튼 클릭 실패: {e}")
             return None
-    
-    def _parse_song_info(self, html, target_song, target_artist, song_id=None):
-        """
-        곡 정보 페이지 HTML 파싱
-        
-        Args:
-            html (str): 곡 정보 페이지 HTML
-            target_song (str): 검색한 곡명
-            target_artist (str): 검색한 아티스트명
-            song_id (str, optional): SongInfo의 pk값
-            
-        Returns:
-            dict: 파싱된 곡 정보 또는 None
-        """
-        for attempt in range(GenieSettings.MAX_PARSE_ATTEMPTS):
-            try:
-                logger.info(f"[시도 {attempt+1}/{GenieSettings.MAX_PARSE_ATTEMPTS}] '{target_artist} - {target_song}' 정보 추출 시도 중...")
-                
-                soup = make_soup(html)
-                if not soup:
-                    continue
-                
-                # 곡명 추출
-                song_title = self._extract_song_title(soup)
-                if not song_title:
-                    logger.warning("❌ 곡명 추출 실패")
-                    continue
-                
-                # 아티스트명 추출
-                artist_name = self._extract_artist_name(soup)
-                if not artist_name:
-                    logger.warning("❌ 아티스트명 추출 실패, 검색한 값 사용")
-                    artist_name = target_artist
-                
-                # 곡명과 아티스트명 검증 (엄격한 매칭)
-                comparison_result = compare_song_info(song_title, artist_name, target_song, target_artist)
-                
-                if not comparison_result['both_match']:
-                    if not comparison_result['title_match']:
-                        logger.warning(f"❌ 곡명 불일치: '{comparison_result['normalized_song']}' != '{comparison_result['normalized_target_song']}'")
-                    if not comparison_result['artist_match']:
-                        logger.warning(f"❌ 아티스트명 불일치: '{comparison_result['normalized_artist']}' != '{comparison_result['normalized_target_artist']}'")
-                    logger.warning(f"❌ 매칭 타입: {comparison_result.get('match_type', 'unknown')}")
-                    continue
-                
-                # 조회수 정보 추출
-                view_data = self._extract_view_count(soup)
-                
-                # 결과 반환 (실제 추출된 정보 사용)
-                result = {
-                    'song_title': song_title,
-                    'artist_name': artist_name,
-                    'views': view_data.get('views', -1),
-                    'listeners': view_data.get('listeners', -1),
-                    'crawl_date': get_current_timestamp(),
-                    'song_id': song_id
-                }
-                
-                logger.info(f"✅ '{song_title}' - '{artist_name}' 파싱 성공!")
-                return result
-                
-            except Exception as e:
-                logger.error(f"❌ 파싱 시도 {attempt+1}/{GenieSettings.MAX_PARSE_ATTEMPTS} 실패: {e}", exc_info=True)
-                continue
-        
-        logger.warning(f"❌ '{target_song}' 파싱 실패 - 모든 시도 실패")
-        return None
-    
-    def _extract_song_title(self, soup):
-        """곡명 추출"""
-        song_title_tag = soup.select_one(GenieSelectors.SONG_TITLE)
-        if song_title_tag:
-            song_title = song_title_tag.text.strip()
-            logger.info(f"✅ 곡명 추출 성공: {song_title}")
-            return song_title
-        return None
-    
-    def _extract_artist_name(self, soup):
-        """아티스트명 추출"""
-        try:
-            # 곡 정보 페이지에서 아티스트명 추출 시도
-            for selector in GenieSelectors.ARTIST_SELECTORS:
-                artist_tag = soup.select_one(selector)
-                if artist_tag:
-                    artist_name = artist_tag.text.strip()
-                    logger.info(f"✅ 아티스트명 추출 성공: {artist_name}")
-                    return artist_name
-            
-            logger.warning("❌ 아티스트명 추출 실패: 해당 selector를 찾지 못함")
-            return None
-            
-        except Exception as e:
-            logger.error(f"❌ 아티스트명 추출 실패: {e}")
-            return None
-    
-    def _extract_view_count(self, soup):
-        """조회수 정보 추출"""
-        try:
-            # 더 정확한 셀렉터 사용
-            total_container = soup.select_one('.daily-chart .total')
-            if total_container:
-                # 첫 번째 div (전체 청취자수)
-                first_div = total_container.select_one('div:first-child')
-                # 두 번째 div (전체 재생수)
-                second_div = total_container.select_one('div:nth-child(2)')
-                
-                total_person_count = -999
-                total_play_count = -999
-                
-                if first_div:
-                    p_tag = first_div.select_one('p')
-                    if p_tag:
-                        try:
-                            total_person_count = int(p_tag.text.replace(',', '').strip())
-                            logger.info(f"✅ 전체 청취자수 추출 성공: {total_person_count}")
-                        except (ValueError, TypeError) as e:
-                            logger.warning(f"❌ 전체 청취자수 변환 실패: {e}")
-                
-                if second_div:
-                    p_tag = second_div.select_one('p')
-                    if p_tag:
-                        try:
-                            total_play_count = int(p_tag.text.replace(',', '').strip())
-                            logger.info(f"✅ 전체 재생수 추출 성공: {total_play_count}")
-                        except (ValueError, TypeError) as e:
-                            logger.warning(f"❌ 전체 재생수 변환 실패: {e}")
-                
-                return {
-                    'views': total_play_count,
-                    'listeners': total_person_count
-                }
-            
-            logger.warning("❌ 통계 정보 컨테이너를 찾을 수 없음")
-            return {'views': -999, 'listeners': -999}
-            
-        except Exception as e:
-            logger.error(f"❌ 조회수 정보 추출 실패: {e}")
-            return {'views': -999, 'listeners': -999} 
\ No newline at end of file
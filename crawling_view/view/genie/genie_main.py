@@ -2,14 +2,74 @@
 Genie 크롤링 메인 실행 파일
 """
 import logging
-from crawling_view.utils.driver import setup_driver
+from contextlib import contextmanager
+from crawling_view.utils.driver_pool import pooled_driver
+from crawling_view.utils.worker_pool import CrawlWorkerPool
+from crawling_view.utils.constants import ParallelSettings, GenieSettings
+from crawling_view.utils.network_profile import get_page_metrics
 from crawling_view.data.csv_writer import save_genie_csv
 from crawling_view.data.db_writer import save_genie_to_db
 from .genie_logic import GenieCrawler
+from .genie_http import GenieHttpCrawler
 
 logger = logging.getLogger(__name__)
 
-def run_genie_crawling(song_list, save_csv=True, save_db=True):
+@contextmanager
+def _genie_session(worker_index):
+    """
+    워커별 Genie 크롤러 세션 (드라이버 풀에서 빌린 독립 Chrome 드라이버)
+    
+    GENIE_HTTP_ENABLED 이면 HTTP 크롤러를 사용하고, HTTP로 처리하지 못한 곡이 생길 때만 드라이버를 빌린다.
+    """
+    if GenieSettings.HTTP_ENABLED:
+        with GenieHttpCrawler(lambda: pooled_driver('genie')) as crawler:
+            yield crawler
+        return
+    
+    with pooled_driver('genie') as driver:
+        yield GenieCrawler(driver)
+
+def _crawl_genie_song(crawler, song_info):
+    """
+    워커 풀에서 호출되는 단일 곡 크롤링
+    
+    Args:
+        crawler (GenieCrawler | GenieHttpCrawler): 워커 전용 크롤러
+        song_info (dict): {'song_title': '곡명', 'artist_name': '가수명', 'song_id': 'id', 'genie_song_id': '저장된 Genie 곡 ID'}
+        
+    Returns:
+        dict: 크롤링 결과 또는 None
+    """
+    song_title = song_info.get('song_title', '')
+    artist_name = song_info.get('artist_name', '')
+    song_id = song_info.get('song_id')
+    
+    logger.info(f"🔍 검색 중: {song_title} - {artist_name} (ID: {song_id})")
+    
+    # 크롤링 실행 (song_id 전달)
+    result = crawler.crawl_song(song_title, artist_name, song_id, song_info.get('genie_song_id'))
+    
+    if result:
+        logger.info(f"✅ 크롤링 완료: {result['song_title']} - {result['artist_name']} (조회수: {result['views']})")
+    else:
+        logger.warning(f"❌ 크롤링 실패: {song_title} - {artist_name}")
+    
+    return result
+
+def _crawl_genie_batch(crawler, song_list):
+    """
+    워커 풀에서 호출되는 여러 곡 동시 크롤링 (드라이버 하나의 여러 탭)
+    
+    Args:
+        crawler (GenieCrawler | GenieHttpCrawler): 워커 전용 크롤러
+        song_list (list): 곡 정보 리스트
+        
+    Returns:
+        list: 입력과 같은 순서의 크롤링 결과
+    """
+    return crawler.crawl_multiple(song_list, tabs=len(song_list))
+
+def run_genie_crawling(song_list, save_csv=True, save_db=True, workers=None, on_result=None, on_failure=None):
     """
     Genie 크롤링 실행
     
@@ -17,37 +77,29 @@ def run_genie_crawling(song_list, save_csv=True, save_db=True):
         song_list (list): 크롤링할 곡 리스트 [{'song_title': '곡명', 'artist_name': '가수명', 'song_id': 'id'}, ...]
         save_csv (bool): CSV 저장 여부
         save_db (bool): DB 저장 여부
+        workers (int, optional): 독립 Chrome 워커 수. None이면 ParallelSettings 사용
+        on_result (callable, optional): 곡 하나가 성공할 때마다 결과를 전달받는 콜백 (스트리밍 저장용)
+        on_failure (callable, optional): 재시도 후에도 실패한 곡마다 on_failure(song_info, reason) 호출
     
     Returns:
-        list: 크롤링된 데이터 리스트
+        list: 크롤링된 데이터 리스트 (입력 순서 유지)
     """
     logger.info(f"🎵 Genie 크롤링 시작 - 총 {len(song_list)}곡")
     
-    crawled_data = []
+    if workers is None:
+        workers = ParallelSettings.PLATFORM_WORKERS.get('genie', 1)
     
     try:
-        # Chrome 드라이버 설정 및 실행
-        with setup_driver() as driver:
-            crawler = GenieCrawler(driver)
-            
-            # 각 곡에 대해 크롤링 실행
-            for song_info in song_list:
-                song_title = song_info.get('song_title', '')
-                artist_name = song_info.get('artist_name', '')
-                song_id = song_info.get('song_id')
-                
-                logger.info(f"🔍 검색 중: {song_title} - {artist_name} (ID: {song_id})")
-                
-                # 크롤링 실행 (song_id 전달)
-                result = crawler.crawl_song(song_title, artist_name, song_id)
-                
-                if result:
-                    crawled_data.append(result)
-                    logger.info(f"✅ 크롤링 완료: {result['song_title']} - {result['artist_name']} (조회수: {result['views']})")
-                else:
-                    logger.warning(f"❌ 크롤링 실패: {song_title} - {artist_name}")
+        # 워커별 Chrome 드라이버로 크롤링 실행
+        # GENIE_TABS > 1 이면 워커마다 여러 탭에서 곡 정보 페이지를 동시에 로딩
+        tabs = ParallelSettings.TABS_PER_DRIVER.get('genie', 1)
+        pool = CrawlWorkerPool('genie', _genie_session, _crawl_genie_song, workers, on_result=on_result,
+                               on_failure=on_failure, batch_fn=_crawl_genie_batch if tabs > 1 else None,
+                               batch_size=tabs)
+        crawled_data = [result for result in pool.run(song_list) if result]
         
         logger.info(f"🎵 Genie 크롤링 완료 - 성공: {len(crawled_data)}곡")
+        get_page_metrics('genie').log_summary()
         
         # CSV 저장
         if save_csv and crawled_data:
@@ -13,6 +13,7 @@ logger = logging.getLogger(__name__)
 class MelonCrawler:
     def __init__(self):
         self.api_base_url = "https://m2.melon.com/m6/v5/song/info.json"
+        self.last_error = None  # 마지막 실패 종류 (http_429, timeout 등, 동시성 자동 조절용)
         self.session = requests.Session()
         # User-Agent 설정
         self.session.headers.update({
@@ -34,6 +35,7 @@ class MelonCrawler:
         Returns:
             dict: 크롤링 결과 또는 None
         """
+        self.last_error = None
         try:
             if not melon_song_id:
                 logger.error("❌ melon_song_id가 필요합니다.")
@@ -47,6 +49,7 @@ class MelonCrawler:
             
             if response.status_code != 200:
                 logger.error(f"❌ API 호출 실패: HTTP {response.status_code}")
+                self.last_error = f"http_{response.status_code}"
                 return None
             
             # JSON 파싱
@@ -86,11 +89,17 @@ class MelonCrawler:
             logger.debug(f"✅ Melon 크롤링 성공: {song_name} - {artist_name} (조회수: {views}, 청취자: {listeners})")
             return result
             
+        except requests.exceptions.Timeout as e:
+            logger.error(f"❌ API 요청 시간 초과: {e}")
+            self.last_error = 'timeout'
+            return None
         except requests.exceptions.RequestException as e:
             logger.error(f"❌ API 요청 실패: {e}")
+            self.last_error = 'error'
             return None
         except json.JSONDecodeError as e:
             logger.error(f"❌ JSON 파싱 실패: {e}")
+            self.last_error = 'error'
             return None
         except Exception as e:
             logger.error(f"❌ Melon 크롤링 실패: {e}", exc_info=True)
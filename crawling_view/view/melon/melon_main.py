@@ -2,15 +2,61 @@
 Melon 크롤링 메인 실행 파일 (API 기반)
 """
 import logging
-import time
+from contextlib import contextmanager
 from .melon_logic import MelonCrawler
+from crawling_view.utils.worker_pool import CrawlWorkerPool
+from crawling_view.utils.constants import ParallelSettings
+from crawling_view.utils.rate_limiter import get_rate_limiter
 from crawling_view.data.csv_writer import save_melon_csv
 from crawling_view.data.db_writer import save_melon_to_db
-import random
 
 logger = logging.getLogger(__name__)
 
-def run_melon_crawling(song_list, save_csv=True, save_db=True):
+@contextmanager
+def _melon_session(worker_index):
+    """
+    워커별 Melon 크롤러 세션 (독립 requests.Session)
+    """
+    crawler = MelonCrawler()
+    try:
+        yield crawler
+    finally:
+        crawler.session.close()
+
+def _crawl_melon_song(crawler, song_info):
+    """
+    워커 풀에서 호출되는 단일 곡 크롤링
+    
+    Args:
+        crawler (MelonCrawler): 워커 전용 크롤러
+        song_info (dict): {'melon_song_id': 'id', 'song_id': 'id'}
+        
+    Returns:
+        dict: 크롤링 결과 또는 None
+    """
+    melon_song_id = song_info.get('melon_song_id', '')
+    song_id = song_info.get('song_id')
+    
+    if not melon_song_id:
+        logger.warning(f"⚠️ melon_song_id가 없습니다: {song_info}")
+        return None
+    
+    logger.debug(f"🔍 API 호출 중: melon_song_id={melon_song_id} (song_id={song_id})")
+    
+    # API 호출 간격 조절 (서버 부하 방지, 플랫폼 공유 속도 제한)
+    get_rate_limiter('melon').acquire()
+    
+    # 크롤링 실행
+    result = crawler.crawl_song(melon_song_id, song_id)
+    
+    if result:
+        logger.debug(f"✅ 크롤링 완료: {result['song_title']} - {result['artist_name']} (조회수: {result['views']}, 청취자: {result['listeners']})")
+    else:
+        logger.warning(f"❌ 크롤링 실패: melon_song_id={melon_song_id}")
+    
+    return result
+
+def run_melon_crawling(song_list, save_csv=True, save_db=True, workers=None, on_result=None, on_failure=None):
     """
     Melon 크롤링 실행 (API 기반)
     
@@ -18,38 +64,23 @@ def run_melon_crawling(song_list, save_csv=True, save_db=True):
         song_list (list): 크롤링할 곡 리스트 [{'melon_song_id': 'id', 'song_id': 'id'}, ...]
         save_csv (bool): CSV 저장 여부
         save_db (bool): DB 저장 여부
+        workers (int, optional): 동시 API 호출 워커 수. None이면 ParallelSettings 사용
+        on_result (callable, optional): 곡 하나가 성공할 때마다 결과를 전달받는 콜백 (스트리밍 저장용)
+        on_failure (callable, optional): 재시도 후에도 실패한 곡마다 on_failure(song_info, reason) 호출
     
     Returns:
-        list: 크롤링된 데이터 리스트
+        list: 크롤링된 데이터 리스트 (입력 순서 유지)
     """
     logger.info(f"🍈 Melon 크롤링 시작 - 총 {len(song_list)}곡")
     
-    crawled_data = []
-    crawler = MelonCrawler()
+    if workers is None:
+        workers = ParallelSettings.PLATFORM_WORKERS.get('melon', 1)
     
     try:
-        # 각 곡에 대해 크롤링 실행
-        for song_info in song_list:
-            melon_song_id = song_info.get('melon_song_id', '')
-            song_id = song_info.get('song_id')
-            
-            if not melon_song_id:
-                logger.warning(f"⚠️ melon_song_id가 없습니다: {song_info}")
-                continue
-            
-            logger.debug(f"🔍 API 호출 중: melon_song_id={melon_song_id} (song_id={song_id})")
-            
-            # 크롤링 실행
-            result = crawler.crawl_song(melon_song_id, song_id)
-            
-            if result:
-                crawled_data.append(result)
-                logger.debug(f"✅ 크롤링 완료: {result['song_title']} - {result['artist_name']} (조회수: {result['views']}, 청취자: {result['listeners']})")
-            else:
-                logger.warning(f"❌ 크롤링 실패: melon_song_id={melon_song_id}")
-            
-            # API 호출 간격 조절 (서버 부하 방지)
-            time.sleep(random.uniform(0.5, 1.5))
+        # 워커별 requests.Session으로 크롤링 실행
+        pool = CrawlWorkerPool('melon', _melon_session, _crawl_melon_song, workers, on_result=on_result,
+                               on_failure=on_failure)
+        crawled_data = [result for result in pool.run(song_list) if result]
         
         logger.info(f"🍈 Melon 크롤링 완료 - 성공: {len(crawled_data)}곡")
         
@@ -72,8 +103,6 @@ def run_melon_crawling(song_list, save_csv=True, save_db=True):
 
 if __name__ == "__main__":
     # 테스트용 실행
-    import random
-    
     test_songs = [
         {'melon_song_id': '39156202', 'song_id': 'test_1'},  # FAMOUS - ALLDAY PROJECT
         {'melon_song_id': '39156203', 'song_id': 'test_2'},  # 다른 곡
@@ -0,0 +1,223 @@
+"""
+YouTube asyncio 일괄 크롤러 (수백 개 동영상 URL을 asyncio가 관리하는 스레드 풀에서 동시에 요청)
+
+워커마다 Chrome을 여는 대신, 동시 요청 수만큼의 HTTP 세션(연결 재사용)을 큐로 돌려 쓰며
+동영상 페이지를 받고 내장 JSON(ytInitialPlayerResponse)만 파싱한다.
+HTTP 요청 자체는 블로킹 requests 호출이므로 ThreadPoolExecutor 스레드에서 실행되고,
+이벤트 루프는 동시 요청 수/속도 제한/제한 시간만 관리한다.
+- 동시 요청 수 제한: 세션 큐 (YouTubeSettings.ASYNC_CONCURRENCY)
+- 호스트별 속도 제한: 호스트마다 토큰 버킷 하나 (다른 프로세스와 공유, 처리량 상한은 YouTubeSettings.ASYNC_HOST_RATE)
+- 요청 하나의 전체 제한 시간: YouTubeSettings.ASYNC_TIMEOUT (요청이 스레드에서 실제로 시작된 때부터)
+  스레드의 요청은 취소할 수 없으므로, 시간 초과된 요청은 결과만 버리고 스레드에서 끝날 때까지 계속 실행된다
+  (executor.shutdown(wait=False) 이후에도 남아 있을 수 있으며, 연결은 HTTP_TIMEOUT이 지나면 끊긴다)
+- 실패한 URL 재시도: RetrySettings와 같은 횟수/지수 백오프
+HTTP로 처리하지 못한 URL만 마지막에 Selenium 크롤러로 대체한다.
+
+CrawlWorkerPool을 거치지 않으므로 서킷 브레이커(CircuitBreakerSettings)와 워커 수 자동 조절(ConcurrencySettings)은
+적용되지 않는다. 동시 요청 수와 호스트별 속도 제한으로만 부하를 조절한다.
+
+URL은 받은 그대로 요청하므로 로컬 스텁 HTTP 서버(예: http://127.0.0.1:8000/watch?v=...)로도 테스트할 수 있다.
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from crawling_view.utils.constants import YouTubeSettings, ParallelSettings, RetrySettings
+from crawling_view.utils.driver_pool import pooled_driver
+from crawling_view.utils.rate_limiter import get_host_rate_limiter
+from crawling_view.utils.worker_pool import emit_result
+from .youtube_logic import YouTubeCrawler
+from .youtube_http import YouTubeHttpCrawler, FALLBACK
+
+logger = logging.getLogger(__name__)
+
+class YouTubeBatchFetcher:
+    """
+    동영상 URL 목록을 asyncio로 관리하는 스레드 풀에서 동시에 요청해 {song_id: 결과} 딕셔너리로 반환
+    
+    사용 예:
+        results = YouTubeBatchFetcher().fetch([('url', 'artist_name', 'song_id'), ...])
+        save_youtube_to_db(results)
+    """
+    
+    def __init__(self, concurrency=None, timeout=None, host_rate=None, host_burst=None, fallback=True, max_attempts=None):
+        """
+        Args:
+            concurrency (int, optional): 동시 요청 수. None이면 YouTubeSettings.ASYNC_CONCURRENCY
+            timeout (float, optional): 요청 하나의 전체 제한 시간(초). None이면 YouTubeSettings.ASYNC_TIMEOUT
+            host_rate (float, optional): 호스트별 초당 요청 수 (0 이하이면 제한 없음). None이면 YouTubeSettings.ASYNC_HOST_RATE
+            host_burst (int, optional): 호스트별 버스트. None이면 YouTubeSettings.ASYNC_HOST_BURST
+            fallback (bool): HTTP로 처리하지 못한 URL을 Selenium 크롤러로 대체할지 여부
+            max_attempts (int, optional): URL당 최대 HTTP 시도 횟수. None이면 RetrySettings.MAX_ATTEMPTS
+        """
+        self.concurrency = max(1, concurrency or YouTubeSettings.ASYNC_CONCURRENCY)
+        self.timeout = timeout or YouTubeSettings.ASYNC_TIMEOUT
+        self.host_rate = YouTubeSettings.ASYNC_HOST_RATE if host_rate is None else host_rate
+        self.host_burst = host_burst or YouTubeSettings.ASYNC_HOST_BURST
+        self.fallback = fallback
+        self.max_attempts = max(1, max_attempts or RetrySettings.MAX_ATTEMPTS)
+        self.failed_items = []
+    
+    def fetch(self, url_artist_song_id_list, on_result=None, on_failure=None):
+        """
+        URL 목록 크롤링 (이벤트 루프를 새로 만들어 끝날 때까지 대기)
+        
+        Args:
+            url_artist_song_id_list (list): [('url', 'artist_name', 'song_id'), ...] 형태의 리스트
+            on_result (callable, optional): 곡 하나가 성공할 때마다 결과를 전달받는 콜백 (스트리밍 저장용)
+            on_failure (callable, optional): 대체 후에도 실패한 곡마다 on_failure(item, reason) 호출
+        
+        Returns:
+            dict: 크롤링 결과 딕셔너리 {song_id: data} (입력 순서 유지, 실패한 곡 제외)
+        """
+        started_at = time.monotonic()
+        count = len(url_artist_song_id_list)
+        results = [None] * count
+        reasons = [None] * count
+        asyncio.run(self._fetch_all(url_artist_song_id_list, range(count), results, reasons, on_result))
+        
+        # 재시도: HTTP로 처리하지 못한 URL만 지수 백오프 후 다시 요청 (재생 불가 동영상은 재시도하지 않음)
+        for attempt in range(2, self.max_attempts + 1):
+            retry_indexes = [index for index, result in enumerate(results) if result is FALLBACK]
+            if not retry_indexes:
+                break
+            backoff = min(RetrySettings.BACKOFF_MAX, RetrySettings.BACKOFF_BASE * 2 ** (attempt - 2))
+            logger.info(f"🔁 YouTube 일괄 요청 실패 {len(retry_indexes)}개 재시도 ({attempt}/{self.max_attempts}회차, {backoff:.0f}초 후)")
+            time.sleep(backoff)
+            asyncio.run(self._fetch_all(url_artist_song_id_list, retry_indexes, results, reasons, on_result))
+        
+        fallback_indexes = [index for index, result in enumerate(results) if result is FALLBACK]
+        if fallback_indexes:
+            for index, result in self._crawl_fallback(url_artist_song_id_list, fallback_indexes, on_result):
+                results[index] = result
+        
+        crawled = {}
+        self.failed_items = []
+        for item, result, reason in zip(url_artist_song_id_list, results, reasons):
+            url, artist_name, song_id = item
+            if result and result is not FALLBACK:
+                crawled[song_id] = result
+                continue
+            self.failed_items.append((item, reason or 'error'))
+            if on_failure:
+                try:
+                    on_failure(item, reason or 'error')
+                except Exception as e:
+                    logger.error(f"❌ youtube 실패 항목 전달 실패: {e}", exc_info=True)
+        
+        elapsed = time.monotonic() - started_at
+        logger.info(f"⚡ YouTube 일괄 요청 {len(url_artist_song_id_list)}개: {elapsed:.1f}초 "
+                    f"(동시 {self.concurrency}개, 성공 {len(crawled)}개, Selenium 대체 {len(fallback_indexes)}개)")
+        return crawled
+    
+    async def _fetch_all(self, url_artist_song_id_list, indexes, results, reasons, on_result):
+        """
+        indexes의 URL을 동시 요청 수 제한 안에서 요청해 results/reasons에 기록
+        
+        results에는 dict(성공) / None(재생 불가) / FALLBACK(HTTP로 처리하지 못함)이 들어간다.
+        """
+        indexes = list(indexes)
+        if not indexes:
+            return
+        
+        slot_count = min(self.concurrency, len(indexes))
+        loop = asyncio.get_running_loop()
+        # 요청은 블로킹 호출이라 스레드에서 실행하고 이벤트 루프는 완료만 기다린다.
+        # 시간 초과된 요청은 취소되지 않고 스레드에서 끝날 때까지 계속 실행되므로, 새 요청이 스레드를 기다리지 않도록 여유분을 둔다
+        executor = ThreadPoolExecutor(max_workers=slot_count * 2, thread_name_prefix='youtube-async')
+        # 세션 하나를 동시에 두 요청이 쓰지 않도록 큐에서 꺼내 쓰고 반납 (연결은 세션 안에서 재사용)
+        crawlers = asyncio.Queue()
+        for _ in range(slot_count):
+            crawlers.put_nowait(YouTubeHttpCrawler())
+        
+        def run_request(crawler, started, url, artist_name, song_id):
+            # 제한 시간은 스레드에서 요청이 실제로 시작된 뒤부터 센다
+            loop.call_soon_threadsafe(started.set)
+            return crawler.crawl_video_http(url, artist_name, song_id, rate_limit=False)
+        
+        async def fetch_one(index):
+            url, artist_name, song_id = url_artist_song_id_list[index]
+            crawler = await crawlers.get()
+            crawler.last_error = None
+            try:
+                await get_host_rate_limiter(urlsplit(url).netloc, self.host_rate, self.host_burst).acquire_async()
+                started = asyncio.Event()
+                request = executor.submit(run_request, crawler, started, url, artist_name, song_id)
+                waiter = asyncio.wrap_future(request)
+                started_wait = asyncio.ensure_future(started.wait())
+                await asyncio.wait({waiter, started_wait}, return_when=asyncio.FIRST_COMPLETED)
+                started_wait.cancel()
+                results[index] = await asyncio.wait_for(asyncio.shield(waiter), self.timeout)
+                reasons[index] = crawler.last_error
+            except asyncio.TimeoutError:
+                logger.warning(f"⏳ YouTube 요청 시간 초과({self.timeout:g}초): {artist_name} - {url}")
+                results[index], reasons[index] = FALLBACK, 'timeout'
+                # 시간 초과된 요청은 스레드에서 계속 실행 중이므로, 그 세션은 요청이 끝나면 닫고 새 세션으로 교체
+                request.add_done_callback(lambda _, stale=crawler: stale.close())
+                crawler = YouTubeHttpCrawler()
+            except Exception as e:
+                logger.error(f"❌ YouTube 요청 실패: {artist_name} - {url} ({e})", exc_info=True)
+                results[index], reasons[index] = FALLBACK, 'error'
+            finally:
+                crawlers.put_nowait(crawler)
+            
+            if results[index] and results[index] is not FALLBACK and on_result:
+                emit_result(on_result, results[index], 'youtube')
+        
+        try:
+            await asyncio.gather(*(fetch_one(index) for index in indexes))
+        finally:
+            # 시간 초과 후 아직 실행 중인 요청은 기다리지 않는다 (스레드에서 끝나면 세션이 닫힌다)
+            executor.shutdown(wait=False)
+            while not crawlers.empty():
+                crawlers.get_nowait().close()
+    
+    def _crawl_fallback(self, url_artist_song_id_list, fallback_indexes, on_result):
+        """
+        HTTP로 처리하지 못한 URL을 Selenium 크롤러로 다시 크롤링
+        
+        Returns:
+            list: [(index, 결과), ...] (대체하지 않으면 빈 리스트)
+        """
+        if not self.fallback:
+            return []
+        
+        items = [url_artist_song_id_list[index] for index in fallback_indexes]
+        tabs = ParallelSettings.TABS_PER_DRIVER.get('youtube', 1)
+        logger.info(f"↪️ HTTP로 처리하지 못한 {len(items)}개를 Selenium으로 대체")
+        try:
+            with pooled_driver('youtube') as driver:
+                crawler = YouTubeCrawler(driver)
+                if tabs > 1:
+                    fallback_results = crawler.crawl_videos_in_tabs(items, min(tabs, len(items)))
+                else:
+                    fallback_results = [crawler.crawl_video(url, artist_name, song_id) for url, artist_name, song_id in items]
+        except Exception as e:
+            logger.error(f"❌ Selenium 대체 크롤링 실패: {e}", exc_info=True)
+            return []
+        
+        replaced = []
+        for index, result in zip(fallback_indexes, fallback_results):
+            # 예외로 끝난 곡은 조회수가 None인 결과가 돌아오므로 실패로 처리
+            if not result or result.get('views') is None:
+                continue
+            replaced.append((index, result))
+            if on_result:
+                emit_result(on_result, result, 'youtube')
+        return replaced
+
+def fetch_youtube_batch(url_artist_song_id_list, on_result=None, on_failure=None, **kwargs):
+    """
+    YouTube URL 목록을 asyncio로 일괄 크롤링 (YouTubeBatchFetcher 편의 함수)
+    
+    Args:
+        url_artist_song_id_list (list): [('url', 'artist_name', 'song_id'), ...] 형태의 리스트
+        on_result (callable, optional): 곡 하나가 성공할 때마다 결과를 전달받는 콜백
+        on_failure (callable, optional): 실패한 곡마다 on_failure(item, reason) 호출
+        **kwargs: YouTubeBatchFetcher 생성자 인자 (concurrency, timeout, host_rate, host_burst, fallback, max_attempts)
+    
+    Returns:
+        dict: 크롤링 결과 딕셔너리 {song_id: data} (save_youtube_to_db에 그대로 전달 가능)
+    """
+    return YouTubeBatchFetcher(**kwargs).fetch(url_artist_song_id_list, on_result=on_result, on_failure=on_failure)
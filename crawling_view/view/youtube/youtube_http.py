@@ -0,0 +1,285 @@
+"""
+YouTube HTTP 크롤러 (Selenium 없이 동영상 페이지의 내장 JSON만 파싱)
+
+YouTube 동영상 페이지 HTML에는 ytInitialPlayerResponse / ytInitialData JSON이 그대로 들어 있어
+조회수(videoDetails.viewCount), 제목, 게시일을 브라우저 렌더링 없이 읽을 수 있다.
+수 MB짜리 HTML 전체를 BeautifulSoup으로 파싱하지 않고 필요한 JSON 객체만 잘라서 디코딩한다.
+JSON을 찾지 못하면(차단/동의 페이지/구조 변경 등) 그 동영상만 Selenium 크롤러로 대체하며,
+Chrome 드라이버는 처음 대체가 필요할 때만 빌린다.
+"""
+import json
+import logging
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from crawling_view.utils.constants import YouTubeSettings, CommonSettings
+from crawling_view.utils.utils import get_current_timestamp, convert_view_count
+from crawling_view.utils.rate_limiter import get_rate_limiter
+from .youtube_logic import YouTubeCrawler
+
+logger = logging.getLogger(__name__)
+
+_USER_AGENT = next((option.split('=', 1)[1] for option in CommonSettings.CHROME_OPTIONS
+                    if option.startswith('--user-agent=')), None)
+
+_PLAYER_RESPONSE_PATTERN = re.compile(r'ytInitialPlayerResponse\s*=\s*(?=\{)')
+_INITIAL_DATA_PATTERN = re.compile(r'ytInitialData\s*=\s*(?=\{)')
+_DATE_PATTERN = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+# HTTP로 처리할 수 없어 Selenium으로 대체해야 함을 뜻하는 반환값
+FALLBACK = object()
+
+def extract_embedded_json(html, pattern):
+    """
+    페이지 HTML에서 `변수명 = {...}` 형태로 내장된 JSON 객체 하나만 디코딩
+    
+    Args:
+        html (str): 동영상 페이지 HTML
+        pattern (re.Pattern): 변수 할당부(JSON 시작 직전까지)에 맞는 정규식
+    
+    Returns:
+        dict: 디코딩된 JSON 또는 None
+    """
+    if not html:
+        return None
+    decoder = json.JSONDecoder()
+    for match in pattern.finditer(html):
+        try:
+            data, _ = decoder.raw_decode(html, match.end())
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            return data
+    return None
+
+class YouTubeHttpCrawler:
+    """
+    HTTP 우선 YouTube 크롤러 (워커당 하나, HTTP 연결은 크롤러 세션 안에서 재사용)
+    
+    사용 예:
+        with YouTubeHttpCrawler(lambda: pooled_driver('youtube')) as crawler:
+            result = crawler.crawl_video(url, 'aespa', song_id)
+    """
+    
+    def __init__(self, driver_factory=None):
+        """
+        Args:
+            driver_factory (callable, optional): 대체용 Chrome 드라이버 컨텍스트 매니저를 반환하는 함수.
+                                                 None이면 대체하지 않고 실패 처리
+        """
+        self.driver_factory = driver_factory
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=1))
+        self.session.headers.update({
+            'User-Agent': _USER_AGENT or requests.utils.default_user_agent(),
+            'Accept-Language': 'ko-KR,ko;q=0.9',
+        })
+        # 쿠키 동의 페이지(consent.youtube.com)로 리디렉션되지 않도록 동의 쿠키를 미리 설정
+        self.session.cookies.set('SOCS', 'CAI', domain='.youtube.com')
+        self.last_error = None  # 마지막 실패 종류 (동시성 자동 조절용)
+        self._fallback_context = None
+        self._fallback_crawler = None
+        self.http_count = 0
+        self.fallback_count = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    @property
+    def driver(self):
+        """대체용 Chrome 드라이버 (아직 빌리지 않았으면 None, 워커 상태 감시용)"""
+        return self._fallback_crawler.driver if self._fallback_crawler else None
+    
+    def close(self):
+        """HTTP 세션과 대체용 드라이버 정리"""
+        if self.http_count or self.fallback_count:
+            logger.info(f"🌐 YouTube HTTP 크롤링 {self.http_count}개, Selenium 대체 {self.fallback_count}개")
+        self.session.close()
+        context, self._fallback_context, self._fallback_crawler = self._fallback_context, None, None
+        if context is not None:
+            context.__exit__(None, None, None)
+    
+    def crawl_video(self, url, artist_name, song_id):
+        """
+        단일 YouTube URL 크롤링 (HTTP 실패 시 Selenium 대체)
+        
+        Args:
+            url (str): YouTube URL
+            artist_name (str): 아티스트명
+            song_id (str): SongInfo의 pk값
+        
+        Returns:
+            dict: 크롤링 결과 또는 None
+        """
+        self.last_error = None
+        result = self.crawl_video_http(url, artist_name, song_id)
+        if result is not FALLBACK:
+            return result
+        
+        crawler = self._get_fallback_crawler()
+        if not crawler:
+            logger.error(f"❌ 크롤링 실패: {artist_name} - {url}")
+            return None
+        self.fallback_count += 1
+        result = crawler.crawl_video(url, artist_name, song_id)
+        self.last_error = crawler.last_error
+        return result
+    
+    def crawl_videos_in_tabs(self, url_artist_song_id_list, tabs):
+        """
+        여러 YouTube URL 크롤링 (HTTP로 처리하지 못한 URL만 Selenium 탭으로 대체)
+        
+        Args:
+            url_artist_song_id_list (list): [('url', 'artist_name', 'song_id'), ...] 형태의 리스트
+            tabs (int): 대체 시 동시에 로딩할 탭 수
+        
+        Returns:
+            list: 입력과 같은 순서의 크롤링 결과 (실패 시 None)
+        """
+        self.last_error = None
+        results = [self.crawl_video_http(url, artist_name, song_id)
+                   for url, artist_name, song_id in url_artist_song_id_list]
+        fallback_indexes = [index for index, result in enumerate(results) if result is FALLBACK]
+        if not fallback_indexes:
+            return results
+        
+        crawler = self._get_fallback_crawler()
+        self.fallback_count += len(fallback_indexes) if crawler else 0
+        fallback_results = crawler.crawl_videos_in_tabs([url_artist_song_id_list[index] for index in fallback_indexes],
+                                                        min(tabs, len(fallback_indexes))) if crawler else []
+        for position, index in enumerate(fallback_indexes):
+            results[index] = fallback_results[position] if position < len(fallback_results) else None
+        return results
+    
+    def crawl_video_http(self, url, artist_name, song_id, rate_limit=True):
+        """
+        HTTP 요청으로 동영상 페이지를 받아 내장 JSON에서 크롤링 결과 생성 (Selenium 대체 없음)
+        
+        Args:
+            url (str): YouTube URL
+            artist_name (str): 아티스트명
+            song_id (str): SongInfo의 pk값
+            rate_limit (bool): 플랫폼 공유 속도 제한 적용 여부 (호출자가 직접 속도를 제한하면 False)
+        
+        Returns:
+            dict: 크롤링 결과, 재생할 수 없는 동영상이면 None, Selenium 대체가 필요하면 FALLBACK
+        """
+        try:
+            # 플랫폼 공유 속도 제한 (Selenium 페이지 로드와 같은 한도 사용)
+            if rate_limit:
+                get_rate_limiter('youtube').acquire()
+            response = self.session.get(url, timeout=YouTubeSettings.HTTP_TIMEOUT)
+        except requests.Timeout as e:
+            logger.warning(f"⚠️ YouTube HTTP 요청 시간 초과, Selenium으로 대체: {artist_name} - {url} ({e})")
+            self.last_error = 'timeout'
+            return FALLBACK
+        except requests.RequestException as e:
+            logger.warning(f"⚠️ YouTube HTTP 요청 실패, Selenium으로 대체: {artist_name} - {url} ({e})")
+            return FALLBACK
+        
+        if response.status_code != 200:
+            logger.warning(f"⚠️ YouTube HTTP 응답 코드 {response.status_code}, Selenium으로 대체: {url}")
+            if response.status_code == 429:
+                self.last_error = 'http_429'
+            return FALLBACK
+        
+        html = response.text
+        player_response = extract_embedded_json(html, _PLAYER_RESPONSE_PATTERN) or {}
+        playability = player_response.get('playabilityStatus', {}).get('status')
+        if playability in ('ERROR', 'UNPLAYABLE'):
+            logger.error(f"❌ 크롤링 실패 (재생 불가 동영상: {playability}): {artist_name} - {url}")
+            self.http_count += 1
+            return None
+        
+        video_details = player_response.get('videoDetails', {})
+        song_name = video_details.get('title')
+        view_count = self._to_int(video_details.get('viewCount'))
+        upload_date = self._extract_publish_date(player_response)
+        
+        # 플레이어 응답에 조회수가 없으면(실시간 스트림 등) ytInitialData의 조회수 텍스트 사용
+        if view_count is None or not song_name:
+            primary_info = self._find_primary_info(extract_embedded_json(html, _INITIAL_DATA_PATTERN))
+            song_name = song_name or self._runs_text(primary_info.get('title'))
+            if view_count is None:
+                view_renderer = primary_info.get('viewCount', {}).get('videoViewCountRenderer', {})
+                view_count = convert_view_count(self._runs_text(view_renderer.get('viewCount')))
+        
+        if view_count is None or not song_name:
+            logger.info(f"↪️ 동영상 페이지 JSON을 인식하지 못해 Selenium으로 대체: {artist_name} - {url}")
+            return FALLBACK
+        
+        self.http_count += 1
+        logger.info(f"✅ 크롤링 성공 - 아티스트: {artist_name}, 제목: {song_name}, "
+                    f"조회수: {view_count}, 업로드일: {upload_date}")
+        return {
+            'song_id': song_id,  # SongInfo의 pk
+            'song_name': song_name,
+            'artist_name': artist_name,
+            'views': view_count,
+            'listeners': -1,  # YouTube는 청취자 수 제공 안함
+            'youtube_url': url,
+            'upload_date': upload_date,
+            'extracted_date': get_current_timestamp()
+        }
+    
+    @staticmethod
+    def _extract_publish_date(player_response):
+        """
+        게시일을 "YYYY.MM.DD" 형식으로 추출 (Selenium 크롤러와 같은 형식)
+        
+        Returns:
+            str: 게시일 또는 None
+        """
+        microformat = player_response.get('microformat', {}).get('playerMicroformatRenderer', {})
+        date_text = microformat.get('publishDate') or microformat.get('uploadDate')
+        date_match = _DATE_PATTERN.search(date_text or '')
+        if not date_match:
+            return None
+        year, month, day = date_match.groups()
+        return f"{year}.{int(month):02d}.{int(day):02d}"
+    
+    @staticmethod
+    def _find_primary_info(initial_data):
+        """ytInitialData에서 videoPrimaryInfoRenderer(제목/조회수 영역) 찾기"""
+        try:
+            contents = initial_data['contents']['twoColumnWatchNextResults']['results']['results']['contents']
+        except (KeyError, TypeError):
+            return {}
+        for content in contents:
+            if 'videoPrimaryInfoRenderer' in content:
+                return content['videoPrimaryInfoRenderer']
+        return {}
+    
+    @staticmethod
+    def _runs_text(text_object):
+        """YouTube 텍스트 객체({'simpleText': ...} 또는 {'runs': [...]})를 문자열로 변환"""
+        if not text_object:
+            return None
+        if 'simpleText' in text_object:
+            return text_object['simpleText']
+        return ''.join(run.get('text', '') for run in text_object.get('runs', [])) or None
+    
+    @staticmethod
+    def _to_int(value):
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
+    
+    def _get_fallback_crawler(self):
+        """
+        대체용 Selenium 크롤러 (처음 필요할 때 드라이버를 빌려 세션이 끝날 때까지 유지)
+        
+        Returns:
+            YouTubeCrawler: Selenium 크롤러 또는 None (driver_factory가 없으면)
+        """
+        if self._fallback_crawler is None and self.driver_factory:
+            context = self.driver_factory()
+            driver = context.__enter__()
+            self._fallback_context = context
+            self._fallback_crawler = YouTubeCrawler(driver)
+        return self._fallback_crawler
@@ -1,7 +1,6 @@
 """
 YouTube 크롤링 및 파싱 로직
 """
-import time
 import random
 import logging
 import re
@@ -11,6 +10,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from crawling_view.utils.constants import YouTubeSelectors, CommonSettings
 from crawling_view.utils.utils import make_soup, get_current_timestamp, convert_view_count
+from crawling_view.utils.rate_limiter import get_rate_limiter
+from crawling_view.utils.concurrency import classify_exception
+from crawling_view.utils.network_profile import get_page_metrics
+from crawling_view.utils.waits import wait_for, text_present_in_any
+from crawling_view.utils.tab_multiplexer import TabMultiplexer, PENDING
 
 logger = logging.getLogger(__name__)
 
@@ -18,45 +22,109 @@ class YouTubeCrawler:
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, CommonSettings.DEFAULT_WAIT_TIME)
+        self.last_error = None  # 마지막 실패 종류 (동시성 자동 조절용)
     
-    def crawl_multiple(self, url_artist_song_id_list):
+    def crawl_multiple(self, url_artist_song_id_list, tabs=1):
         """
         여러 YouTube URL을 크롤링
         
         Args:
             url_artist_song_id_list (list): [('url', 'artist_name', 'song_id'), ...] 형태의 리스트
+            tabs (int): 동시에 로딩할 탭 수 (1이면 한 URL씩 순서대로)
             
         Returns:
             dict: 크롤링 결과 딕셔너리 {song_id: data}
         """
         results = {}
+        
+        if tabs > 1:
+            crawled = self.crawl_videos_in_tabs(url_artist_song_id_list, tabs)
+            for (url, artist_name, song_id), result in zip(url_artist_song_id_list, crawled):
+                if result:
+                    results[song_id] = result
+            return results
 
         # 각 URL 크롤링
         for url, artist_name, song_id in url_artist_song_id_list:
-            try:
-                result = self._crawl_single_video(url, artist_name, song_id)
-                if result:
-                    results[song_id] = result
-                    logger.info(f"✅ 크롤링 성공 - 아티스트: {artist_name}, 제목: {result['song_name']}, "
-                              f"조회수: {result['views']}, 업로드일: {result['upload_date']}")
-                else:
-                    logger.error(f"❌ 크롤링 실패: {artist_name} - {url}")
-                    
-            except Exception as e:
-                logger.error(f"❌ {artist_name} 크롤링 실패: {e}", exc_info=True)
-                results[song_id] = {
-                    'song_id': song_id,
-                    'song_name': None,
-                    'artist_name': artist_name,
-                    'views': None,
-                    'listeners': -1,  # YouTube는 청취자 수 제공 안함
-                    'youtube_url': url,
-                    'upload_date': None,
-                    'extracted_date': get_current_timestamp(),
-                }
+            result = self.crawl_video(url, artist_name, song_id)
+            if result:
+                results[song_id] = result
 
         return results
     
+    def crawl_videos_in_tabs(self, url_artist_song_id_list, tabs):
+        """
+        드라이버 하나의 여러 탭에서 YouTube URL을 병렬 로딩해 크롤링
+        
+        Args:
+            url_artist_song_id_list (list): [('url', 'artist_name', 'song_id'), ...] 형태의 리스트
+            tabs (int): 동시에 로딩할 탭 수
+            
+        Returns:
+            list: 입력과 같은 순서의 크롤링 결과 (실패 시 None)
+        """
+        self.last_error = None
+        with TabMultiplexer(self.driver, tabs) as multiplexer:
+            return multiplexer.run(url_artist_song_id_list, self._start_video_tab, self._step_video_tab)
+    
+    def _start_video_tab(self, url_artist_song_id):
+        # 페이지 로드 (플랫폼 공유 속도 제한)
+        get_rate_limiter('youtube').acquire()
+        return url_artist_song_id[0]
+    
+    def _step_video_tab(self, driver, url_artist_song_id, final):
+        """탭 하나의 로딩 상태 확인 후, 조회수가 렌더링됐으면(또는 시간 초과면) 파싱"""
+        url, artist_name, song_id = url_artist_song_id
+        if not final and not text_present_in_any(YouTubeSelectors.VIEW_COUNT_SELECTORS)(driver):
+            return PENDING
+        
+        get_page_metrics('youtube').record(driver)
+        soup = make_soup(driver.page_source)
+        if not soup or not self._extract_title(soup):
+            logger.error(f"❌ 크롤링 실패: {artist_name} - {url}")
+            return None
+        
+        result = self._parse_video_page(soup, url, artist_name, song_id)
+        logger.info(f"✅ 크롤링 성공 - 아티스트: {artist_name}, 제목: {result['song_name']}, "
+                  f"조회수: {result['views']}, 업로드일: {result['upload_date']}")
+        return result
+    
+    def crawl_video(self, url, artist_name, song_id):
+        """
+        단일 YouTube URL 크롤링 (결과 로그 및 예외 처리 포함)
+        
+        Args:
+            url (str): YouTube URL
+            artist_name (str): 아티스트명
+            song_id (str): SongInfo의 pk값
+            
+        Returns:
+            dict: 크롤링 결과 또는 None
+        """
+        self.last_error = None
+        try:
+            result = self._crawl_single_video(url, artist_name, song_id)
+            if result:
+                logger.info(f"✅ 크롤링 성공 - 아티스트: {artist_name}, 제목: {result['song_name']}, "
+                          f"조회수: {result['views']}, 업로드일: {result['upload_date']}")
+            else:
+                logger.error(f"❌ 크롤링 실패: {artist_name} - {url}")
+            return result
+                
+        except Exception as e:
+            logger.error(f"❌ {artist_name} 크롤링 실패: {e}", exc_info=True)
+            self.last_error = classify_exception(e)
+            return {
+                'song_id': song_id,
+                'song_name': None,
+                'artist_name': artist_name,
+                'views': None,
+                'listeners': -1,  # YouTube는 청취자 수 제공 안함
+                'youtube_url': url,
+                'upload_date': None,
+                'extracted_date': get_current_timestamp(),
+            }
+    
     def _crawl_single_video(self, url, artist_name, song_id):
         """
         단일 YouTube 동영상 크롤링
@@ -70,14 +138,17 @@ class YouTubeCrawler:
             dict: 크롤링 결과 또는 None
         """
         try:
-            # 페이지 로드
+            # 페이지 로드 (플랫폼 공유 속도 제한)
+            get_rate_limiter('youtube').acquire()
             self.driver.get(url)
 
             # 동적 로딩을 위한 대기
             if not self._wait_for_title_load():
                 raise Exception("제목 selector를 찾지 못함")
             
-            time.sleep(2)  # 추가 대기 시간
+            # 조회수 텍스트가 채워질 때까지 대기 (제목보다 늦게 렌더링됨)
+            wait_for(self.driver, text_present_in_any(YouTubeSelectors.VIEW_COUNT_SELECTORS), description=f"조회수 렌더링 ({url})")
+            get_page_metrics('youtube').record(self.driver)
 
             # HTML 파싱
             html = self.driver.page_source
@@ -85,34 +156,49 @@ class YouTubeCrawler:
             if not soup:
                 return None
 
-            # 동영상 제목 추출
-            song_name = self._extract_title(soup)
-            if not song_name:
-                song_name = "제목 없음"
-                logger.warning("동영상 제목을 찾지 못했습니다.")
-            
-            # 조회수 추출
-            view_count = self._extract_view_count(soup)
-
-            # 업로드 날짜 추출
-            upload_date = self._extract_upload_date(soup)
-
-            # 결과 반환 
-            return {
-                'song_id': song_id,  # SongInfo의 pk
-                'song_name': song_name,
-                'artist_name': artist_name,
-                'views': view_count,
-                'listeners': -1,  # YouTube는 청취자 수 제공 안함
-                'youtube_url': url,
-                'upload_date': upload_date,
-                'extracted_date': get_current_timestamp()
-            }
+            return self._parse_video_page(soup, url, artist_name, song_id)
 
         except Exception as e:
             logger.error(f"❌ 단일 비디오 크롤링 실패: {e}", exc_info=True)
             return None
     
+    def _parse_video_page(self, soup, url, artist_name, song_id):
+        """
+        YouTube 동영상 페이지 파싱
+        
+        Args:
+            soup (BeautifulSoup): 파싱된 HTML
+            url (str): YouTube URL
+            artist_name (str): 아티스트명
+            song_id (str): SongInfo의 pk값
+            
+        Returns:
+            dict: 크롤링 결과
+        """
+        # 동영상 제목 추출
+        song_name = self._extract_title(soup)
+        if not song_name:
+            song_name = "제목 없음"
+            logger.warning("동영상 제목을 찾지 못했습니다.")
+        
+        # 조회수 추출
+        view_count = self._extract_view_count(soup)
+
+        # 업로드 날짜 추출
+        upload_date = self._extract_upload_date(soup)
+
+        # 결과 반환 
+        return {
+            'song_id': song_id,  # SongInfo의 pk
+            'song_name': song_name,
+            'artist_name': artist_name,
+            'views': view_count,
+            'listeners': -1,  # YouTube는 청취자 수 제공 안함
+            'youtube_url': url,
+            'upload_date': upload_date,
+            'extracted_date': get_current_timestamp()
+        }
+    
     def _wait_for_title_load(self):
         """
         제목 로딩 대기
@@ -2,14 +2,62 @@
 YouTube 크롤링 메인 실행 파일
 """
 import logging
-from crawling_view.utils.driver import setup_driver
+from contextlib import contextmanager
+from crawling_view.utils.driver_pool import pooled_driver
+from crawling_view.utils.worker_pool import CrawlWorkerPool
+from crawling_view.utils.constants import ParallelSettings, YouTubeSettings
+from crawling_view.utils.network_profile import get_page_metrics
 from crawling_view.data.csv_writer import save_youtube_csv
 from crawling_view.data.db_writer import save_youtube_to_db
 from .youtube_logic import YouTubeCrawler
+from .youtube_http import YouTubeHttpCrawler
+from .youtube_async import fetch_youtube_batch
 
 logger = logging.getLogger(__name__)
 
-def run_youtube_crawling(url_artist_song_id_list, save_csv=True, save_db=True):
+@contextmanager
+def _youtube_session(worker_index):
+    """
+    워커별 YouTube 크롤러 세션 (드라이버 풀에서 빌린 독립 Chrome 드라이버)
+    
+    YOUTUBE_HTTP_ENABLED 이면 HTTP 크롤러를 사용하고, HTTP로 처리하지 못한 동영상이 생길 때만 드라이버를 빌린다.
+    """
+    if YouTubeSettings.HTTP_ENABLED:
+        with YouTubeHttpCrawler(lambda: pooled_driver('youtube')) as crawler:
+            yield crawler
+        return
+    
+    with pooled_driver('youtube') as driver:
+        yield YouTubeCrawler(driver)
+
+def _crawl_youtube_video(crawler, url_artist_song_id):
+    """
+    워커 풀에서 호출되는 단일 URL 크롤링
+    
+    Args:
+        crawler (YouTubeCrawler | YouTubeHttpCrawler): 워커 전용 크롤러
+        url_artist_song_id (tuple): ('url', 'artist_name', 'song_id')
+    
+    Returns:
+        dict: 크롤링 결과 또는 None
+    """
+    url, artist_name, song_id = url_artist_song_id
+    return crawler.crawl_video(url, artist_name, song_id)
+
+def _crawl_youtube_batch(crawler, url_artist_song_id_list):
+    """
+    워커 풀에서 호출되는 여러 URL 동시 크롤링 (드라이버 하나의 여러 탭)
+    
+    Args:
+        crawler (YouTubeCrawler | YouTubeHttpCrawler): 워커 전용 크롤러
+        url_artist_song_id_list (list): [('url', 'artist_name', 'song_id'), ...]
+    
+    Returns:
+        list: 입력과 같은 순서의 크롤링 결과
+    """
+    return crawler.crawl_videos_in_tabs(url_artist_song_id_list, len(url_artist_song_id_list))
+
+def run_youtube_crawling(url_artist_song_id_list, save_csv=True, save_db=True, workers=None, on_result=None, on_failure=None):
     """
     YouTube 크롤링 실행
     
@@ -17,35 +65,51 @@ def run_youtube_crawling(url_artist_song_id_list, save_csv=True, save_db=True):
         url_artist_song_id_list (list): 크롤링할 URL, 아티스트, song_id 리스트 [('url1', 'artist1', 'song_id1'), ('url2', 'artist2', 'song_id2'), ...]
         save_csv (bool): CSV 저장 여부
         save_db (bool): DB 저장 여부
+        workers (int, optional): 독립 Chrome 워커 수. None이면 ParallelSettings 사용
+        on_result (callable, optional): 곡 하나가 성공할 때마다 결과를 전달받는 콜백 (스트리밍 저장용)
+        on_failure (callable, optional): 재시도 후에도 실패한 곡마다 on_failure(song_info, reason) 호출
     
     Returns:
-        dict: 크롤링된 데이터 딕셔너리
+        dict: 크롤링된 데이터 딕셔너리 (입력 순서 유지)
     """
     logger.info(f"🖤 YouTube 크롤링 시작 - 총 {len(url_artist_song_id_list)}개 URL")
     
+    if workers is None:
+        workers = ParallelSettings.PLATFORM_WORKERS.get('youtube', 1)
+    
     try:
-        # Chrome 드라이버 설정 및 실행
-        with setup_driver() as driver:
-            crawler = YouTubeCrawler(driver)
-            
-            # 크롤링 실행
-            results = crawler.crawl_multiple(url_artist_song_id_list)
-            
-            logger.info(f"🖤 YouTube 크롤링 완료 - 성공: {len(results)}개")
-            
-            # CSV 저장
-            if save_csv and results:
-                csv_paths = save_youtube_csv(results)
-                if csv_paths:
-                    logger.info(f"📄 CSV 저장 완료: {len(csv_paths)}개 파일")
-            
-            # DB 저장
-            if save_db and results:
-                saved_count = save_youtube_to_db(results)
-                logger.info(f"💾 DB 저장 완료: {saved_count}개 레코드")
-            
-            return results
-            
+        if YouTubeSettings.HTTP_ENABLED and YouTubeSettings.ASYNC_ENABLED:
+            # 워커 스레드 대신 asyncio로 동영상 페이지를 동시에 요청 (HTTP로 처리하지 못한 URL만 Selenium으로 대체)
+            # 실패 URL은 RetrySettings대로 백오프 재시도하지만, 서킷 브레이커와 워커 수 자동 조절은 적용되지 않는다
+            results = fetch_youtube_batch(url_artist_song_id_list, on_result=on_result, on_failure=on_failure)
+        else:
+            # 워커별 Chrome 드라이버로 크롤링 실행
+            # YOUTUBE_TABS > 1 이면 워커마다 여러 탭에서 동영상 페이지를 동시에 로딩
+            tabs = ParallelSettings.TABS_PER_DRIVER.get('youtube', 1)
+            pool = CrawlWorkerPool('youtube', _youtube_session, _crawl_youtube_video, workers, on_result=on_result,
+                                   on_failure=on_failure, batch_fn=_crawl_youtube_batch if tabs > 1 else None,
+                                   batch_size=tabs)
+            results = {}
+            for (url, artist_name, song_id), result in zip(url_artist_song_id_list, pool.run(url_artist_song_id_list)):
+                if result:
+                    results[song_id] = result
+        
+        logger.info(f"🖤 YouTube 크롤링 완료 - 성공: {len(results)}개")
+        get_page_metrics('youtube').log_summary()
+        
+        # CSV 저장
+        if save_csv and results:
+            csv_paths = save_youtube_csv(results)
+            if csv_paths:
+                logger.info(f"📄 CSV 저장 완료: {len(csv_paths)}개 파일")
+        
+        # DB 저장
+        if save_db and results:
+            saved_count = save_youtube_to_db(results)
+            logger.info(f"💾 DB 저장 완료: {saved_count}개 레코드")
+        
+        return results
+    
     except Exception as e:
         logger.error(f"❌ YouTube 크롤링 실행 중 오류 발생: {e}", exc_info=True)
         return {}
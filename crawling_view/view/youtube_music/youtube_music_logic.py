@@ -2,7 +2,6 @@
 YouTube Music 크롤링 및 파싱 로직
 """
 import time
-import random
 import logging
 import re
 import pickle
@@ -14,6 +13,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from crawling_view.utils.constants import YouTubeMusicSelectors, CommonSettings
 from crawling_view.utils.utils import normalize_text, make_soup, get_current_timestamp, convert_view_count
+from crawling_view.utils.rate_limiter import get_rate_limiter
+from crawling_view.utils.network_profile import apply_network_profile, get_page_metrics
+from crawling_view.utils.waits import wait_for, any_element_present, wait_for_replacement
+from crawling_view.utils.pacing import pace
 
 # .env 파일 로드
 load_dotenv()
@@ -21,8 +24,9 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 class YouTubeMusicCrawler:
-    def __init__(self, driver):
+    def __init__(self, driver, persistent_profile=False):
         self.driver = driver
+        self.persistent_profile = persistent_profile  # 영구 프로필 사용 시 이전 로그인 세션 재사용
         self.wait = WebDriverWait(driver, CommonSettings.DEFAULT_WAIT_TIME)
         self.youtube_music_id = os.getenv('YOUTUBE_MUSIC_ID', '')
         self.youtube_music_password = os.getenv('YOUTUBE_MUSIC_PASSWORD', '')
@@ -81,7 +85,7 @@ class YouTubeMusicCrawler:
         try:
             # 먼저 YouTube Music 페이지로 이동
             self.driver.get("https://music.youtube.com/")
-            time.sleep(2)
+            self._wait_for_header()
             
             # 쿠키 적용
             for cookie in cookies:
@@ -96,6 +100,28 @@ class YouTubeMusicCrawler:
             logger.error(f"쿠키 적용 실패: {e}")
             return False
     
+    def _probe_login_state(self):
+        """
+        빠른 로그인 상태 확인 (영구 프로필용)
+        
+        Google 인증 쿠키가 없으면 페이지 렌더링을 기다리지 않고 바로 False를 반환한다.
+        
+        Returns:
+            bool: 로그인된 세션이면 True
+        """
+        try:
+            self.driver.get("https://music.youtube.com/")
+            cookie_names = {cookie.get('name') for cookie in self.driver.get_cookies()}
+            if not cookie_names & {'SAPISID', '__Secure-3PAPISID', 'SID'}:
+                logger.info("📝 영구 프로필에 로그인 세션이 없습니다.")
+                return False
+            
+            self._wait_for_header()
+            return self._check_login_status()
+        except Exception as e:
+            logger.warning(f"로그인 상태 빠른 확인 실패: {e}")
+            return False
+    
     def _check_login_status(self):
         """로그인 상태 확인"""
         try:
@@ -116,6 +142,7 @@ class YouTubeMusicCrawler:
         YouTube Music 로그인 (쿠키 우선 사용)
         
         로그인 순서:
+        0. 영구 프로필이면 프로필에 남은 세션으로 로그인 상태 확인 (성공 시 바로 반환)
         1. 저장된 쿠키가 있으면 쿠키로 로그인 시도
         2. 쿠키가 없거나 만료되었으면 일반 로그인 시도
         3. 로그인 성공 시 새로운 쿠키 저장
@@ -124,6 +151,12 @@ class YouTubeMusicCrawler:
             bool: 로그인 성공 여부
         """
         try:
+            # 0단계: 영구 프로필 세션 확인
+            if self.persistent_profile and self._probe_login_state():
+                self.is_logged_in = True
+                logger.info("✅ 영구 프로필 세션으로 로그인 확인 (로그인 생략)")
+                return True
+            
             # 1단계: 저장된 쿠키로 로그인 시도
             cookies = self._load_cookies()
             if cookies:
@@ -162,7 +195,7 @@ class YouTubeMusicCrawler:
         """
         try:
             self.driver.get("https://music.youtube.com/")
-            time.sleep(2)
+            self._wait_for_header()
             
             # 로그인 버튼이 보이면(=로그인 안 된 상태)만 로그인 로직 실행
             need_login = False
@@ -175,36 +208,38 @@ class YouTubeMusicCrawler:
                 need_login = False
 
             if need_login:
+                # 로그인 화면(보안 확인 이미지 등)은 차단 없이 로드
+                apply_network_profile(self.driver, None)
+                
                 # 로그인 프로세스 실행
                 login_btn.click()
-                time.sleep(2)
 
                 # 이메일 입력
                 email_input = self.wait.until(EC.presence_of_element_located((By.ID, "identifierId")))
-                time.sleep(random.uniform(CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX))
+                pace('login')
                 email_input.send_keys(self.youtube_music_id)
-                time.sleep(random.uniform(CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX))
+                pace('login')
 
                 # '다음' 버튼 클릭
                 next_button = self.wait.until(EC.element_to_be_clickable((By.ID, "identifierNext")))
-                time.sleep(random.uniform(CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX))
+                pace('login')
                 next_button.click()
-                time.sleep(random.uniform(CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX))
+                pace('login')
 
                 # 비밀번호 입력
                 password_input = self.wait.until(EC.presence_of_element_located((By.NAME, "Passwd")))
-                time.sleep(random.uniform(CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX))
+                pace('login')
                 password_input.send_keys(self.youtube_music_password)
-                time.sleep(random.uniform(CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX))
+                pace('login')
 
                 # 로그인 버튼 클릭
                 login_button = self.wait.until(EC.element_to_be_clickable((By.ID, "passwordNext")))
-                time.sleep(random.uniform(CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX))
+                pace('login')
                 login_button.click()
-                time.sleep(random.uniform(CommonSettings.RANDOM_DELAY_MIN, CommonSettings.RANDOM_DELAY_MAX))
+                pace('login')
 
                 # 본인 인증 화면 감지 및 대기
-                time.sleep(2)
+                pace('login')
                 page_source = self.driver.page_source
                 if any(keyword in page_source for keyword in ["보안", "코드", "인증", "확인", "전화", "기기", "추가 확인"]):
                     logger.warning("⚠️ 본인 인증(추가 인증) 화면이 감지되었습니다. 자동화가 중단될 수 있습니다.")
@@ -212,14 +247,15 @@ class YouTubeMusicCrawler:
 
                 # 로그인 완료 대기
                 self.wait.until_not(EC.presence_of_element_located((By.CSS_SELECTOR, 'a[aria-label="로그인"]')))
-                time.sleep(2)
+                pace('login')
                 
                 # 로그인 성공 시 쿠키 저장
                 self._save_cookies()
+                apply_network_profile(self.driver, 'youtube_music')
                 
             # 유튜브 뮤직 페이지로 이동
             self.driver.get("https://music.youtube.com/")
-            time.sleep(2)
+            self._wait_for_header()
             
             # 최종 로그인 상태 확인
             if self._check_login_status():
@@ -234,7 +270,7 @@ class YouTubeMusicCrawler:
             logger.error(f"❌ 수동 로그인 실패: {e}", exc_info=True)
             return False
     
-    def crawl_song(self, song_title, artist_name, song_id=None):
+    def crawl_song(self, song_title, artist_name, song_id=None, video_id=None):
         """
         단일 곡 크롤링
         
@@ -242,6 +278,7 @@ class YouTubeMusicCrawler:
             song_title (str): 곡 제목
             artist_name (str): 아티스트명
             song_id (str, optional): SongInfo의 pk값
+            video_id (str, optional): 저장된 YouTube Music videoId (검색 결과에서 이름 매칭 없이 곡 선택)
             
         Returns:
             dict: 크롤링 결과 또는 None
@@ -257,7 +294,7 @@ class YouTubeMusicCrawler:
                 return None
             
             # 파싱 실행
-            result = self._parse_song_info(html, song_title, artist_name, song_id)
+            result = self._parse_song_info(html, song_title, artist_name, song_id, video_id)
             return result
             
         except Exception as e:
@@ -285,25 +322,26 @@ class YouTubeMusicCrawler:
             
             for attempt in range(max_attempts):
                 try:
+                    # 플랫폼 공유 속도 제한 (워커 수와 관계없이 초당 검색 수 유지, 재시도도 검색 1회로 계산)
+                    get_rate_limiter('youtube_music').acquire()
+                    
                     # 검색 버튼 찾기 및 클릭
                     search_button = self._find_search_button()
                     if not search_button:
                         raise Exception("검색 버튼을 찾을 수 없습니다.")
                     
                     search_button.click()
-                    time.sleep(2)
                     
-                    # 검색어 입력
+                    # 검색어 입력 (입력창이 보일 때까지 대기)
                     search_input = self._find_search_input()
                     if not search_input:
                         raise Exception("검색 입력창을 찾을 수 없습니다.")
                     
                     search_input.clear()
-                    time.sleep(0.5)
+                    pace('typing')
                     search_input.send_keys(query)
-                    time.sleep(1)
+                    pace('typing')
                     search_input.send_keys(Keys.RETURN)
-                    time.sleep(2)
                     
                     # "노래" 탭 클릭
                     song_tab = self.wait.until(
@@ -312,10 +350,16 @@ class YouTubeMusicCrawler:
                             YouTubeMusicSelectors.SONG_TAB
                         ))
                     )
+                    # "노래" 탭 클릭 후 기존 결과가 교체되고 곡 목록이 렌더링될 때까지 대기
+                    previous_items = self.driver.find_elements(By.CSS_SELECTOR, YouTubeMusicSelectors.SONG_ITEMS)
                     song_tab.click()
-                    time.sleep(1)
+                    if not wait_for_replacement(self.driver, previous_items[0] if previous_items else None,
+                                                [YouTubeMusicSelectors.SONG_ITEMS], description=f"노래 탭 결과 ({query})"):
+                        raise Exception("노래 탭 검색 결과가 렌더링되지 않았습니다.")
+                    pace('search')
                     
                     # HTML 반환
+                    get_page_metrics('youtube_music').record(self.driver)
                     html = self.driver.page_source
                     logger.info(f"✅ 검색 성공: {artist_name} - {song_title}")
                     return html
@@ -325,7 +369,7 @@ class YouTubeMusicCrawler:
                     if attempt < max_attempts - 1:
                         # 유튜브 뮤직 메인 페이지로 돌아가기
                         self.driver.get("https://music.youtube.com/")
-                        time.sleep(2)
+                        self._wait_for_header()
                     else:
                         logger.error(f"❌ 모든 검색 시도 실패: {artist_name} - {song_title}")
                         
@@ -335,6 +379,14 @@ class YouTubeMusicCrawler:
             logger.error(f"❌ 곡 검색 실패: {e}", exc_info=True)
             return None
     
+    def _wait_for_header(self):
+        """상단 헤더(검색 버튼/로그인 버튼)가 렌더링될 때까지 대기"""
+        return wait_for(
+            self.driver,
+            any_element_present(YouTubeMusicSelectors.SEARCH_BUTTON + ['a[aria-label="로그인"]']),
+            description="YouTube Music 헤더 렌더링"
+        )
+    
     def _find_search_button(self):
         """검색 버튼 찾기"""
         for selector in YouTubeMusicSelectors.SEARCH_BUTTON:
@@ -359,15 +411,19 @@ class YouTubeMusicCrawler:
                 continue
         return None
     
-    def _parse_song_info(self, html, target_song, target_artist, song_id=None):
+    def _parse_song_info(self, html, target_song, target_artist, song_id=None, video_id=None):
         """
         검색 결과 HTML 파싱
         
+        저장된 videoId와 같은 곡이 있으면 이름 매칭 없이 그 곡을 사용하고,
+        이름 매칭으로 새로 확인한 곡은 videoId를 결과에 포함해 SongInfo에 저장한다.
+        
         Args:
             html (str): 검색 결과 HTML
             target_song (str): 검색한 곡명
             target_artist (str): 검색한 아티스트명
             song_id (str, optional): SongInfo의 pk값
+            video_id (str, optional): 저장된 YouTube Music videoId
             
         Returns:
             dict: 파싱된 곡 정보 또는 None
@@ -381,6 +437,9 @@ class YouTubeMusicCrawler:
             
             song_items = soup.select(YouTubeMusicSelectors.SONG_ITEMS)
             logger.info(f"🔍 YouTube Music 검색 결과: {len(song_items)}개 곡 발견")
+            if video_id:
+                # 저장된 videoId의 곡을 먼저 검사
+                song_items.sort(key=lambda item: self._extract_video_id(item) != video_id)
             
             for i, item in enumerate(song_items):
                 logger.info(f"🔍 검사 중인 곡 {i+1}/{len(song_items)}")
@@ -399,6 +458,8 @@ class YouTubeMusicCrawler:
 
                     # 조회수 추출
                     view_count = self._extract_view_count(item)
+                    item_video_id = self._extract_video_id(item)
+                    id_match = bool(video_id) and item_video_id == video_id
 
                     # 디버그 로깅
                     normalized_song = normalize_text(song_title)
@@ -415,7 +476,7 @@ class YouTubeMusicCrawler:
                     
                     logger.debug(f"일치 검사: 제목 일치={title_match}, 아티스트 일치={artist_match}")
                     
-                    if title_match and artist_match:
+                    if id_match or (title_match and artist_match):
                         result = {
                             'song_title': song_title,
                             'artist_name': artist_name,
@@ -424,7 +485,10 @@ class YouTubeMusicCrawler:
                             'crawl_date': get_current_timestamp(),
                             'song_id': song_id
                         }
-                        logger.info(f"[성공] 일치하는 곡 발견: {song_title} - {artist_name} ({view_count})")
+                        if item_video_id and not id_match:
+                            result['youtube_music_video_id'] = item_video_id
+                        match_type = '저장된 videoId' if id_match else '이름 일치'
+                        logger.info(f"[성공] 일치하는 곡 발견 ({match_type}): {song_title} - {artist_name} ({view_count})")
                         return result
                     else:
                         if not title_match:
@@ -453,6 +517,12 @@ class YouTubeMusicCrawler:
             return song_title
         return None
     
+    def _extract_video_id(self, item):
+        """곡 링크(watch?v=...)에서 videoId 추출"""
+        song_link = item.select_one(YouTubeMusicSelectors.SONG_TITLE)
+        match = re.search(r'[?&]v=([\w-]+)', song_link.get('href', '') if song_link else '')
+        return match.group(1) if match else None
+    
     def _extract_artist_name(self, item):
         """아티스트명 추출"""
         artist_column = item.select_one(YouTubeMusicSelectors.ARTIST_COLUMN)
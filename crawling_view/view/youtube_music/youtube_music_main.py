@@ -2,14 +2,74 @@
 YouTube Music 크롤링 메인 실행 파일
 """
 import logging
+import threading
+from contextlib import contextmanager, ExitStack
 from crawling_view.utils.driver import setup_driver
+from crawling_view.utils.worker_pool import CrawlWorkerPool
+from crawling_view.utils.constants import ParallelSettings, ChromeProfileSettings
+from crawling_view.utils.chrome_profile import acquire_profile
+from crawling_view.utils.network_profile import get_page_metrics
 from crawling_view.data.csv_writer import save_youtube_music_csv
 from crawling_view.data.db_writer import save_youtube_music_to_db
 from .youtube_music_logic import YouTubeMusicCrawler
 
 logger = logging.getLogger(__name__)
 
-def run_youtube_music_crawling(song_list, save_csv=True, save_db=True):
+# 워커들이 동시에 로그인하지 않도록 직렬화
+# (첫 워커가 로그인 후 저장한 cookies.pkl을 나머지 워커가 그대로 재사용)
+_login_lock = threading.Lock()
+
+@contextmanager
+def _youtube_music_session(worker_index):
+    """
+    워커별 YouTube Music 크롤러 세션 (독립 Chrome 드라이버 + 공유 로그인 쿠키)
+    
+    YOUTUBE_MUSIC_PERSISTENT_PROFILE=true 이면 워커 슬롯별 영구 프로필을 잠그고 사용하므로
+    이전 실행의 로그인 세션이 남아 있으면 로그인 과정을 건너뛴다.
+    """
+    with ExitStack() as stack:
+        user_data_dir = None
+        if ChromeProfileSettings.YOUTUBE_MUSIC_PERSISTENT:
+            user_data_dir = stack.enter_context(acquire_profile('youtube_music', worker_index))
+        driver = stack.enter_context(setup_driver(platform='youtube_music', user_data_dir=user_data_dir))
+        crawler = YouTubeMusicCrawler(driver, persistent_profile=bool(user_data_dir))
+        
+        # 로그인 수행
+        with _login_lock:
+            logged_in = crawler.login()
+        if not logged_in:
+            raise Exception(f"YouTube Music 로그인 실패 (워커 {worker_index})")
+        
+        yield crawler
+
+def _crawl_youtube_music_song(crawler, song_info):
+    """
+    워커 풀에서 호출되는 단일 곡 크롤링
+    
+    Args:
+        crawler (YouTubeMusicCrawler): 로그인된 워커 전용 크롤러
+        song_info (dict): {'song_title': '곡명', 'artist_name': '가수명', 'song_id': 'id', 'video_id': '저장된 videoId'}
+        
+    Returns:
+        dict: 크롤링 결과 또는 None
+    """
+    song_title = song_info.get('song_title', '')
+    artist_name = song_info.get('artist_name', '')
+    song_id = song_info.get('song_id')
+    
+    logger.info(f"🔍 검색 중: {song_title} - {artist_name} (ID: {song_id})")
+    
+    # 크롤링 실행 (song_id 전달)
+    result = crawler.crawl_song(song_title, artist_name, song_id, song_info.get('video_id'))
+    
+    if result:
+        logger.info(f"✅ 크롤링 완료: {result['song_title']} - {result['artist_name']} (조회수: {result['views']})")
+    else:
+        logger.warning(f"❌ 크롤링 실패: {song_title} - {artist_name}")
+    
+    return result
+
+def run_youtube_music_crawling(song_list, save_csv=True, save_db=True, workers=None, on_result=None, on_failure=None):
     """
     YouTube Music 크롤링 실행
     
@@ -17,42 +77,26 @@ def run_youtube_music_crawling(song_list, save_csv=True, save_db=True):
         song_list (list): 크롤링할 곡 리스트 [{'song_title': '곡명', 'artist_name': '가수명', 'song_id': 'id'}, ...]
         save_csv (bool): CSV 저장 여부
         save_db (bool): DB 저장 여부
+        workers (int, optional): 독립 Chrome 워커 수. None이면 ParallelSettings 사용
+        on_result (callable, optional): 곡 하나가 성공할 때마다 결과를 전달받는 콜백 (스트리밍 저장용)
+        on_failure (callable, optional): 재시도 후에도 실패한 곡마다 on_failure(song_info, reason) 호출
     
     Returns:
-        list: 크롤링된 데이터 리스트
+        list: 크롤링된 데이터 리스트 (입력 순서 유지)
     """
     logger.info(f"🎵 YouTube Music 크롤링 시작 - 총 {len(song_list)}곡")
     
-    crawled_data = []
+    if workers is None:
+        workers = ParallelSettings.PLATFORM_WORKERS.get('youtube_music', 1)
     
     try:
-        # Chrome 드라이버 설정 및 실행
-        with setup_driver() as driver:
-            crawler = YouTubeMusicCrawler(driver)
-            
-            # 로그인 수행
-            if not crawler.login():
-                logger.error("❌ YouTube Music 로그인 실패")
-                return []
-            
-            # 각 곡에 대해 크롤링 실행
-            for song_info in song_list:
-                song_title = song_info.get('song_title', '')
-                artist_name = song_info.get('artist_name', '')
-                song_id = song_info.get('song_id')
-                
-                logger.info(f"🔍 검색 중: {song_title} - {artist_name} (ID: {song_id})")
-                
-                # 크롤링 실행 (song_id 전달)
-                result = crawler.crawl_song(song_title, artist_name, song_id)
-                
-                if result:
-                    crawled_data.append(result)
-                    logger.info(f"✅ 크롤링 완료: {result['song_title']} - {result['artist_name']} (조회수: {result['views']})")
-                else:
-                    logger.warning(f"❌ 크롤링 실패: {song_title} - {artist_name}")
+        # 워커별 Chrome 드라이버로 크롤링 실행
+        pool = CrawlWorkerPool('youtube_music', _youtube_music_session, _crawl_youtube_music_song, workers, on_result=on_result,
+                               on_failure=on_failure)
+        crawled_data = [result for result in pool.run(song_list) if result]
         
         logger.info(f"🎵 YouTube Music 크롤링 완료 - 성공: {len(crawled_data)}곡")
+        get_page_metrics('youtube_music').log_summary()
         
         # CSV 저장
         if save_csv and crawled_data: